@@ -0,0 +1,64 @@
+"""Measures attribute access on a Delayed instance against a plain dataclass.
+
+After the first access imports a delayed field, the imported item is stored in
+the instance's '__dict__', so later accesses should cost the same as reading a
+field of an ordinary dataclass. The first access (which includes the import
+of an already loaded module) is reported separately.
+
+Usage:
+    python benchmarks/delayed.py [--number 1000000] [--repeat 7]
+
+"""
+
+from __future__ import annotations
+import argparse
+import dataclasses
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parents[1].joinpath('src')))
+
+from nagata import lazy
+
+
+@dataclasses.dataclass
+class Plain(object):
+    opener: object = None
+
+
+@dataclasses.dataclass
+class Lazy(lazy.Delayed):
+    opener: str = lazy.delayed('gzip.open')
+
+
+def first_access(number: int) -> float:
+    """Returns the mean time in ns of the first access to a delayed field."""
+    instances = [Lazy() for _ in range(number)]
+    accesses = iter(instances)
+    seconds = timeit.timeit(lambda: next(accesses).opener, number = number)
+    return seconds / number * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--number', type = int, default = 1000000)
+    parser.add_argument('--repeat', type = int, default = 7)
+    arguments = parser.parse_args()
+    plain = Plain(opener = lazy.from_import_path(path = 'gzip.open'))
+    delayed = Lazy()
+    assert delayed.opener is plain.opener
+    for label, instance in (('plain', plain), ('delayed', delayed)):
+        times = timeit.repeat(
+            'instance.opener',
+            globals = {'instance': instance},
+            number = arguments.number,
+            repeat = arguments.repeat)
+        print(f'{label:<13}{min(times) / arguments.number * 1e9:6.1f} ns')
+    print(f'{"first access":<13}{first_access(number = 10000):6.1f} ns')
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+"""Measures load and save performance of every registered FileFormat.
+
+For each format, a synthetic dataset is generated from a fixed seed, saved and
+loaded 'repeat' times in a fresh worker process, and the latency percentiles,
+throughput, and peak resident memory of that process are reported. Formats
+whose optional dependencies are missing (or which cannot load or save) are
+listed as skipped. The overhead of FileManager dispatch is measured separately
+by comparing FileManager.load and TransferPlan.load with calling the format's
+'load' directly on a tiny file.
+
+Nothing is downloaded, so the benchmark runs offline. Results for the same
+arguments on the same machine are comparable across versions of nagata.
+
+Usage:
+    python benchmarks/formats.py [--rows 100000] [--columns 8] [--repeat 5]
+        [--formats csv parquet ...] [--output results.json]
+
+"""
+
+from __future__ import annotations
+import argparse
+import concurrent.futures
+import json
+import multiprocessing
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+SOURCE = pathlib.Path(__file__).resolve().parents[1].joinpath('src')
+if str(SOURCE) not in sys.path:
+    sys.path.insert(0, str(SOURCE))
+
+import nagata  # noqa: E402
+
+SEED = 20231018
+
+
+def make_frame(rows: int, columns: int) -> Any:
+    """Returns a dataframe with a repeatable mix of column types."""
+    import numpy
+    import pandas
+    generator = numpy.random.default_rng(SEED)
+    words = numpy.array(['alpha', 'bravo', 'charlie', 'delta', 'echo'])
+    data = {}
+    for index in range(columns):
+        kind = index % 4
+        if kind == 0:
+            data[f'int_{index}'] = generator.integers(0, 1_000_000, rows)
+        elif kind == 1:
+            data[f'float_{index}'] = generator.random(rows)
+        elif kind == 2:
+            data[f'word_{index}'] = words[generator.integers(0, 5, rows)]
+        else:
+            data[f'text_{index}'] = [f'row-{i}' for i in range(rows)]
+    return pandas.DataFrame(data)
+
+
+def make_item(name: str, rows: int, columns: int) -> Any:
+    """Returns a synthetic item suited to the format stored at 'name'."""
+    if name == 'text':
+        return make_frame(rows, columns).to_csv(index = False)
+    elif name == 'numpy':
+        import numpy
+        generator = numpy.random.default_rng(SEED)
+        return generator.random((rows, columns))
+    else:
+        return make_frame(rows, columns)
+
+
+def percentile(values: list[float], share: float) -> float:
+    """Returns the 'share' percentile of 'values' by linear interpolation."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * share
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (
+        position - lower)
+
+
+def summarize(times: list[float], size: int) -> dict[str, float]:
+    """Returns latency percentiles (ms) and throughput (MB/s)."""
+    median = statistics.median(times)
+    return {
+        'p50_ms': round(percentile(times, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(times, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(times, 0.99) * 1000, 3),
+        'mb_per_s': round(size / median / 1e6, 2) if median else 0.0}
+
+
+def run_format(
+    name: str,
+    rows: int,
+    columns: int,
+    repeat: int) -> dict[str, Any]:
+    """Benchmarks one format. Runs in a fresh process."""
+    import resource
+    nagata.FileFramework.settings['test_size'] = None
+    file_format = nagata.FileFramework.get_format(name)
+    result: dict[str, Any] = {'format': name}
+    try:
+        item = make_item(name, rows, columns)
+    except ImportError as error:
+        return {**result, 'skipped': str(error)}
+    with tempfile.TemporaryDirectory() as folder:
+        manager = nagata.FileManager(root_folder = pathlib.Path(folder))
+        saves, loads = [], []
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                manager.save(item, file_name = 'data', file_format = name)
+                saves.append(time.perf_counter() - start)
+            path = next(pathlib.Path(folder).glob('data.*'))
+            size = path.stat().st_size
+            for _ in range(repeat):
+                start = time.perf_counter()
+                manager.load(file_path = path, file_format = file_format)
+                loads.append(time.perf_counter() - start)
+        except Exception as error:  # noqa: BLE001
+            result['skipped'] = f'{type(error).__name__}: {error}'
+            if not saves:
+                return result
+            size = 0
+        result['bytes'] = size
+        result['save'] = summarize(saves, size)
+        if loads:
+            result['load'] = summarize(loads, size)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result['peak_rss_mb'] = round(
+        peak / (1e6 if sys.platform == 'darwin' else 1e3), 1)
+    return result
+
+
+def run_dispatch(calls: int) -> dict[str, Any]:
+    """Measures the per-call cost of FileManager.load over a direct load."""
+    with tempfile.TemporaryDirectory() as folder:
+        manager = nagata.FileManager(root_folder = pathlib.Path(folder))
+        manager.save('x', file_name = 'tiny.txt')
+        file_format = nagata.FileFramework.get_format('text')
+        path = manager.output_folder.joinpath('tiny.txt')
+        start = time.perf_counter()
+        for _ in range(calls):
+            file_format.load(path = path)
+        direct = (time.perf_counter() - start) / calls
+        start = time.perf_counter()
+        for _ in range(calls):
+            manager.load(file_name = 'tiny.txt')
+        managed = (time.perf_counter() - start) / calls
+        plan = manager.plan(file_name = 'tiny.txt')
+        start = time.perf_counter()
+        for _ in range(calls):
+            plan.load()
+        planned = (time.perf_counter() - start) / calls
+    return {
+        'calls': calls,
+        'direct_us': round(direct * 1e6, 2),
+        'manager_us': round(managed * 1e6, 2),
+        'plan_us': round(planned * 1e6, 2),
+        'overhead_us': round((managed - direct) * 1e6, 2)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--rows', type = int, default = 100_000)
+    parser.add_argument('--columns', type = int, default = 8)
+    parser.add_argument('--repeat', type = int, default = 5)
+    parser.add_argument('--calls', type = int, default = 10_000)
+    parser.add_argument('--formats', nargs = '*', default = None)
+    parser.add_argument('--output', type = pathlib.Path, default = None)
+    arguments = parser.parse_args()
+    names = arguments.formats or list(nagata.FileFramework.manifest)
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for name in names:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers = 1,
+            mp_context = context) as executor:
+            result = executor.submit(
+                run_format,
+                name,
+                arguments.rows,
+                arguments.columns,
+                arguments.repeat).result()
+        results.append(result)
+        print(format_result(result))
+    dispatch = run_dispatch(calls = arguments.calls)
+    print(
+        f'dispatch: {dispatch["manager_us"]} us per FileManager.load, '
+        f'{dispatch["overhead_us"]} us over a direct load, '
+        f'{dispatch["plan_us"]} us per TransferPlan.load')
+    if arguments.output:
+        arguments.output.write_text(json.dumps(
+            {
+                'arguments': {
+                    'rows': arguments.rows,
+                    'columns': arguments.columns,
+                    'repeat': arguments.repeat,
+                    'seed': SEED},
+                'python': sys.version,
+                'formats': results,
+                'dispatch': dispatch},
+            indent = 2))
+    return
+
+
+def format_result(result: dict[str, Any]) -> str:
+    """Returns a one-line summary of 'result'."""
+    line = f'{result["format"]:<8}'
+    for kind in ('save', 'load'):
+        if kind in result:
+            stats = result[kind]
+            line += (
+                f' {kind} p50 {stats["p50_ms"]:>9.2f} ms'
+                f' p99 {stats["p99_ms"]:>9.2f} ms'
+                f' {stats["mb_per_s"]:>8.2f} MB/s')
+    if 'peak_rss_mb' in result:
+        line += f' rss {result["peak_rss_mb"]:.0f} MB'
+    if 'skipped' in result:
+        line += f' skipped ({result["skipped"][:60]})'
+    return line
+
+
+if __name__ == '__main__':
+    main()
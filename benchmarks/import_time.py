@@ -0,0 +1,69 @@
+"""Measures how long 'import nagata' takes in a fresh interpreter.
+
+Each run starts a new Python process with '-X importtime' and records the
+cumulative time reported for the top-level 'nagata' import, so interpreter
+startup is excluded. The median and fastest runs are printed along with the
+third-party modules that were imported.
+
+Usage:
+    python benchmarks/import_time.py [--runs 20] [--src path/to/src]
+
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+
+SOURCE = pathlib.Path(__file__).resolve().parents[1].joinpath('src')
+WATCHED = (
+    'asyncio', 
+    'camina', 
+    'concurrent.futures', 
+    'miller', 
+    'nagata.formats', 
+    'numpy', 
+    'pandas')
+
+
+def measure(source: pathlib.Path) -> tuple[float, list[str]]:
+    """Returns import time in ms and the watched modules that were imported."""
+    environment = dict(os.environ, PYTHONPATH = str(source))
+    code = (
+        'import sys, nagata; '
+        f'print(",".join(m for m in {WATCHED!r} if m in sys.modules))')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output = True,
+        check = True,
+        cwd = source,
+        env = environment,
+        text = True)
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split('|')
+        if name.strip() == 'nagata':
+            return int(cumulative) / 1000, result.stdout.strip().split(',')
+    raise RuntimeError('nagata was not imported')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--runs', type = int, default = 20)
+    parser.add_argument('--src', type = pathlib.Path, default = SOURCE)
+    arguments = parser.parse_args()
+    times = []
+    for _ in range(arguments.runs):
+        elapsed, modules = measure(source = arguments.src)
+        times.append(elapsed)
+    print(f'runs:    {arguments.runs}')
+    print(f'median:  {statistics.median(times):.1f} ms')
+    print(f'fastest: {min(times):.1f} ms')
+    print(f'modules: {", ".join(m for m in modules if m) or "none"}')
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+
 __version__ = '0.1.7'
 
 __author__: str = 'Corey Rayburn Yung'
@@ -9,32 +11,57 @@ __author__: str = 'Corey Rayburn Yung'
 __all__: list[str] = []
 
 
-from .core import FileFormat, FileFramework, FileManager
-from .formats import (
-    FileFormatCSV,
-    FileFormatExcel,
-    FileFormatFeather,
-    FileFormatHDF,
-    FileFormatJSON,
-    FileFormatLatex,
-    FileFormatPNG,
-    FileFormatPandas,
-    FileFormatParquet,
-    FileFormatPickle,
-    FileFormatSQL,
-    FileFormatSTATA,
-    FileFormatSeaborn,
-    FileFormatText,
-)
 from .lazy import (
     Delayed,
+    DelayedLoad,
     Importer,
     absolute_import,
     absolute_subpackage_import,
+    delayed,
     from_file_path,
     from_import_path,
     from_importables,
     from_path,
+    install,
+    preload,
     relative_import,
     relative_subpackage_import,
+    snapshot,
 )
+
+""" Lazy Imports """
+
+# Everything else, including the core classes and the file formats (and the
+# libraries they use), is only imported when it is first accessed. Setting the
+# 'NAGATA_WARM_IMPORTS' environment variable imports it all in a background
+# thread after startup instead.
+_importer = install(
+    module_globals = globals(),
+    importables = {
+        'FileFormat': '.core.FileFormat',
+        'FileFramework': '.core.FileFramework',
+        'FileManager': '.core.FileManager',
+        'TransferPlan': '.core.TransferPlan',
+        'AsyncFileManager': '.asynchronous.AsyncFileManager',
+        'FileIndex': '.caching.FileIndex',
+        'Hooks': '.instrumentation.Hooks',
+        'LoadCache': '.caching.LoadCache',
+        'SidecarCache': '.caching.SidecarCache',
+        'SpanExporter': '.instrumentation.SpanExporter',
+        'StatsCollector': '.instrumentation.StatsCollector',
+        'FileFormatCSV': '.formats.FileFormatCSV',
+        'FileFormatExcel': '.formats.FileFormatExcel',
+        'FileFormatFeather': '.formats.FileFormatFeather',
+        'FileFormatHDF': '.formats.FileFormatHDF',
+        'FileFormatJSON': '.formats.FileFormatJSON',
+        'FileFormatLatex': '.formats.FileFormatLatex',
+        'FileFormatNumpy': '.formats.FileFormatNumpy',
+        'FileFormatPNG': '.formats.FileFormatPNG',
+        'FileFormatPandas': '.formats.FileFormatPandas',
+        'FileFormatParquet': '.formats.FileFormatParquet',
+        'FileFormatPickle': '.formats.FileFormatPickle',
+        'FileFormatSQL': '.formats.FileFormatSQL',
+        'FileFormatSTATA': '.formats.FileFormatSTATA',
+        'FileFormatSeaborn': '.formats.FileFormatSeaborn',
+        'FileFormatText': '.formats.FileFormatText'},
+    warm = bool(os.environ.get('NAGATA_WARM_IMPORTS')))
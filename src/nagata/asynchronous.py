@@ -0,0 +1,434 @@
+"""
+asynchronous: file management for asyncio applications.
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2022, Corey Rayburn Yung
+License: Apache-2.0
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+Contents:
+    AsyncFileManager (core.FileManager): file manager with awaitable loading
+        and saving methods that do not block the event loop.
+
+ToDo:
+
+
+"""
+from __future__ import annotations
+import asyncio
+from collections.abc import Hashable, MutableMapping, Sequence
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
+import io
+import pathlib
+from typing import Any, Optional
+
+from . import compression
+from . import core
+
+
+@dataclasses.dataclass
+class AsyncFileManager(core.FileManager):
+    """File and folder management for asyncio applications.
+
+    Paths, file formats, and parameters are resolved exactly as they are by
+    FileManager. For file formats that accept buffers, the raw bytes of a file
+    are read in the event loop's default executor and then parsed in a bounded
+    executor owned by the manager. Other file formats are loaded entirely in
+    the bounded executor. Like FileManager, loads wait for pending 
+    write-behind saves of the same file and use 'cache' and 'sidecar'.
+    
+    'load', 'load_many', 'load_glob', and 'save' are awaitable. The other 
+    methods inherited from FileManager (e.g., 'plan', 'stream', and 
+    'save_many') are not, so they block the event loop while they run.
+
+    Args:
+        root_folder (pathlib.Path | str): the complete path from which the
+            other paths and folders used by FileManager are ordinarily derived
+            (unless you decide to use full paths for all other options).
+            Defaults to None. If not passed, the parent folder of the current
+            working workery is used.
+        input_folder (pathlib.Path | str]): the input_folder subfolder
+            name or a complete path if the 'input_folder' is not off of
+            'root_folder'. Defaults to 'input'.
+        output_folder (pathlib.Path | str]): the output_folder subfolder
+            name or a complete path if the 'output_folder' is not off of
+            'root_folder'. Defaults to 'output'.
+        framework (Type[FileFramework]): class with default settings, dict of
+            supported file formats, and any other information needed for file
+            management. Defaults to FileFramework.
+        max_open_files (int): maximum number of files that may be open at the
+            same time. Defaults to 64.
+        executor (Optional[concurrent.futures.Executor]): executor used for
+            parsing and serialization. If None, a thread pool sized from the
+            'threads' setting in 'framework.settings' is created when first
+            needed and shut down by 'close'. An executor that is passed is 
+            left running. Defaults to None.
+
+    """
+    max_open_files: int = 64
+    executor: Optional[concurrent.futures.Executor] = None
+
+    """ Initialization Methods """
+
+    def __post_init__(self) -> None:
+        """Initializes and validates an instance."""
+        super().__post_init__()
+        self._limiter = asyncio.Semaphore(self.max_open_files)
+        self._owns_executor = False
+        return
+
+    """ Dunder Methods """
+
+    async def __aenter__(self) -> AsyncFileManager:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
+        return
+
+    """ Public Methods """
+
+    async def load(
+        self,
+        file_path: Optional[pathlib.Path | str] = None,
+        folder: pathlib.Path | str = None,
+        file_name: Optional[str] = None,
+        file_format: Optional[str | core.FileFormat] = None,
+        **kwargs: Any) -> Any:
+        """Imports file without blocking the event loop.
+
+        Arguments are the same as those for FileManager.load.
+
+        Args:
+            file_path (Union[str, Path]]): a complete file path. Defaults to
+                None.
+            folder (Union[str, Path]]): a complete folder path or the name of a
+                folder. Defaults to None.
+            file_name (str): file name without extension. Defaults to None.
+            file_format (Union[str, FileFormat]]): object with information about
+                how the file should be loaded or the key to such an object.
+                Defaults to None.
+            **kwargs: can be passed if additional options are desired specific
+                to the methods attached to a FileFormat instance.
+
+        Returns:
+            Any: depending upon method used for appropriate file format, a new
+                variable of a supported type is returned.
+
+        """
+        file_path, file_format, parameters = self._resolve(
+            file_path = file_path,
+            folder = folder,
+            file_name = file_name,
+            transfer_type = 'load',
+            file_format = file_format,
+            **kwargs)
+        with self._observe(
+            phase = 'transfer',
+            transfer_type = 'load',
+            file_path = file_path,
+            file_format = file_format) as event:
+            item = await self._load_async(
+                file_path = file_path,
+                file_format = file_format,
+                parameters = parameters)
+            if event is not None:
+                event.size = self._get_size(path = file_path)
+        return item
+
+    async def load_many(
+        self,
+        file_paths: Sequence[pathlib.Path | str],
+        folder: Optional[pathlib.Path | str] = None,
+        file_format: Optional[str | core.FileFormat] = None,
+        **kwargs: Any) -> list[Any]:
+        """Imports several files concurrently.
+
+        The number of files open at once is limited by 'max_open_files'.
+
+        Args:
+            file_paths (Sequence[pathlib.Path | str]): complete file paths or,
+                if 'folder' is passed, file names within 'folder'.
+            folder (Optional[pathlib.Path | str]): a complete folder path or the
+                name of a folder. Defaults to None.
+            file_format (Optional[str | FileFormat]): object with information
+                about how the files should be loaded or the key to such an
+                object. If None, the format of each file is derived from its
+                extension. Defaults to None.
+            **kwargs: can be passed if additional options are desired specific
+                to the methods attached to a FileFormat instance.
+
+        Returns:
+            list[Any]: loaded items in the order of 'file_paths'.
+
+        """
+        transfers = [
+            self._prepare_many(
+                path = path,
+                folder = folder,
+                transfer_type = 'load',
+                file_format = file_format,
+                **kwargs)
+            for path in file_paths]
+        return await asyncio.gather(*(
+            self._load_async(
+                file_path = file_path,
+                file_format = file_format,
+                parameters = parameters)
+            for file_path, file_format, parameters in transfers))
+
+    async def load_glob(
+        self,
+        pattern: str,
+        file_format: Optional[str | core.FileFormat] = None,
+        **kwargs: Any) -> dict[pathlib.Path, Any]:
+        """Imports every indexed file that matches 'pattern' concurrently.
+        
+        Files are found with 'glob' and loaded with 'load_many'. Files without 
+        a registered extension are skipped unless 'file_format' is passed.
+
+        Args:
+            pattern (str): glob pattern relative to the indexed folder.
+            file_format (Optional[str | FileFormat]): if passed, only files of
+                this format are loaded. Defaults to None.
+            **kwargs: can be passed if additional options are desired specific
+                to the methods attached to a FileFormat instance.
+
+        Returns:
+            dict[pathlib.Path, Any]: loaded items keyed by path, sorted by 
+                path.
+            
+        """
+        paths = self.glob(pattern = pattern, file_format = file_format)
+        if file_format is None:
+            paths = [p for p in paths if self._match_format(name = p.name)]
+        results = await self.load_many(
+            file_paths = paths,
+            file_format = file_format,
+            **kwargs)
+        return dict(zip(paths, results))
+
+    async def save(
+        self,
+        item: Any,
+        file_path: Optional[pathlib.Path | str] = None,
+        folder: Optional[pathlib.Path | str] = None,
+        file_name: Optional[str] = None,
+        file_format: Optional[str | core.FileFormat] = None,
+        **kwargs: Any) -> None:
+        """Exports file without blocking the event loop.
+
+        Arguments are the same as those for FileManager.save.
+
+        Args:
+            item (Any): object to be save to disk.
+            file_path (Union[str, Path]]): a complete file path. Defaults to
+                None.
+            folder (Union[str, Path]]): a complete folder path or the name of a
+                folder. Defaults to None.
+            file_name (str): file name without extension. Defaults to None.
+            file_format (Union[str, FileFormat]]): object with information about
+                how the file should be loaded or the key to such an object.
+                Defaults to None.
+            **kwargs: can be passed if additional options are desired specific
+                to the methods attached to a FileFormat instance.
+
+        """
+        file_path, file_format, parameters = self._resolve(
+            file_path = file_path,
+            folder = folder,
+            file_name = file_name,
+            transfer_type = 'save',
+            file_format = file_format,
+            **kwargs)
+        saver = functools.partial(
+            self._save,
+            file_path = file_path,
+            file_format = file_format,
+            parameters = parameters,
+            item = item)
+        async with self._limiter:
+            await self._run(saver)
+        return
+
+    def close(self) -> None:
+        """Shuts down the executors created by the manager, if any."""
+        if self.executor is not None and self._owns_executor:
+            self.executor.shutdown(wait = True)
+            self.executor = None
+            self._owns_executor = False
+        super().close()
+        return
+
+    """ Private Methods """
+
+    async def _load_async(
+        self,
+        file_path: pathlib.Path,
+        file_format: core.FileFormat,
+        parameters: MutableMapping[Hashable, Any]) -> Any:
+        """Loads a file without blocking the event loop.
+        
+        Like FileManager._load, it first waits for a pending write-behind save
+        of 'file_path' and then uses 'cache' if it exists.
+
+        Args:
+            file_path (pathlib.Path): path of the file to load.
+            file_format (core.FileFormat): format of the file at 'file_path'.
+            parameters (MutableMapping[Hashable, Any]): parameters to pass to 
+                the 'load' method of 'file_format'.
+
+        Returns:
+            Any: loaded item.
+
+        """
+        if self._pending:
+            with self._lock:
+                pending = self._pending.get(file_path)
+            if pending is not None:
+                with contextlib.suppress(Exception):
+                    await asyncio.wrap_future(pending)
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(
+                path = file_path, 
+                file_format = file_format, 
+                parameters = parameters)
+        if key is not None:
+            found, item = self.cache.fetch(key = key)
+            if found:
+                return item
+        item = await self._read_async(
+            file_path = file_path, 
+            file_format = file_format, 
+            parameters = parameters)
+        if key is not None:
+            self.cache.store(key = key, item = item)
+        return item
+
+    async def _read_async(
+        self,
+        file_path: pathlib.Path,
+        file_format: core.FileFormat,
+        parameters: MutableMapping[Hashable, Any]) -> Any:
+        """Loads a file, using 'sidecar' if it exists and the format allows.
+
+        Args:
+            file_path (pathlib.Path): path of the file to load.
+            file_format (core.FileFormat): format of the file at 'file_path'.
+            parameters (MutableMapping[Hashable, Any]): parameters to pass to 
+                the 'load' method of 'file_format'.
+
+        Returns:
+            Any: loaded item.
+
+        """
+        key = None
+        if self.sidecar is not None and file_format.sidecar:
+            key = self.sidecar.key(path = file_path, parameters = parameters)
+        if key is not None:
+            found, item = await self._run(
+                functools.partial(self.sidecar.fetch, key = key))
+            if found:
+                return item
+        item = await self._parse_async(
+            file_path = file_path, 
+            file_format = file_format, 
+            parameters = parameters)
+        if key is not None:
+            await self._run(
+                functools.partial(self.sidecar.store, key = key, item = item))
+        return item
+
+    async def _parse_async(
+        self,
+        file_path: pathlib.Path,
+        file_format: core.FileFormat,
+        parameters: MutableMapping[Hashable, Any]) -> Any:
+        """Reads and parses a file without blocking the event loop.
+
+        Args:
+            file_path (pathlib.Path): path of the file to load.
+            file_format (core.FileFormat): format of the file at 'file_path'.
+            parameters (MutableMapping[Hashable, Any]): parameters to pass to 
+                the 'load' method of 'file_format'.
+
+        Returns:
+            Any: loaded item.
+
+        """
+        async with self._limiter:
+            codec = self._get_codec(
+                file_path = file_path, 
+                transfer_type = 'load')
+            if codec is not None:
+                loader = functools.partial(
+                    compression.load,
+                    file_format = file_format,
+                    path = file_path,
+                    codec = codec,
+                    folder = self.interim_folder,
+                    observe = self._get_observer(
+                        transfer_type = 'load',
+                        file_path = file_path,
+                        file_format = file_format),
+                    **parameters)
+                return await self._run(loader)
+            elif file_format.buffers:
+                loop = asyncio.get_running_loop()
+                with self._observe(
+                    phase = 'read',
+                    transfer_type = 'load',
+                    file_path = file_path,
+                    file_format = file_format) as event:
+                    data = await loop.run_in_executor(
+                        None,
+                        pathlib.Path(file_path).read_bytes)
+                    if event is not None:
+                        event.size = len(data)
+            else:
+                loader = functools.partial(
+                    file_format.load,
+                    path = file_path,
+                    **parameters)
+                return await self._run(loader)
+        loader = functools.partial(
+            file_format.load,
+            path = io.BytesIO(data),
+            **parameters)
+        with self._observe(
+            phase = 'parse',
+            transfer_type = 'load',
+            file_path = file_path,
+            file_format = file_format):
+            return await self._run(loader)
+
+    async def _run(self, method: functools.partial) -> Any:
+        """Runs 'method' in 'executor'.
+
+        Args:
+            method (functools.partial): callable with all of its arguments.
+
+        Returns:
+            Any: result of 'method'.
+
+        """
+        if self.executor is None:
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers = self._get_workers(count = self.max_open_files))
+            self._owns_executor = True
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, method)
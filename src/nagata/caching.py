@@ -0,0 +1,620 @@
+"""
+caching: in-memory cache for loaded files.
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2022, Corey Rayburn Yung
+License: Apache-2.0
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+Contents:
+    LoadCache (object): least recently used cache of loaded items which is
+        bounded by the number of entries and their approximate size.
+    SidecarCache (object): on-disk cache which stores parsed dataframes as
+        feather files so that slow formats only need to be parsed once.
+    IndexEntry (object): size, modification time, and file format of a file
+        in a FileIndex.
+    FileIndex (object): index of the files in a folder tree which is refreshed
+        incrementally by rescanning only the folders that have changed.
+
+ToDo:
+
+
+"""
+from __future__ import annotations
+import collections
+from collections.abc import Callable, Hashable, Iterator, Mapping
+import dataclasses
+import functools
+import importlib.util
+import os
+import pathlib
+import re
+import sys
+import threading
+import time
+from typing import Any, Optional
+
+
+@dataclasses.dataclass
+class LoadCache(object):
+    """Least recently used cache of loaded items.
+
+    Items are keyed by the resolved path, modification time, and size of the
+    loaded file along with the name of its file format and the parameters
+    passed to its loader. A file that changes on disk therefore produces a new
+    key and is never served stale. Cached items are returned as is, so callers
+    should copy an item before changing it.
+
+    Args:
+        max_entries (int): maximum number of items to store. Defaults to 128.
+        max_bytes (Optional[int]): maximum approximate size, in bytes, of all
+            stored items. If None, size is not limited. Defaults to None.
+        hits (int): number of lookups that found a stored item. Defaults to 0.
+        misses (int): number of lookups that did not find a stored item.
+            Defaults to 0.
+        evictions (int): number of items removed to stay within 'max_entries'
+            and 'max_bytes'. Defaults to 0.
+
+    """
+    max_entries: int = 128
+    max_bytes: Optional[int] = None
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    """ Initialization Methods """
+
+    def __post_init__(self) -> None:
+        """Initializes storage for cached items."""
+        self._entries: collections.OrderedDict[Hashable, tuple[Any, int]] = (
+            collections.OrderedDict())
+        self._paths: dict[str, set[Hashable]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        return
+
+    """ Properties """
+
+    @property
+    def size(self) -> int:
+        """Returns approximate size, in bytes, of all stored items."""
+        return self._size
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Returns counters describing the use of the cache."""
+        return {
+            'entries': len(self._entries),
+            'bytes': self._size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions}
+
+    """ Public Methods """
+
+    def key(
+        self,
+        path: pathlib.Path | str,
+        file_format: object,
+        parameters: Mapping[str, Any]) -> Optional[Hashable]:
+        """Returns the key for loading 'path' with 'parameters'.
+
+        Args:
+            path (pathlib.Path | str): path of the file to load.
+            file_format (object): FileFormat instance used to load 'path'.
+            parameters (Mapping[str, Any]): parameters passed to the loader.
+
+        Returns:
+            Optional[Hashable]: key for the loaded item or None if 'path' does
+                not exist.
+
+        """
+        try:
+            path = pathlib.Path(path).resolve()
+            status = path.stat()
+        except OSError:
+            return None
+        frozen = tuple(sorted((k, repr(v)) for k, v in parameters.items()))
+        return (
+            str(path),
+            status.st_mtime_ns,
+            status.st_size,
+            file_format.__class__.__name__,
+            frozen)
+
+    def fetch(self, key: Hashable) -> tuple[bool, Any]:
+        """Returns whether 'key' is stored and, if so, its item.
+
+        Args:
+            key (Hashable): key returned by 'key'.
+
+        Returns:
+            tuple[bool, Any]: whether 'key' was found and the stored item (or
+                None if it was not found).
+
+        """
+        with self._lock:
+            try:
+                item, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, item
+
+    def store(self, key: Hashable, item: Any) -> None:
+        """Stores 'item' at 'key' and evicts items to stay within limits.
+
+        Items that are larger than 'max_bytes' on their own are not stored.
+
+        Args:
+            key (Hashable): key returned by 'key'.
+            item (Any): loaded item to store.
+
+        """
+        size = _estimate_size(item = item)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key = key)
+            self._entries[key] = (item, size)
+            self._paths.setdefault(key[0], set()).add(key)
+            self._size += size
+            while (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None and self._size > self.max_bytes)):
+                oldest = next(iter(self._entries))
+                self._remove(key = oldest)
+                self.evictions += 1
+        return
+
+    def invalidate(self, path: pathlib.Path | str) -> None:
+        """Removes every stored item that was loaded from 'path'.
+
+        Args:
+            path (pathlib.Path | str): path of a file that has changed.
+
+        """
+        path = str(pathlib.Path(path).resolve())
+        with self._lock:
+            for key in list(self._paths.get(path, ())):
+                self._remove(key = key)
+        return
+
+    def clear(self) -> None:
+        """Removes all stored items without resetting the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+            self._size = 0
+        return
+
+    """ Private Methods """
+
+    def _remove(self, key: Hashable) -> None:
+        """Removes 'key' from storage. The caller must hold the lock.
+
+        Args:
+            key (Hashable): stored key to remove.
+
+        """
+        _, size = self._entries.pop(key)
+        self._size -= size
+        keys = self._paths.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._paths[key[0]]
+        return
+
+
+@dataclasses.dataclass
+class SidecarCache(object):
+    """On-disk cache of parsed dataframes.
+    
+    The first time a file is loaded, the parsed dataframe is written to a 
+    feather file (a 'sidecar') in 'folder'. Later loads of the same file with
+    the same parameters read the sidecar instead of parsing the original. The
+    name of each sidecar combines digests of the source path, the source 
+    fingerprint, and the load parameters, so loads of one source with 
+    different parameters each have a sidecar. When the source changes, the 
+    fingerprint changes, the old sidecars are no longer matched, and they are
+    removed the next time the source is stored.
+
+    Args:
+        folder (Optional[pathlib.Path | str]): folder where sidecars are 
+            stored. If None, FileManager sets it to its 'interim_folder'. 
+            Defaults to None.
+        hash_contents (bool): whether to fingerprint sources by hashing their 
+            contents (True) or by their size and modification time (False).
+            Hashing detects changes that preserve size and modification time
+            but requires reading the whole source. Defaults to False.
+        
+    """
+    folder: Optional[pathlib.Path | str] = None
+    hash_contents: bool = False
+
+    """ Initialization Methods """
+
+    def __post_init__(self) -> None:
+        """Checks that pyarrow, which writes the sidecars, is installed."""
+        if importlib.util.find_spec('pyarrow') is None:
+            raise ImportError('SidecarCache requires pyarrow to be installed')
+        return
+    
+    """ Public Methods """
+
+    def key(
+        self,
+        path: pathlib.Path | str,
+        parameters: Mapping[str, Any]) -> Optional[tuple[str, str, str]]:
+        """Returns the key for loading 'path' with 'parameters'.
+
+        Args:
+            path (pathlib.Path | str): path of the source file.
+            parameters (Mapping[str, Any]): parameters passed to the loader.
+
+        Returns:
+            Optional[tuple[str, str, str]]: digests of the source path, its 
+                fingerprint, and 'parameters' or None if 'path' does not 
+                exist.
+            
+        """
+        try:
+            path = pathlib.Path(path).resolve()
+            status = path.stat()
+        except OSError:
+            return None
+        import hashlib
+        source = hashlib.blake2b(str(path).encode(), digest_size = 8)
+        fingerprint = hashlib.blake2b(digest_size = 16)
+        if self.hash_contents:
+            with open(path, 'rb') as a_file:
+                for block in iter(lambda: a_file.read(1 << 20), b''):
+                    fingerprint.update(block)
+        else:
+            fingerprint.update(
+                f'{status.st_size}:{status.st_mtime_ns}'.encode())
+        frozen = sorted((k, repr(v)) for k, v in parameters.items())
+        options = hashlib.blake2b(repr(frozen).encode(), digest_size = 8)
+        return source.hexdigest(), fingerprint.hexdigest(), options.hexdigest()
+    
+    def fetch(self, key: tuple[str, str, str]) -> tuple[bool, Any]:
+        """Returns whether a sidecar exists for 'key' and, if so, its contents.
+
+        Args:
+            key (tuple[str, str, str]): key returned by 'key'.
+
+        Returns:
+            tuple[bool, Any]: whether a sidecar was found and the dataframe it
+                contains (or None if it was not found).
+            
+        """
+        path = self._get_path(key = key)
+        if not path.exists():
+            return False, None
+        import pyarrow.feather
+        table = pyarrow.feather.read_table(path, memory_map = True)
+        return True, table.to_pandas()
+    
+    def store(self, key: tuple[str, str, str], item: Any) -> None:
+        """Writes 'item' to a sidecar and removes stale sidecars of its source.
+        
+        Items that are not pandas dataframes are ignored, as are dataframes 
+        that pyarrow cannot convert (e.g., with columns that mix ints and 
+        strs). Each sidecar is written to a unique temporary file, so several
+        threads or processes may store the same key at once. Sidecars of the
+        source with an old fingerprint are removed after the new one is 
+        written. Sidecars for other parameters are kept.
+
+        Args:
+            key (tuple[str, str, str]): key returned by 'key'.
+            item (Any): loaded item to store.
+            
+        """
+        import pandas
+        if not isinstance(item, pandas.DataFrame):
+            return
+        import pyarrow
+        import pyarrow.feather
+        import tempfile
+        path = self._get_path(key = key)
+        handle, temporary = tempfile.mkstemp(
+            suffix = '.tmp', 
+            prefix = f'{path.stem}-', 
+            dir = self.folder)
+        os.close(handle)
+        try:
+            table = pyarrow.Table.from_pandas(item)
+            pyarrow.feather.write_feather(table, temporary)
+        except (pyarrow.ArrowException, TypeError, ValueError):
+            os.unlink(temporary)
+            return
+        os.replace(temporary, path)
+        current = f'{key[0]}-{key[1]}-'
+        folder = pathlib.Path(self.folder)
+        for stale in folder.glob(f'{key[0]}-*.feather'):
+            if not stale.name.startswith(current):
+                stale.unlink(missing_ok = True)
+        return
+    
+    """ Private Methods """
+    
+    def _get_path(self, key: tuple[str, str, str]) -> pathlib.Path:
+        """Returns the path of the sidecar for 'key'."""
+        return pathlib.Path(self.folder).joinpath(
+            f'{key[0]}-{key[1]}-{key[2]}.feather')
+
+
+@dataclasses.dataclass(frozen = True)
+class IndexEntry(object):
+    """File stored in a FileIndex.
+
+    Args:
+        path (pathlib.Path): path of the file.
+        size (int): size of the file in bytes.
+        modified (int): modification time of the file in nanoseconds.
+        file_format (Optional[str]): key of the file's format in 
+            'FileFramework.formats' or None if its extension is not registered.
+
+    """
+    path: pathlib.Path
+    size: int
+    modified: int
+    file_format: Optional[str]
+
+
+@dataclasses.dataclass
+class FileIndex(object):
+    """Index of the files in a folder tree.
+    
+    The first refresh scans every folder with 'os.scandir'. Later refreshes 
+    check the modification time of each known folder, which changes when 
+    files are added, removed, or renamed in it, and only rescan folders that
+    have changed. On network filesystems with many entries, this replaces a 
+    full walk with one 'stat' call per folder. Because saves by FileManager
+    replace files by renaming them, they also mark their folder as changed. 
+    Files that are rewritten in place by other programs keep their old size 
+    and modification time until 'refresh' is called with 'full' set to True.
+    Hidden files (whose names start with '.') are not indexed.
+
+    Args:
+        folder (Optional[pathlib.Path | str]): root of the indexed tree. If 
+            None, FileManager sets it to its 'input_folder'. Defaults to None.
+        recursive (bool): whether to index subfolders. Defaults to True.
+        max_age (float): number of seconds after a refresh during which further
+            refreshes are skipped. Defaults to 0.0, which checks for changes 
+            every time.
+
+    """
+    folder: Optional[pathlib.Path | str] = None
+    recursive: bool = True
+    max_age: float = 0.0
+
+    """ Initialization Methods """
+
+    def __post_init__(self) -> None:
+        """Initializes storage for folder listings."""
+        self._listings: dict[
+            str, 
+            tuple[int, dict[str, IndexEntry], list[str]]] = {}
+        self._refreshed: Optional[float] = None
+        self._scans = 0
+        self._lock = threading.Lock()
+        return
+
+    """ Properties """
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Returns counters describing the index."""
+        return {
+            'folders': len(self._listings),
+            'files': sum(len(v[1]) for v in self._listings.values()),
+            'scans': self._scans}
+
+    """ Public Methods """
+
+    def refresh(
+        self, 
+        match: Callable[[str], Optional[str]],
+        full: bool = False) -> None:
+        """Brings the index up to date with the files on disk.
+
+        Args:
+            match (Callable[[str], Optional[str]]): callable which returns the
+                key of the file format for a file name or None if the name has 
+                no registered extension.
+            full (bool): whether to rescan every folder, even those that have 
+                not changed, and ignore 'max_age'. Defaults to False.
+            
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not full 
+                and self._refreshed is not None
+                and now - self._refreshed < self.max_age):
+                return
+            seen = set()
+            pending = [os.fspath(self.folder)]
+            while pending:
+                directory = pending.pop()
+                seen.add(directory)
+                try:
+                    modified = os.stat(directory).st_mtime_ns
+                except OSError:
+                    continue
+                listing = self._listings.get(directory)
+                if full or listing is None or listing[0] != modified:
+                    listing = self._scan(
+                        directory = directory, 
+                        modified = modified, 
+                        match = match)
+                    self._listings[directory] = listing
+                if self.recursive:
+                    pending.extend(listing[2])
+            for stale in set(self._listings) - seen:
+                del self._listings[stale]
+            self._refreshed = now
+        return
+
+    def entries(self) -> Iterator[IndexEntry]:
+        """Yields every indexed file as of the last refresh."""
+        for _, files, _ in list(self._listings.values()):
+            yield from files.values()
+
+    def glob(self, pattern: str) -> list[IndexEntry]:
+        """Returns indexed files whose paths relative to 'folder' match.
+
+        In 'pattern', '*' and '?' do not match '/', '**' matches any number of
+        folders, and '[...]' matches one of the enclosed characters. For 
+        example, '2026-*/**/*.parquet' matches every parquet file anywhere 
+        below folders whose names start with '2026-'. 
+
+        Args:
+            pattern (str): glob pattern using '/' to separate folders.
+
+        Returns:
+            list[IndexEntry]: matching files, sorted by path.
+            
+        """
+        expression = _compile_glob(pattern = pattern)
+        root = pathlib.Path(self.folder)
+        matches = []
+        for entry in self.entries():
+            relative = entry.path.relative_to(root).as_posix()
+            if expression.fullmatch(relative):
+                matches.append(entry)
+        return sorted(matches, key = lambda entry: entry.path)
+
+    """ Private Methods """
+
+    def _scan(
+        self, 
+        directory: str, 
+        modified: int,
+        match: Callable[[str], Optional[str]]) -> (
+            tuple[int, dict[str, IndexEntry], list[str]]):
+        """Lists the files and subfolders of 'directory'.
+
+        Args:
+            directory (str): folder to scan.
+            modified (int): modification time of 'directory' in nanoseconds.
+            match (Callable[[str], Optional[str]]): callable which returns the
+                key of the file format for a file name.
+
+        Returns:
+            tuple[int, dict[str, IndexEntry], list[str]]: 'modified', entries
+                of the files keyed by name, and paths of the subfolders.
+            
+        """
+        self._scans += 1
+        files = {}
+        folders = []
+        try:
+            scanner = os.scandir(directory)
+        except OSError:
+            return modified, files, folders
+        with scanner:
+            for item in scanner:
+                if item.name.startswith('.'):
+                    continue
+                try:
+                    if item.is_dir(follow_symlinks = False):
+                        folders.append(item.path)
+                    elif item.is_file():
+                        status = item.stat()
+                        files[item.name] = IndexEntry(
+                            path = pathlib.Path(item.path),
+                            size = status.st_size,
+                            modified = status.st_mtime_ns,
+                            file_format = match(item.name))
+                except OSError:
+                    continue
+        return modified, files, folders
+     
+
+""" Private Functions """
+
+@functools.lru_cache(maxsize = 128)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Translates a glob 'pattern' to a compiled regular expression.
+
+    Args:
+        pattern (str): glob pattern using '/' to separate folders.
+
+    Returns:
+        re.Pattern: expression that matches whole relative paths.
+        
+    """
+    parts = []
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith('**/', index):
+            parts.append('(?:.*/)?')
+            index += 3
+        elif pattern.startswith('**', index):
+            parts.append('.*')
+            index += 2
+        elif pattern[index] == '*':
+            parts.append('[^/]*')
+            index += 1
+        elif pattern[index] == '?':
+            parts.append('[^/]')
+            index += 1
+        elif pattern[index] == '[' and ']' in pattern[index + 2:]:
+            end = pattern.index(']', index + 2)
+            characters = pattern[index + 1:end]
+            if characters.startswith('!'):
+                characters = '^' + characters[1:]
+            parts.append(f'[{characters}]')
+            index = end + 1
+        else:
+            parts.append(re.escape(pattern[index]))
+            index += 1
+    return re.compile(''.join(parts))
+
+def _estimate_size(item: Any, depth: int = 1) -> int:
+    """Returns the approximate size, in bytes, of 'item'.
+
+    pandas objects report their deep memory usage and numpy arrays report the
+    size of their data. The sizes of the values of mappings and the items of
+    lists, tuples, and sets (e.g., the dataframes loaded from several sheets
+    of an Excel file) are added to the size of the container, down to 'depth'
+    levels. Everything else falls back to 'sys.getsizeof'.
+
+    Args:
+        item (Any): item to measure.
+        depth (int): number of levels of containers to measure the contents
+            of. Defaults to 1.
+
+    Returns:
+        int: approximate size in bytes.
+
+    """
+    if hasattr(item, 'memory_usage'):
+        usage = item.memory_usage(deep = True)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+    elif hasattr(item, 'nbytes'):
+        return int(item.nbytes)
+    elif depth > 0 and isinstance(item, Mapping):
+        return sys.getsizeof(item) + sum(
+            _estimate_size(item = v, depth = depth - 1) for v in item.values())
+    elif depth > 0 and isinstance(item, (list, tuple, set, frozenset)):
+        return sys.getsizeof(item) + sum(
+            _estimate_size(item = i, depth = depth - 1) for i in item)
+    else:
+        return sys.getsizeof(item)
@@ -0,0 +1,349 @@
+"""
+compression: transparent compression for every file format.
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2022, Corey Rayburn Yung
+License: Apache-2.0
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+Contents:
+    Codec (object): compression codec with a signature and a function that
+        opens compressed files as binary streams.
+    CodecZstandard (Codec): zstandard codec which compresses with several
+        threads.
+    GZIP, BZIP2, XZ, LZ4, ZSTANDARD (Codec): supported codecs. The gzip, bz2,
+        and xz codecs are in the standard library. The lz4 and zstandard codecs
+        require the 'lz4' and 'zstandard' packages, respectively.
+    detect: returns the codec whose signature starts a file.
+    compress: stream-compresses a file into another file.
+    decompress: stream-decompresses a file into another file.
+    load: loads a compressed file with a FileFormat.
+    save: saves a compressed file with a FileFormat.
+    stream: loads a compressed file in chunks with a FileFormat.
+
+ToDo:
+
+
+"""
+from __future__ import annotations
+from collections.abc import Callable, Iterable, Iterator
+import contextlib
+import dataclasses
+import os
+import pathlib
+import shutil
+import tempfile
+from typing import IO, TYPE_CHECKING, Any, Optional
+
+from . import lazy
+
+if TYPE_CHECKING:
+    from . import core
+
+BLOCK_SIZE = 1 << 20
+
+
+@dataclasses.dataclass(frozen = True)
+class Codec(object):
+    """Compression codec.
+
+    Args:
+        name (str): name of the codec.
+        signature (bytes): bytes at the start of every compressed file.
+        opener (str): import path of a function with the signature of
+            'gzip.open' which opens compressed files. The module is imported
+            when the codec is first used, so optional codecs cost nothing if
+            they are not used.
+
+    """
+    name: str
+    signature: bytes
+    opener: str
+
+    """ Public Methods """
+
+    def open(
+        self,
+        path: pathlib.Path | str,
+        mode: str,
+        threads: int = -1) -> IO[bytes]:
+        """Opens a compressed file as a binary stream.
+
+        Args:
+            path (pathlib.Path | str): path of the compressed file.
+            mode (str): 'rb' to decompress or 'wb' to compress.
+            threads (int): number of threads to compress with, if the codec
+                supports it. Values less than 1 use every core. Defaults to -1.
+
+        Returns:
+            IO[bytes]: file-like object.
+
+        """
+        opener = lazy.from_import_path(path = self.opener)
+        return opener(path, mode)
+
+
+@dataclasses.dataclass(frozen = True)
+class CodecZstandard(Codec):
+    """zstandard codec which compresses with several threads."""
+
+    """ Public Methods """
+
+    def open(
+        self,
+        path: pathlib.Path | str,
+        mode: str,
+        threads: int = -1) -> IO[bytes]:
+        """Opens a zstandard file as a binary stream.
+
+        Args:
+            path (pathlib.Path | str): path of the compressed file.
+            mode (str): 'rb' to decompress or 'wb' to compress.
+            threads (int): number of threads to compress with. Values less than
+                1 use every core. Defaults to -1.
+
+        Returns:
+            IO[bytes]: file-like object.
+
+        """
+        import zstandard
+        if 'w' in mode:
+            compressor = zstandard.ZstdCompressor(
+                threads = threads if threads > 0 else -1)
+            return zstandard.open(path, mode, cctx = compressor)
+        return zstandard.open(path, mode)
+
+
+GZIP = Codec(name = 'gzip', signature = b'\x1f\x8b', opener = 'gzip.open')
+BZIP2 = Codec(name = 'bz2', signature = b'BZh', opener = 'bz2.open')
+XZ = Codec(name = 'xz', signature = b'\xfd7zXZ\x00', opener = 'lzma.open')
+LZ4 = Codec(
+    name = 'lz4', 
+    signature = b'\x04\x22\x4d\x18', 
+    opener = 'lz4.frame.open')
+ZSTANDARD = CodecZstandard(
+    name = 'zstandard', 
+    signature = b'\x28\xb5\x2f\xfd', 
+    opener = 'zstandard.open')
+
+
+""" Public Functions """
+
+def detect(
+    path: pathlib.Path | str,
+    codecs: Iterable[Codec]) -> Optional[Codec]:
+    """Returns the codec whose signature starts the file at 'path'.
+
+    Args:
+        path (pathlib.Path | str): path of a file.
+        codecs (Iterable[Codec]): codecs to check.
+
+    Returns:
+        Optional[Codec]: matching codec or None if no signature matches.
+
+    """
+    codecs = list(codecs)
+    length = max((len(c.signature) for c in codecs), default = 0)
+    try:
+        with open(path, 'rb') as a_file:
+            start = a_file.read(length)
+    except OSError:
+        return None
+    for codec in codecs:
+        if start.startswith(codec.signature):
+            return codec
+    return None
+
+def compress(
+    source: pathlib.Path | str,
+    destination: pathlib.Path | str,
+    codec: Codec,
+    threads: int = -1) -> None:
+    """Stream-compresses 'source' into 'destination'.
+
+    Args:
+        source (pathlib.Path | str): path of the uncompressed file.
+        destination (pathlib.Path | str): path of the compressed file.
+        codec (Codec): codec to compress with.
+        threads (int): number of threads to compress with, if 'codec' supports
+            it. Defaults to -1.
+
+    """
+    with open(source, 'rb') as reader:
+        with codec.open(destination, 'wb', threads = threads) as writer:
+            shutil.copyfileobj(reader, writer, BLOCK_SIZE)
+    return
+
+def decompress(
+    source: pathlib.Path | str,
+    destination: pathlib.Path | str,
+    codec: Codec) -> None:
+    """Stream-decompresses 'source' into 'destination'.
+
+    Args:
+        source (pathlib.Path | str): path of the compressed file.
+        destination (pathlib.Path | str): path of the uncompressed file.
+        codec (Codec): codec to decompress with.
+
+    """
+    with codec.open(source, 'rb') as reader:
+        with open(destination, 'wb') as writer:
+            shutil.copyfileobj(reader, writer, BLOCK_SIZE)
+    return
+
+def load(
+    file_format: core.FileFormat,
+    path: pathlib.Path | str,
+    codec: Codec,
+    folder: pathlib.Path | str,
+    observe: Optional[
+        Callable[[str], contextlib.AbstractContextManager]] = None,
+    **kwargs: Any) -> Any:
+    """Loads the compressed file at 'path' with 'file_format'.
+
+    If 'file_format' is sequential, the file is decompressed as it is parsed.
+    Otherwise, it is decompressed to a temporary file in 'folder' first, which
+    is deleted once it has been loaded.
+
+    Args:
+        file_format (core.FileFormat): format of the decompressed file.
+        path (pathlib.Path | str): path of the compressed file.
+        codec (Codec): codec the file was compressed with.
+        folder (pathlib.Path | str): folder for temporary files.
+        observe (Optional[Callable[[str], contextlib.AbstractContextManager]]):
+            called with 'read' and 'parse' to get context managers that time
+            decompressing the file and parsing the decompressed file. Sequential
+            formats do both at once, so they are not reported separately. If 
+            None, nothing is timed. Defaults to None.
+        kwargs:additional arguments passed to the 'load' method of 
+            'file_format'.
+
+    Returns:
+        Any: loaded item.
+
+    """
+    if file_format.sequential:
+        with codec.open(path, 'rb') as reader:
+            return file_format.load(path = reader, **kwargs)
+    observe = observe or _unobserved
+    with _stage(path = path, folder = folder) as temporary:
+        with observe('read') as event:
+            decompress(source = path, destination = temporary, codec = codec)
+            if event is not None:
+                event.size = os.path.getsize(temporary)
+        with observe('parse'):
+            return file_format.load(path = temporary, **kwargs)
+
+def save(
+    file_format: core.FileFormat,
+    path: pathlib.Path | str,
+    codec: Codec,
+    folder: pathlib.Path | str,
+    threads: int = -1,
+    **kwargs: Any) -> None:
+    """Saves a compressed file at 'path' with 'file_format'.
+
+    The item is saved to a temporary file in 'folder', which is then 
+    stream-compressed to 'path' and deleted.
+
+    Args:
+        file_format (core.FileFormat): format of the decompressed file.
+        path (pathlib.Path | str): path of the compressed file.
+        codec (Codec): codec to compress with.
+        folder (pathlib.Path | str): folder for temporary files.
+        threads (int): number of threads to compress with, if 'codec' supports
+            it. Defaults to -1.
+        kwargs: the item to save and additional arguments passed to the 'save' 
+            method of 'file_format'.
+
+    """
+    with _stage(path = path, folder = folder) as temporary:
+        file_format.save(path = temporary, **kwargs)
+        compress(
+            source = temporary, 
+            destination = path, 
+            codec = codec, 
+            threads = threads)
+    return
+
+def stream(
+    file_format: core.FileFormat,
+    path: pathlib.Path | str,
+    codec: Codec,
+    folder: pathlib.Path | str,
+    **kwargs: Any) -> Iterator[Any]:
+    """Loads the compressed file at 'path' in chunks with 'file_format'.
+
+    Files are decompressed in the same manner as 'load'. The decompressing 
+    stream or temporary file is closed when the iterator is exhausted or 
+    closed.
+
+    Args:
+        file_format (core.FileFormat): format of the decompressed file.
+        path (pathlib.Path | str): path of the compressed file.
+        codec (Codec): codec the file was compressed with.
+        folder (pathlib.Path | str): folder for temporary files.
+        kwargs: additional arguments passed to the 'stream' method of 
+            'file_format'.
+
+    Yields:
+        Iterator[Any]: chunks of the loaded file.
+
+    """
+    if file_format.sequential:
+        with codec.open(path, 'rb') as reader:
+            yield from file_format.stream(path = reader, **kwargs)
+    else:
+        with _stage(path = path, folder = folder) as temporary:
+            decompress(source = path, destination = temporary, codec = codec)
+            yield from file_format.stream(path = temporary, **kwargs)
+
+
+""" Private Functions """
+
+@contextlib.contextmanager
+def _stage(
+    path: pathlib.Path | str, 
+    folder: pathlib.Path | str) -> Iterator[pathlib.Path]:
+    """Yields a temporary path in 'folder' that is deleted afterwards.
+
+    The temporary file ends with the name of 'path' without its compression
+    suffix, so formats that check the extension of a file still recognize it.
+
+    Args:
+        path (pathlib.Path | str): path of a compressed file.
+        folder (pathlib.Path | str): folder for the temporary file.
+
+    Yields:
+        Iterator[pathlib.Path]: path of the temporary file.
+
+    """
+    name = pathlib.Path(path).with_suffix('').name
+    handle, temporary = tempfile.mkstemp(suffix = f'-{name}', dir = folder)
+    os.close(handle)
+    try:
+        yield pathlib.Path(temporary)
+    finally:
+        pathlib.Path(temporary).unlink(missing_ok = True)
+
+def _unobserved(phase: str) -> contextlib.AbstractContextManager[None]:
+    """Returns a context manager which does nothing for 'phase'.
+
+    Args:
+        phase (str): name of the phase that is not observed.
+
+    Returns:
+        contextlib.AbstractContextManager[None]: context manager yielding None.
+
+    """
+    return contextlib.nullcontext()
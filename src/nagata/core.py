@@ -8,6 +8,8 @@ Contents:
     FileManager (object): interface for nagata file management. It provides a
         one-stop place for loading and saving all files of supported file types 
         in an organizational structure specified by the user.
+    TransferPlan (object): resolved file transfer which can be performed many
+        times without resolving its path, file format, and parameters again.
 
 To Do:
 
@@ -18,16 +20,23 @@ from __future__ import annotations
 import abc
 import contextlib
 import dataclasses
+import functools
+import os
 import pathlib
-from collections.abc import Hashable, Mapping, MutableMapping, Sequence
-from typing import Any, ClassVar, Optional, Type
-
-import miller
-
-import camina
-
+import stat
+import threading
+from collections.abc import (
+    Callable, Hashable, Iterator, Mapping, MutableMapping, Sequence)
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Type
+
+from . import caching
+from . import compression
+from . import instrumentation
 from . import lazy
 
+if TYPE_CHECKING:
+    import concurrent.futures
+
 
 @dataclasses.dataclass
 class FileFormat(abc.ABC):
@@ -61,11 +70,46 @@ class FileFormat(abc.ABC):
             name that the load or save method should use and the value is the 
             key for the argument in the shared parameters. Defaults to an empty 
             dict. 
+        stream_parameters (Mapping[str, str]]): shared parameters for the 
+            'stream' method of formats that can be loaded in chunks. They are 
+            structured like 'parameters'. Defaults to an empty dict.
+        concurrency (str): key in FileFramework.executors for the type of 
+            executor to use when many files of this format are transferred at
+            once. 'thread' suits formats that mostly wait on disk I/O and 
+            'process' suits formats that are bound by parsing in Python. 
+            Defaults to 'thread'.
+        buffers (bool): whether the 'load' method accepts a binary file-like
+            object in place of a path. If True, the raw bytes of a file may be
+            read separately from parsing them (e.g., by AsyncFileManager). 
+            Defaults to False.
+        sequential (bool): whether the 'load' method reads a binary file-like 
+            object from front to back without seeking. If True, compressed 
+            files are decompressed as they are parsed instead of being 
+            decompressed to a temporary file first. Defaults to False.
+        sidecar (bool): whether loaded items may be stored in a SidecarCache 
+            because parsing the format is slower than reading a feather file.
+            Defaults to False.
+        atomic (bool): whether files are saved to a temporary file which then
+            replaces the final path, so an interrupted save never leaves a 
+            partial file behind. It should be False for formats whose 'save' 
+            method adds to an existing file or does not write a file at all.
+            Defaults to True.
+        packages (Sequence[str]): top-level packages used by the format. 
+            Process workers that transfer files of the format import the 
+            modules of these packages that this process has already imported
+            (see 'lazy.snapshot') when they start. Defaults to ('nagata',).
         
     """
     extensions: ClassVar[str | Sequence[str]] = None
     load_parameters: ClassVar[Optional[Mapping[str, str]]] = {}
     save_parameters: ClassVar[Optional[Mapping[str, str]]] = {}
+    stream_parameters: ClassVar[Optional[Mapping[str, str]]] = {}
+    concurrency: ClassVar[str] = 'thread'
+    buffers: ClassVar[bool] = False
+    sequential: ClassVar[bool] = False
+    sidecar: ClassVar[bool] = False
+    atomic: ClassVar[bool] = True
+    packages: ClassVar[Sequence[str]] = ('nagata',)
     
     """ Initialization Methods """
     
@@ -75,10 +119,13 @@ class FileFormat(abc.ABC):
         with contextlib.suppress(AttributeError):
             super().__init_subclass__(*args, **kwargs) # type: ignore
         if abc.ABC not in cls.__bases__:
+            import camina
             key = camina.namify(cls)
             if key.startswith('file_format_'):
                 key = key[12:]
-            FileFramework.formats[key] = cls(*args, **kwargs)
+            FileFramework.register(
+                name = key, 
+                file_format = cls(*args, **kwargs))
                     
     # def __post_init__(self) -> None:
     #     """Automatically registers subclass."""
@@ -169,18 +216,163 @@ class FileFramework(abc.ABC):
     Args:
         settings (ClassVar[dict[Hashable, Any]]): default settings for 
             file management.      
+        formats (ClassVar[dict[str, FileFormat]]): registered FileFormat 
+            instances. Keys are the format names.
+        manifest (ClassVar[dict[str, tuple[str | Sequence[str], str]]]): 
+            formats that are indexed when nagata is imported but are only 
+            imported (and registered in 'formats') when they are first used. 
+            Keys are format names and values are the format's extensions and 
+            the import path of its FileFormat subclass.
+        importer (ClassVar[lazy.Importer]): lazy importer for the classes in
+            'manifest'.
+        executors (ClassVar[dict[str, str]]): import paths of executor classes 
+            used for transferring many files at once. Keys match the 
+            'concurrency' attribute of FileFormat instances.
+        extensions (ClassVar[dict[str, str]]): index of file extensions (without
+            a leading '.') to the matching key in 'formats'. Multi-part 
+            extensions (e.g., 'csv.gz') are stored as a single key. It is kept 
+            up to date by 'register' so that it never needs to be rebuilt 
+            during a file transfer.
+        version (ClassVar[int]): counter that is incremented each time 
+            'extensions' changes. Objects that cache information derived from
+            the registered formats can compare it to a stored value to know
+            when their cache is stale.
+        codecs (ClassVar[dict[str, compression.Codec]]): compression codecs.
+            Keys are the extensions (without a leading '.') which mark a file 
+            as compressed with the codec. A file named 'data.csv.zst' is loaded
+            and saved as a csv file compressed with zstandard.
         
     """
     settings: ClassVar[dict[Hashable, Any]] = {
         'file_encoding': 'windows-1252',
         'index_column': False,
         'header': 'infer',
+        'included_columns': None,
+        'filters': None,
         'conserve_memory': False,
+        'memory_map': False,
+        'detect_compression': False,
+        'pickle_protocol': None,
         'test_size': 1000,
+        'chunk_size': 10000,
+        'split_size': 1 << 26,
         'threads': -1,
         'visual_tightness': 'tight', 
         'visual_format': 'png'}
-    formats: ClassVar[camina.Dictionary[str, FileFormat]] = camina.Dictionary()
+    formats: ClassVar[dict[str, FileFormat]] = {}
+    manifest: ClassVar[dict[str, tuple[str | Sequence[str], str]]] = {
+        'pickle': (('pickle', 'pkl'), 'nagata.formats.FileFormatPickle'),
+        'text': (('txt', 'text'), 'nagata.formats.FileFormatText'),
+        'numpy': (('npy', 'npz'), 'nagata.formats.FileFormatNumpy'),
+        'csv': ('csv', 'nagata.formats.FileFormatCSV'),
+        'excel': (('xlsx', 'xls'), 'nagata.formats.FileFormatExcel'),
+        'feather': ('feather', 'nagata.formats.FileFormatFeather'),
+        'hdf': (('hdf', 'hdf5'), 'nagata.formats.FileFormatHDF'),
+        'json': ('json', 'nagata.formats.FileFormatJSON'),
+        'latex': ('latex', 'nagata.formats.FileFormatLatex'),
+        'parquet': ('parquet', 'nagata.formats.FileFormatParquet'),
+        'stata': ('dta', 'nagata.formats.FileFormatSTATA'),
+        'sql': ('sql', 'nagata.formats.FileFormatSQL'),
+        'png': ('png', 'nagata.formats.FileFormatPNG')}
+    importer: ClassVar[lazy.Importer] = lazy.Importer(
+        package = 'nagata',
+        importables = {k: v[1] for k, v in manifest.items()})
+    executors: ClassVar[dict[str, str]] = {
+        'process': 'concurrent.futures.ProcessPoolExecutor',
+        'thread': 'concurrent.futures.ThreadPoolExecutor'}
+    extensions: ClassVar[dict[str, str]] = {
+        e: k 
+        for k, v in manifest.items() 
+        for e in ((v[0],) if isinstance(v[0], str) else v[0])}
+    codecs: ClassVar[dict[str, compression.Codec]] = {
+        'gz': compression.GZIP,
+        'bz2': compression.BZIP2,
+        'xz': compression.XZ,
+        'lz4': compression.LZ4,
+        'zst': compression.ZSTANDARD,
+        'zstd': compression.ZSTANDARD}
+    version: ClassVar[int] = 0
+    
+    """ Public Methods """
+    
+    @classmethod
+    def get_format(cls, name: str) -> FileFormat:
+        """Returns the registered FileFormat instance stored at 'name'.
+        
+        If 'name' is in 'manifest' but has not been registered yet, its class 
+        is imported (which registers it) first.
+
+        Args:
+            name (str): name of a file format.
+
+        Raises:
+            KeyError: if 'name' is not a registered or deferred file format.
+
+        Returns:
+            FileFormat: registered instance.
+            
+        """
+        try:
+            return cls.formats[name]
+        except KeyError:
+            pass
+        try:
+            cls.importer.load(name)
+            return cls.formats[name]
+        except KeyError:
+            raise KeyError(f'{name} is not a recognized file format') from None
+    
+    @classmethod
+    def register(cls, name: str, file_format: FileFormat) -> None:
+        """Adds 'file_format' to 'formats' and indexes its extensions.
+
+        Args:
+            name (str): key to store 'file_format' at in 'formats'.
+            file_format (FileFormat): instance to register.
+            
+        """
+        cls.formats[name] = file_format
+        cls._index(name = name, extensions = file_format.extensions)
+        cls.version += 1
+        return
+    
+    @classmethod
+    def reindex(cls) -> None:
+        """Rebuilds 'extensions' from 'formats'.
+        
+        This only needs to be called if 'formats' is changed directly instead
+        of through 'register'.
+        
+        """
+        cls.extensions.clear()
+        for name, (extensions, _) in cls.manifest.items():
+            cls._index(name = name, extensions = extensions)
+        for name, file_format in cls.formats.items():
+            cls._index(name = name, extensions = file_format.extensions)
+        cls.version += 1
+        return
+    
+    """ Private Methods """
+    
+    @classmethod
+    def _index(cls, name: str, extensions: str | Sequence[str]) -> None:
+        """Adds 'extensions' to the 'extensions' index.
+
+        Args:
+            name (str): key of the file format in 'formats' or 'manifest'.
+            extensions (str | Sequence[str]): extensions of the file format.
+
+        Raises:
+            TypeError: when 'extensions' is neither a str nor a sequence.
+                
+        """
+        if isinstance(extensions, str):
+            extensions = [extensions]
+        elif not isinstance(extensions, Sequence):
+            raise TypeError(f'{extensions} are not valid extension types')
+        for extension in extensions:
+            cls.extensions[extension.lstrip('.')] = name
+        return
   
    
 @dataclasses.dataclass
@@ -206,6 +398,34 @@ class FileManager(object):
         framework (Type[FileFramework]): class with default settings, dict of
             supported file formats, and any other information needed for file
             management. Defaults to FileFramework.
+        cache (Optional[caching.LoadCache]): in-memory cache of loaded items. If
+            it is None, every call to 'load' reads from disk. Defaults to None.
+        sidecar (Optional[caching.SidecarCache]): on-disk cache of parsed 
+            dataframes for formats that are slow to parse. If its 'folder' is 
+            None, 'interim_folder' is used. Defaults to None.
+        write_behind (bool): whether 'save' hands items to a background writer
+            and returns a future instead of blocking until the file is 
+            written. Items must not be changed until their save is finished. 
+            Call 'flush' (or use the manager as a context manager) to wait for
+            pending saves. Once 'close' has been called, background saves 
+            raise a RuntimeError. Defaults to False.
+        hooks (Optional[instrumentation.Hooks]): event bus which is sent an 
+            Event before and after the 'prepare', 'parameters', and 'transfer'
+            phases of each transfer. load_many and save_many only report the
+            'prepare' and 'parameters' phases of each file. Compressed files 
+            that are decompressed to a temporary file also report separate 
+            'read' and 'parse' phases within 'transfer'. Other loads are read 
+            and parsed by the file format's library in one call, so only 
+            'transfer' is reported for them. If None, nothing is timed or 
+            sent. Defaults to None.
+        index (Optional[caching.FileIndex]): cached index of files used by 
+            'glob' and 'load_glob'. If its 'folder' is None, 'input_folder' is 
+            used. If it is None, an index of 'input_folder' is created the 
+            first time it is needed. Defaults to None.
+        plan_limit (ClassVar[int]): maximum number of resolved paths and file
+            formats that are stored so that repeated transfers with the same
+            arguments skip resolution. The store is emptied when it is full. 
+            Defaults to 4096.
 
     """
     root_folder: pathlib.Path | str = pathlib.Path('.')
@@ -213,6 +433,12 @@ class FileManager(object):
     interim_folder: pathlib.Path | str = 'root'
     output_folder: pathlib.Path | str = 'root'
     framework: Type[FileFramework] = FileFramework
+    cache: Optional[caching.LoadCache] = None
+    sidecar: Optional[caching.SidecarCache] = None
+    write_behind: bool = False
+    hooks: Optional[instrumentation.Hooks] = None
+    index: Optional[caching.FileIndex] = None
+    plan_limit: ClassVar[int] = 4096
     
     """ Initialization Methods """
 
@@ -224,32 +450,42 @@ class FileManager(object):
         # Validates core folder paths and writes them to disk.
         self._validate_root_folder()
         self._validate_io_folders()
+        if self.sidecar is not None and self.sidecar.folder is None:
+            self.sidecar.folder = self.interim_folder
+        if self.index is not None and self.index.folder is None:
+            self.index.folder = self.input_folder
+        self._writer: Optional[concurrent.futures.Executor] = None
+        self._pending: dict[pathlib.Path, concurrent.futures.Future] = {}
+        self._errors: list[BaseException] = []
+        self._closed = False
+        self._lock = threading.Lock()
+        self._plans: dict[tuple[Any, ...], tuple[pathlib.Path, FileFormat]] = {}
         return 
     
+    """ Dunder Methods """
+    
+    def __enter__(self) -> FileManager:
+        return self
+    
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+        return
+    
     """ Properties """
     
     @property
     def extensions(self) -> dict[str, str]: 
         """Returns dict of file extensions.
         
-        Raises:
-            TypeError: when a non-string or non-sequence is discovered in a
-                stored FileFormat's 'extensions' attribute.
+        The dict is the index maintained by 'framework' as file formats are
+        registered, so accessing it does not rebuild or copy anything.
+        
         Returns:
             dict[str, str]: keys are file extensions and values are the related
                 key to the file_format in the 'formats' attribute.
         
         """
-        extensions = {}
-        for key, instance in self.framework.formats.items():
-            if isinstance(instance.extensions, str):
-                extensions[instance.extensions] = key
-            elif isinstance(instance.extensions, Sequence):
-                extensions.update(dict.fromkeys(instance.extensions, key))
-            else:
-                raise TypeError(
-                    f'{instance.extensions} are not valid extension types')
-        return extensions
+        return self.framework.extensions
                        
     """ Public Methods """
 
@@ -259,11 +495,18 @@ class FileManager(object):
         folder: pathlib.Path | str = None,
         file_name: Optional[str] = None,
         file_format: Optional[str | FileFormat] = None,
+        lazy: bool = False,
         **kwargs: Any) -> Any:
         """Imports file by calling appropriate method based on file_format.
 
         If needed arguments are not passed, default values are used. If
         file_path is passed, folder and file_name are ignored.
+        
+        If 'lazy' is True, the file is not parsed until its data is first 
+        accessed. Instead, a DelayedLoad proxy is returned which answers 
+        questions about the file's size and, for formats with a 'describe' 
+        method, its columns, column types, and rows from the file's header or 
+        footer.
 
         Args:
             file_path (Union[str, Path]]): a complete file path. Defaults to 
@@ -274,25 +517,33 @@ class FileManager(object):
             file_format (Union[str, FileFormat]]): object with information about 
                 how the file should be loaded or the key to such an object. 
                 Defaults to None.
+            lazy (bool): whether to return a DelayedLoad proxy which parses 
+                the file when its data is first accessed. Defaults to False.
             **kwargs: can be passed if additional options are desired specific
                 to the methods attached to a FileFormat instance.
 
         Returns:
             Any: depending upon method used for appropriate file format, a new
-                variable of a supported type is returned.
+                variable of a supported type is returned (or a DelayedLoad 
+                proxy for it if 'lazy' is True).
 
         """
-        file_path, file_format = self._prepare_transfer(
+        file_path, file_format, parameters = self._resolve(
             file_path = file_path,
             folder = folder,
             file_name = file_name,
             transfer_type = 'load',
-            file_format = file_format)
-        parameters = self._get_transfer_parameters(
-            file_format = file_format, 
-            transfer_type = 'load',
+            file_format = file_format,
             **kwargs)
-        return file_format.load(path = file_path, **parameters)
+        if lazy:
+            return self._defer(
+                file_path = file_path, 
+                file_format = file_format, 
+                parameters = parameters)
+        return self._execute_load(
+            file_path = file_path, 
+            file_format = file_format, 
+            parameters = parameters)
 
     def save(
         self,
@@ -301,11 +552,16 @@ class FileManager(object):
         folder: Optional[pathlib.Path | str] = None,
         file_name: Optional[str] = None,
         file_format: Optional[str | FileFormat] = None,
-        **kwargs: Any) -> None:
+        **kwargs: Any) -> Optional[concurrent.futures.Future]:
         """Exports file by calling appropriate method based on file_format.
 
         If needed arguments are not passed, default values are used. If
         file_path is passed, folder and file_name are ignored.
+        
+        Unless the file format is not atomic, the file is written to a 
+        temporary path in the same folder which then replaces 'file_path'. If 
+        'write_behind' is True, the save is queued and performed by a 
+        background writer in the order it was queued.
 
         Args:
             item (Any): object to be save to disk.
@@ -320,20 +576,354 @@ class FileManager(object):
             **kwargs: can be passed if additional options are desired specific
                 to the methods attached to a FileFormat instance.
 
+        Returns:
+            Optional[concurrent.futures.Future]: if 'write_behind' is True, a 
+                future which is finished when the file has been written. 
+                Otherwise, None.
+                
         """
-        file_path, file_format = self._prepare_transfer(
+        file_path, file_format, parameters = self._resolve(
             file_path = file_path,
             folder = folder,
             file_name = file_name,
             transfer_type = 'save',
-            file_format = file_format)
-        parameters = self._get_transfer_parameters(
-            file_format = file_format, 
-            transfer_type = 'save',
+            file_format = file_format,
             **kwargs)
-        file_format.save(item = item, path = file_path, **parameters)
+        return self._execute_save(
+            file_path = file_path, 
+            file_format = file_format, 
+            parameters = parameters,
+            item = item)
+
+    def load_many(
+        self,
+        file_paths: Sequence[pathlib.Path | str] | pathlib.Path | str,
+        folder: Optional[pathlib.Path | str] = None,
+        file_format: Optional[str | FileFormat] = None,
+        as_completed: bool = False,
+        **kwargs: Any) -> list[Any] | Iterator[tuple[pathlib.Path, Any]]:
+        """Imports several files at once using a pool of workers.
+        
+        Each file is dispatched to the executor in 'framework.executors' that 
+        matches the 'concurrency' attribute of its file format. The number of
+        workers is taken from the 'threads' setting in 'framework.settings'
+        (values less than 1 use every available core).
+        
+        If 'file_paths' is a single folder, every file in it with a registered
+        extension (or an extension of 'file_format', if it is passed) is 
+        loaded, in order of file name. So, for example, a folder of Excel 
+        workbooks is spread across worker processes with one call.
+
+        Args:
+            file_paths (Sequence[pathlib.Path | str] | pathlib.Path | str): 
+                complete file paths, file names within 'folder' if 'folder' is
+                passed, or a folder (or the name of a folder attribute).
+            folder (Optional[pathlib.Path | str]): a complete folder path or the
+                name of a folder. Defaults to None.
+            file_format (Optional[str | FileFormat]): object with information 
+                about how the files should be loaded or the key to such an 
+                object. If None, the format of each file is derived from its
+                extension. Defaults to None.
+            as_completed (bool): whether to return an iterator of (path, loaded
+                item) tuples in the order that the files finish loading (True) 
+                or a list of loaded items in the order of 'file_paths' (False).
+                Defaults to False.
+            **kwargs: can be passed if additional options are desired specific
+                to the methods attached to a FileFormat instance.
+
+        Returns:
+            list[Any] | Iterator[tuple[pathlib.Path, Any]]: loaded items in the
+                order of 'file_paths' or, if 'as_completed' is True, an 
+                iterator of paths and loaded items as each file is finished.
+            
+        """
+        if isinstance(file_paths, (str, pathlib.Path)):
+            file_paths = self._list_folder(
+                folder = file_paths, 
+                file_format = file_format)
+        transfers = [
+            self._prepare_many(
+                path = path, 
+                folder = folder,
+                transfer_type = 'load',
+                file_format = file_format,
+                **kwargs)
+            for path in file_paths]
+        results = self._transfer_many(
+            transfers = transfers,
+            transfer_type = 'load', 
+            as_completed = as_completed)
+        if as_completed:
+            return results
+        else:
+            return [item for _, item in results]
+
+    def save_many(
+        self,
+        items: Sequence[tuple[Any, pathlib.Path | str]],
+        folder: Optional[pathlib.Path | str] = None,
+        file_format: Optional[str | FileFormat] = None,
+        **kwargs: Any) -> None:
+        """Exports several files at once using a pool of workers.
+        
+        Workers are allocated in the same manner as 'load_many'.
+
+        Args:
+            items (Sequence[tuple[Any, pathlib.Path | str]]): pairs of an object
+                to save and either a complete file path or, if 'folder' is 
+                passed, a file name within 'folder'.
+            folder (Optional[pathlib.Path | str]): a complete folder path or the
+                name of a folder. Defaults to None.
+            file_format (Optional[str | FileFormat]): object with information 
+                about how the files should be saved or the key to such an 
+                object. If None, the format of each file is derived from its
+                extension. Defaults to None.
+            **kwargs: can be passed if additional options are desired specific
+                to the methods attached to a FileFormat instance.
+            
+        """
+        transfers = []
+        for item, path in items:
+            transfer = self._prepare_many(
+                path = path, 
+                folder = folder,
+                transfer_type = 'save',
+                file_format = file_format,
+                **kwargs)
+            transfer[2]['item'] = item
+            transfers.append(transfer)
+        for file_path, _ in self._transfer_many(
+            transfers = transfers, 
+            transfer_type = 'save', 
+            as_completed = True):
+            if self.cache is not None:
+                self.cache.invalidate(path = file_path)
         return
+        
+    def plan(
+        self,
+        file_path: Optional[pathlib.Path | str] = None,
+        folder: Optional[pathlib.Path | str] = None,
+        file_name: Optional[str] = None,
+        file_format: Optional[str | FileFormat] = None,
+        transfer_type: str = 'load',
+        **kwargs: Any) -> TransferPlan:
+        """Resolves a transfer once so that it can be performed many times.
+        
+        Arguments are resolved in the same manner as 'load' and 'save'. The 
+        returned plan keeps the resolved path, file format, and parameters, so
+        each call to its 'load' or 'save' method skips straight to the 
+        transfer. Changes to 'framework.settings' after a plan is created do 
+        not affect it.
 
+        Args:
+            file_path (Union[str, Path]]): a complete file path. Defaults to 
+                None.
+            folder (Union[str, Path]]): a complete folder path or the name of a 
+                folder. Defaults to None.
+            file_name (str): file name without extension. Defaults to None.
+            file_format (Union[str, FileFormat]]): object with information about 
+                how the file should be transferred or the key to such an object.
+                Defaults to None.
+            transfer_type (str): either 'load' or 'save'. Defaults to 'load'.
+            **kwargs: can be passed if additional options are desired specific
+                to the methods attached to a FileFormat instance.
+
+        Returns:
+            TransferPlan: resolved transfer.
+            
+        """
+        file_path, file_format, parameters = self._resolve(
+            file_path = file_path,
+            folder = folder,
+            file_name = file_name,
+            transfer_type = transfer_type,
+            file_format = file_format,
+            **kwargs)
+        return TransferPlan(
+            manager = self,
+            file_path = file_path,
+            file_format = file_format,
+            transfer_type = transfer_type,
+            parameters = parameters)
+    
+    def glob(
+        self,
+        pattern: str,
+        file_format: Optional[str | FileFormat] = None,
+        refresh: bool = True) -> list[pathlib.Path]:
+        """Returns paths of indexed files that match 'pattern'.
+        
+        Files are found in 'index' instead of walking the folder tree, and the
+        index is refreshed incrementally first, so repeated calls only rescan
+        folders that have changed.
+
+        Args:
+            pattern (str): glob pattern relative to the indexed folder (e.g., 
+                '2026-*/**/*.parquet'). See FileIndex.glob for the syntax.
+            file_format (Optional[str | FileFormat]): if passed, only files of
+                this format are returned. Defaults to None.
+            refresh (bool): whether to refresh the index before matching. 
+                Defaults to True.
+
+        Returns:
+            list[pathlib.Path]: matching file paths, sorted.
+            
+        """
+        if self.index is None:
+            self.index = caching.FileIndex(folder = self.input_folder)
+        if refresh:
+            self.index.refresh(match = self._match_format)
+        entries = self.index.glob(pattern = pattern)
+        if file_format is not None:
+            file_format = self._validate_file_format(file_format = file_format)
+            entries = [
+                e for e in entries 
+                if e.file_format is not None
+                and self.framework.get_format(name = e.file_format) 
+                    is file_format]
+        return [e.path for e in entries]
+    
+    def load_glob(
+        self,
+        pattern: str,
+        file_format: Optional[str | FileFormat] = None,
+        as_completed: bool = False,
+        **kwargs: Any) -> (
+            dict[pathlib.Path, Any] | Iterator[tuple[pathlib.Path, Any]]):
+        """Imports every indexed file that matches 'pattern'.
+        
+        Files are found with 'glob' and loaded with 'load_many'. Files without 
+        a registered extension are skipped unless 'file_format' is passed.
+
+        Args:
+            pattern (str): glob pattern relative to the indexed folder.
+            file_format (Optional[str | FileFormat]): if passed, only files of
+                this format are loaded. Defaults to None.
+            as_completed (bool): whether to return an iterator of (path, loaded
+                item) tuples as files finish loading. Defaults to False.
+            **kwargs: can be passed if additional options are desired specific
+                to the methods attached to a FileFormat instance.
+
+        Returns:
+            dict[pathlib.Path, Any] | Iterator[tuple[pathlib.Path, Any]]: 
+                loaded items keyed by path, sorted by path, or, if 
+                'as_completed' is True, an iterator of paths and loaded items.
+            
+        """
+        paths = self.glob(pattern = pattern, file_format = file_format)
+        if file_format is None:
+            paths = [p for p in paths if self._match_format(name = p.name)]
+        results = self.load_many(
+            file_paths = paths,
+            file_format = file_format,
+            as_completed = as_completed,
+            **kwargs)
+        if as_completed:
+            return results
+        return dict(zip(paths, results))
+        
+    def stream(
+        self,
+        file_path: Optional[pathlib.Path | str] = None,
+        folder: pathlib.Path | str = None,
+        file_name: Optional[str] = None,
+        file_format: Optional[str | FileFormat] = None,
+        chunk_size: Optional[int] = None,
+        **kwargs: Any) -> Iterator[Any]:
+        """Imports a file in fixed-size chunks.
+        
+        Only one chunk is held in memory at a time, so files that are larger 
+        than available memory can be processed. Arguments are resolved in the
+        same manner as 'load'.
+
+        Args:
+            file_path (Union[str, Path]]): a complete file path. Defaults to 
+                None.
+            folder (Union[str, Path]]): a complete folder path or the name of a 
+                folder. Defaults to None.
+            file_name (str): file name without extension. Defaults to None.
+            file_format (Union[str, FileFormat]]): object with information about 
+                how the file should be loaded or the key to such an object. 
+                Defaults to None.
+            chunk_size (Optional[int]): number of rows or records in each chunk.
+                If None, the 'chunk_size' setting in 'framework.settings' is 
+                used. Defaults to None.
+            **kwargs: can be passed if additional options are desired specific
+                to the methods attached to a FileFormat instance.
+
+        Raises:
+            NotImplementedError: if the file format cannot be loaded in chunks.
+            
+        Returns:
+            Iterator[Any]: chunks of the loaded file.
+
+        """
+        file_path, file_format, parameters = self._resolve(
+            file_path = file_path,
+            folder = folder,
+            file_name = file_name,
+            transfer_type = 'stream',
+            file_format = file_format,
+            **kwargs)
+        if not hasattr(file_format, 'stream'):
+            raise NotImplementedError(
+                f'{file_format.__class__.__name__} does not support streaming')
+        if chunk_size is None:
+            chunk_size = self.framework.settings['chunk_size']
+        codec = self._get_codec(file_path = file_path, transfer_type = 'load')
+        if codec is not None:
+            return compression.stream(
+                file_format = file_format,
+                path = file_path,
+                codec = codec,
+                folder = self.interim_folder,
+                chunk_size = chunk_size,
+                **parameters)
+        return file_format.stream(
+            path = file_path, 
+            chunk_size = chunk_size, 
+            **parameters)
+        
+    def flush(self) -> None:
+        """Waits for every pending save when 'write_behind' is True.
+
+        Raises:
+            BaseException: the first error raised by a pending save since the 
+                last call to 'flush'. Every pending save is finished before it 
+                is raised.
+            
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            with contextlib.suppress(BaseException):
+                future.result()
+        with self._lock:
+            errors = self._errors[:1]
+            self._errors.clear()
+        if errors:
+            raise errors[0]
+        return
+    
+    def close(self) -> None:
+        """Flushes pending saves and shuts down the background writer.
+        
+        After it is called, loads and saves that are not in the background 
+        still work, but background saves raise a RuntimeError.
+        
+        """
+        with self._lock:
+            self._closed = True
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                writer, self._writer = self._writer, None
+            if writer is not None:
+                writer.shutdown(wait = True)
+        return
+        
     def validate(self, path: pathlib.Path | str) -> pathlib.Path:
         """Turns 'file_path' into a pathlib.Path.
 
@@ -352,20 +942,15 @@ class FileManager(object):
 
         """
         if isinstance(path, str):
-            attribute = f'{path}_folder'
-            try:
-                value = getattr(self, attribute)
-                if isinstance(value, pathlib.Path):
-                    return value
-            except AttributeError:
-                pass
+            value = getattr(self, f'{path}_folder', None)
+            if isinstance(value, pathlib.Path):
+                return value
             else:
                 return pathlib.Path(path)
         elif isinstance(path, pathlib.Path):
             return path
         else:
             raise TypeError(f'path must be a str or Path type')
-        return
       
     """ Private Methods """
 
@@ -391,15 +976,72 @@ class FileManager(object):
             Path: formed from string arguments.
 
         """
-        if hasattr(self, f'{folder}_folder'):
-            folder = getattr(self, f'{folder}_folder')
-        if file_name and extension and '.' not in file_name:
-            return pathlib.Path(folder).joinpath(f'{file_name}.{extension}')
-        elif file_name and '.' in file_name:
-            return pathlib.Path(folder).joinpath(file_name)
+        if isinstance(folder, str):
+            folder = getattr(self, f'{folder}_folder', folder)
+        if not isinstance(folder, pathlib.Path):
+            folder = pathlib.Path(folder)
+        if not file_name:
+            return folder
+        elif '.' in file_name:
+            return folder / file_name
+        elif extension:
+            return folder / f'{file_name}.{extension}'
         else:
-            return pathlib.Path(folder)
+            return folder
+
+    def _list_folder(
+        self,
+        folder: pathlib.Path | str,
+        file_format: Optional[str | FileFormat] = None) -> list[pathlib.Path]:
+        """Returns the files in 'folder' that can be loaded.
+
+        Args:
+            folder (pathlib.Path | str): a complete folder path or the name of a
+                folder attribute.
+            file_format (Optional[str | FileFormat]): if passed, only files with
+                an extension of this format are returned. Defaults to None.
+
+        Raises:
+            NotADirectoryError: if 'folder' is not a folder.
+            
+        Returns:
+            list[pathlib.Path]: paths of matching files, sorted by name.
+            
+        """
+        folder = self._combine_path(folder = folder)
+        if not folder.is_dir():
+            raise NotADirectoryError(f'{folder} is not a folder')
+        if file_format is not None:
+            file_format = self._validate_file_format(file_format = file_format)
+        paths = []
+        for path in sorted(folder.iterdir()):
+            if not path.is_file() or path.name.startswith('.'):
+                continue
+            _, key = self._match_extension(name = path.name)
+            if key is None:
+                continue
+            if (
+                file_format is None 
+                or self.framework.get_format(name = key) is file_format):
+                paths.append(path)
+        return paths
+    
+    def _get_workers(self, count: int) -> int:
+        """Returns the number of workers to use for 'count' transfers.
+
+        Args:
+            count (int): number of files to be transferred.
 
+        Returns:
+            int: number of workers, limited by the 'threads' setting and 
+                'count'.
+            
+        """
+        workers = self.framework.settings.get('threads', -1)
+        if workers is None or workers < 1:
+            workers = os.cpu_count() or 1
+        return max(1, min(workers, count))
+    
     def _get_transfer_parameters(
         self,
         file_format: FileFormat, 
@@ -424,6 +1066,505 @@ class FileManager(object):
                     kwargs[specific] = self.framework.settings[common]
         return kwargs # type: ignore
 
+    def _defer(
+        self,
+        file_path: pathlib.Path,
+        file_format: FileFormat,
+        parameters: MutableMapping[Hashable, Any]) -> lazy.DelayedLoad:
+        """Returns a proxy which loads a resolved file when it is first used.
+
+        Args:
+            file_path (pathlib.Path): path of the file to load.
+            file_format (FileFormat): format of the file at 'file_path'.
+            parameters (MutableMapping[Hashable, Any]): parameters to pass to 
+                the 'load' method of 'file_format'.
+
+        Returns:
+            lazy.DelayedLoad: proxy for the loaded item.
+            
+        """
+        describe = getattr(file_format, 'describe', None)
+        if describe is not None and self._get_codec(
+            file_path = file_path, 
+            transfer_type = 'load') is None:
+            describe = functools.partial(describe, path = file_path, **parameters)
+        else:
+            describe = None
+        return lazy.DelayedLoad(
+            loader = functools.partial(
+                self._execute_load,
+                file_path = file_path, 
+                file_format = file_format, 
+                parameters = parameters),
+            path = file_path,
+            describe = describe)
+    
+    def _execute_load(
+        self,
+        file_path: pathlib.Path,
+        file_format: FileFormat,
+        parameters: MutableMapping[Hashable, Any]) -> Any:
+        """Loads a resolved file and reports the transfer to 'hooks'.
+
+        Args:
+            file_path (pathlib.Path): path of the file to load.
+            file_format (FileFormat): format of the file at 'file_path'.
+            parameters (MutableMapping[Hashable, Any]): parameters to pass to 
+                the 'load' method of 'file_format'.
+
+        Returns:
+            Any: loaded item.
+            
+        """
+        with self._observe(
+            phase = 'transfer', 
+            transfer_type = 'load', 
+            file_path = file_path, 
+            file_format = file_format) as event:
+            item = self._load(
+                file_path = file_path, 
+                file_format = file_format, 
+                parameters = parameters)
+            if event is not None:
+                event.size = self._get_size(path = file_path)
+        return item
+    
+    def _execute_save(
+        self,
+        file_path: pathlib.Path,
+        file_format: FileFormat,
+        parameters: MutableMapping[Hashable, Any],
+        item: Any) -> Optional[concurrent.futures.Future]:
+        """Saves 'item' now or, if 'write_behind' is True, queues the save.
+
+        Args:
+            file_path (pathlib.Path): path of the file to save.
+            file_format (FileFormat): format of the file at 'file_path'.
+            parameters (MutableMapping[Hashable, Any]): parameters to pass to 
+                the 'save' method of 'file_format'.
+            item (Any): item to save.
+
+        Raises:
+            RuntimeError: if 'write_behind' is True and 'close' has been 
+                called.
+                
+        Returns:
+            Optional[concurrent.futures.Future]: if 'write_behind' is True, a 
+                future which is finished when the file has been written. 
+                Otherwise, None.
+            
+        """
+        if not self.write_behind:
+            self._save(
+                file_path = file_path, 
+                file_format = file_format, 
+                parameters = parameters,
+                item = item)
+            return None
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(
+                    'background saves cannot be queued after the manager is '
+                    'closed')
+            if self._writer is None:
+                executor = lazy.from_import_path(
+                    path = self.framework.executors['thread'])
+                self._writer = executor(max_workers = 1)
+            future = self._writer.submit(
+                self._save,
+                file_path = file_path, 
+                file_format = file_format, 
+                parameters = parameters,
+                item = item)
+            self._pending[file_path] = future
+        future.add_done_callback(
+            lambda done: self._finish(file_path = file_path, future = done))
+        return future
+    
+    def _load(
+        self,
+        file_path: pathlib.Path,
+        file_format: FileFormat,
+        parameters: MutableMapping[Hashable, Any]) -> Any:
+        """Loads a file, using 'cache' if it exists.
+
+        Args:
+            file_path (pathlib.Path): path of the file to load.
+            file_format (FileFormat): format of the file at 'file_path'.
+            parameters (MutableMapping[Hashable, Any]): parameters to pass to 
+                the 'load' method of 'file_format'.
+
+        Returns:
+            Any: loaded item.
+            
+        """
+        if self._pending:
+            with self._lock:
+                pending = self._pending.get(file_path)
+        else:
+            pending = None
+        if pending is not None:
+            with contextlib.suppress(BaseException):
+                pending.result()
+        if self.cache is None:
+            return self._read(
+                file_path = file_path, 
+                file_format = file_format, 
+                parameters = parameters)
+        key = self.cache.key(
+            path = file_path, 
+            file_format = file_format, 
+            parameters = parameters)
+        if key is not None:
+            found, item = self.cache.fetch(key = key)
+            if found:
+                return item
+        item = self._read(
+            file_path = file_path, 
+            file_format = file_format, 
+            parameters = parameters)
+        if key is not None:
+            self.cache.store(key = key, item = item)
+        return item
+    
+    def _read(
+        self,
+        file_path: pathlib.Path,
+        file_format: FileFormat,
+        parameters: MutableMapping[Hashable, Any]) -> Any:
+        """Loads a file, using 'sidecar' if it exists and the format allows.
+
+        Args:
+            file_path (pathlib.Path): path of the file to load.
+            file_format (FileFormat): format of the file at 'file_path'.
+            parameters (MutableMapping[Hashable, Any]): parameters to pass to 
+                the 'load' method of 'file_format'.
+
+        Returns:
+            Any: loaded item.
+            
+        """
+        if self.sidecar is None or not file_format.sidecar:
+            return self._parse(
+                file_path = file_path, 
+                file_format = file_format, 
+                parameters = parameters)
+        key = self.sidecar.key(path = file_path, parameters = parameters)
+        if key is not None:
+            found, item = self.sidecar.fetch(key = key)
+            if found:
+                return item
+        item = self._parse(
+            file_path = file_path, 
+            file_format = file_format, 
+            parameters = parameters)
+        if key is not None:
+            self.sidecar.store(key = key, item = item)
+        return item
+        
+    def _save(
+        self,
+        file_path: pathlib.Path,
+        file_format: FileFormat,
+        parameters: MutableMapping[Hashable, Any],
+        item: Any) -> None:
+        """Saves 'item' and removes stale copies of it from 'cache'.
+
+        Args:
+            file_path (pathlib.Path): path of the file to save.
+            file_format (FileFormat): format of the file at 'file_path'.
+            parameters (MutableMapping[Hashable, Any]): parameters to pass to 
+                the 'save' method of 'file_format'.
+            item (Any): item to save.
+            
+        """
+        with self._observe(
+            phase = 'transfer', 
+            transfer_type = 'save', 
+            file_path = file_path, 
+            file_format = file_format) as event:
+            _write(
+                file_format = file_format,
+                path = file_path,
+                codec = self._get_codec(
+                    file_path = file_path, 
+                    transfer_type = 'save'),
+                folder = self.interim_folder,
+                threads = self.framework.settings.get('threads', -1),
+                item = item,
+                **parameters)
+            if event is not None:
+                event.size = self._get_size(path = file_path)
+        if self.cache is not None:
+            self.cache.invalidate(path = file_path)
+        return
+    
+    def _finish(
+        self, 
+        file_path: pathlib.Path, 
+        future: concurrent.futures.Future) -> None:
+        """Records the outcome of a save queued by 'write_behind'.
+
+        Args:
+            file_path (pathlib.Path): path of the saved file.
+            future (concurrent.futures.Future): finished save.
+            
+        """
+        with self._lock:
+            if self._pending.get(file_path) is future:
+                del self._pending[file_path]
+            if not future.cancelled() and future.exception() is not None:
+                self._errors.append(future.exception())
+        return
+    
+    def _parse(
+        self,
+        file_path: pathlib.Path,
+        file_format: FileFormat,
+        parameters: MutableMapping[Hashable, Any]) -> Any:
+        """Loads a file, decompressing it if it is compressed.
+
+        Args:
+            file_path (pathlib.Path): path of the file to load.
+            file_format (FileFormat): format of the file at 'file_path'.
+            parameters (MutableMapping[Hashable, Any]): parameters to pass to 
+                the 'load' method of 'file_format'.
+
+        Returns:
+            Any: loaded item.
+            
+        """
+        codec = self._get_codec(file_path = file_path, transfer_type = 'load')
+        if codec is None:
+            return file_format.load(path = file_path, **parameters)
+        return compression.load(
+            file_format = file_format,
+            path = file_path,
+            codec = codec,
+            folder = self.interim_folder,
+            observe = self._get_observer(
+                transfer_type = 'load',
+                file_path = file_path,
+                file_format = file_format),
+            **parameters)
+        
+    def _get_codec(
+        self, 
+        file_path: pathlib.Path, 
+        transfer_type: str) -> Optional[compression.Codec]:
+        """Returns the codec that 'file_path' is compressed with, if any.
+        
+        The codec is found from the last suffix of 'file_path' unless that 
+        suffix is also a registered file format extension. If no codec suffix
+        is found, the 'detect_compression' setting is True, and the file is 
+        being loaded, the first bytes of the file are checked for the signature
+        of each codec.
+
+        Args:
+            file_path (pathlib.Path): path of the file to transfer.
+            transfer_type (str): either 'load' or 'save'.
+
+        Returns:
+            Optional[compression.Codec]: codec of the file or None if it is not
+                compressed.
+            
+        """
+        suffix = file_path.suffix[1:]
+        codecs = self.framework.codecs
+        if suffix in codecs and suffix not in self.extensions:
+            return codecs[suffix]
+        elif (
+            transfer_type == 'load' 
+            and self.framework.settings.get('detect_compression', False)):
+            return compression.detect(path = file_path, codecs = codecs.values())
+        else:
+            return None
+        
+    def _resolve(
+        self,
+        file_path: Optional[pathlib.Path | str],
+        folder: Optional[pathlib.Path | str],
+        file_name: Optional[str],
+        transfer_type: str,
+        file_format: Optional[str | FileFormat] = None,
+        **kwargs: Any) -> tuple[pathlib.Path, FileFormat, dict[str, Any]]:
+        """Resolves the path, file format, and parameters of a transfer.
+
+        Args:
+            file_path (Optional[pathlib.Path | str]): a complete file path.
+            folder (Optional[pathlib.Path | str]): a complete folder path or the
+                name of a folder.
+            file_name (Optional[str]): file name with or without extension.
+            transfer_type (str): 'load', 'save', or 'stream'.
+            file_format (Optional[str | FileFormat]): object with information 
+                about how the file should be transferred or the key to such an 
+                object. Defaults to None.
+            **kwargs: additional parameters to pass to the transfer method.
+
+        Returns:
+            tuple[pathlib.Path, FileFormat, dict[str, Any]]: the file path, file
+                format, and parameters for the transfer.
+            
+        """
+        direction = 'save' if transfer_type == 'save' else 'load'
+        if self.hooks is None:
+            file_path, file_format = self._prepare_transfer(
+                file_path = file_path,
+                folder = folder,
+                file_name = file_name,
+                transfer_type = direction,
+                file_format = file_format)
+            parameters = self._get_transfer_parameters(
+                file_format = file_format, 
+                transfer_type = transfer_type,
+                **kwargs)
+            return file_path, file_format, parameters
+        with self._observe(
+            phase = 'prepare', 
+            transfer_type = transfer_type) as event:
+            file_path, file_format = self._prepare_transfer(
+                file_path = file_path,
+                folder = folder,
+                file_name = file_name,
+                transfer_type = direction,
+                file_format = file_format)
+            if event is not None:
+                event.path = file_path
+                event.file_format = instrumentation.name_format(
+                    file_format = file_format)
+        with self._observe(
+            phase = 'parameters', 
+            transfer_type = transfer_type, 
+            file_path = file_path, 
+            file_format = file_format):
+            parameters = self._get_transfer_parameters(
+                file_format = file_format, 
+                transfer_type = transfer_type,
+                **kwargs)
+        return file_path, file_format, parameters
+    
+    def _observe(
+        self,
+        phase: str,
+        transfer_type: str,
+        file_path: Optional[pathlib.Path] = None,
+        file_format: Optional[FileFormat] = None) -> (
+            contextlib.AbstractContextManager[
+                Optional[instrumentation.Event]]):
+        """Returns a context manager which reports a phase to 'hooks'.
+
+        If 'hooks' is None, a shared context manager that does nothing and 
+        yields None is returned, so unobserved transfers are not slowed down.
+
+        Args:
+            phase (str): 'prepare', 'parameters', 'transfer', 'read', or 
+                'parse'.
+            transfer_type (str): 'load', 'save', or 'stream'.
+            file_path (Optional[pathlib.Path]): path of the transferred file.
+                Defaults to None.
+            file_format (Optional[FileFormat]): format of the transferred file.
+                Defaults to None.
+
+        Returns:
+            contextlib.AbstractContextManager[Optional[instrumentation.Event]]:
+                context manager yielding the Event of the phase or None.
+            
+        """
+        if self.hooks is None:
+            return _UNOBSERVED
+        return self.hooks.phase(
+            phase = phase, 
+            transfer_type = transfer_type,
+            path = file_path,
+            file_format = file_format)
+
+    def _get_observer(
+        self,
+        transfer_type: str,
+        file_path: Optional[pathlib.Path] = None,
+        file_format: Optional[FileFormat] = None) -> Optional[
+            Callable[[str], contextlib.AbstractContextManager]]:
+        """Returns a callable which reports phases of a transfer to 'hooks'.
+
+        Args:
+            transfer_type (str): 'load', 'save', or 'stream'.
+            file_path (Optional[pathlib.Path]): path of the transferred file.
+                Defaults to None.
+            file_format (Optional[FileFormat]): format of the transferred file.
+                Defaults to None.
+
+        Returns:
+            Optional[Callable[[str], contextlib.AbstractContextManager]]: 
+                callable which is passed a phase and returns the context 
+                manager from '_observe', or None if 'hooks' is None.
+            
+        """
+        if self.hooks is None:
+            return None
+        return functools.partial(
+            self._observe,
+            transfer_type = transfer_type,
+            file_path = file_path,
+            file_format = file_format)
+
+    def _get_size(self, path: pathlib.Path) -> Optional[int]:
+        """Returns the size of the file at 'path' or None if it is not a file.
+
+        Args:
+            path (pathlib.Path): path of a transferred file.
+
+        Returns:
+            Optional[int]: size of the file in bytes.
+            
+        """
+        try:
+            status = path.stat()
+        except (OSError, AttributeError):
+            return None
+        return status.st_size if stat.S_ISREG(status.st_mode) else None
+    
+    def _prepare_many(
+        self,
+        path: pathlib.Path | str,
+        folder: Optional[pathlib.Path | str],
+        transfer_type: str,
+        file_format: Optional[str | FileFormat] = None,
+        **kwargs: Any) -> tuple[pathlib.Path, FileFormat, dict[str, Any]]:
+        """Prepares a single transfer for 'load_many' or 'save_many'.
+
+        Args:
+            path (pathlib.Path | str): a complete file path or, if 'folder' is
+                passed, a file name within 'folder'.
+            folder (Optional[pathlib.Path | str]): a complete folder path or the
+                name of a folder.
+            transfer_type (str): either 'load' or 'save'.
+            file_format (Optional[str | FileFormat]): object with information 
+                about how the file should be transferred or the key to such an 
+                object. Defaults to None.
+            **kwargs: additional parameters to pass to the transfer method.
+
+        Returns:
+            tuple[pathlib.Path, FileFormat, dict[str, Any]]: the file path, file
+                format, and parameters for the transfer.
+            
+        """
+        if folder:
+            return self._resolve(
+                file_path = None,
+                folder = folder,
+                file_name = str(path),
+                transfer_type = transfer_type,
+                file_format = file_format,
+                **kwargs)
+        else:
+            return self._resolve(
+                file_path = path,
+                folder = None,
+                file_name = None,
+                transfer_type = transfer_type,
+                file_format = file_format,
+                **kwargs)
+    
     def _prepare_transfer( 
         self,
         file_path: pathlib.Path | str,
@@ -448,14 +1589,65 @@ class FileManager(object):
             tuple: of a completed Path instance and FileFormat instance.
 
         """
-        extension = None
+        try:
+            key = (
+                file_path, 
+                folder, 
+                file_name, 
+                transfer_type,
+                file_format if isinstance(file_format, str) else id(file_format),
+                self.input_folder,
+                self.output_folder,
+                self.framework.version)
+            return self._plans[key]
+        except TypeError:
+            key = None
+        except KeyError:
+            pass
+        resolved = self._resolve_transfer(
+            file_path = file_path,
+            folder = folder,
+            file_name = file_name,
+            transfer_type = transfer_type,
+            file_format = file_format)
+        if key is not None:
+            if len(self._plans) >= self.plan_limit:
+                self._plans.clear()
+            # The FileFormat instance in 'resolved' keeps 'id(file_format)' 
+            # from being reused while the key is stored.
+            self._plans[key] = resolved
+        return resolved
+    
+    def _resolve_transfer( 
+        self,
+        file_path: pathlib.Path | str,
+        folder: pathlib.Path | str,
+        file_name: str,
+        transfer_type: str,
+        file_format: Optional[str | FileFormat] = None) -> (
+            tuple[pathlib.Path, FileFormat]):
+        """Resolves the path and file format of a transfer.
+        
+        Arguments are the same as those for '_prepare_transfer', which stores
+        the results of this method.
+
+        Returns:
+            tuple: of a completed Path instance and FileFormat instance.
+
+        """
+        extension = name = None
         if file_path:
             file_path = self.validate(path = file_path)
-            extension = file_path.suffix[1:] 
+            name = file_path.name
         elif file_name and '.' in file_name:
-            extension = camina.cleave_str(file_name, divider = '.')[-1]
-        if extension and not file_format:
-            file_format = self.extensions[extension]    
+            name = file_name
+        if name:
+            extension, key = self._match_extension(name = name)
+            if extension and not file_format:
+                if key is None:
+                    raise KeyError(
+                        f'{extension} is not a recognized file extension')
+                file_format = key
         file_format = self._validate_file_format(file_format = file_format)
         extension = extension or self._get_extension(file_format = file_format)
         if not folder:
@@ -473,6 +1665,134 @@ class FileManager(object):
                 extension = extension)
         return file_path, file_format
 
+    def _match_format(self, name: str) -> Optional[str]:
+        """Returns the key of the file format for file 'name', if any.
+
+        Args:
+            name (str): file name.
+
+        Returns:
+            Optional[str]: key in 'framework.formats' or 'framework.manifest' 
+                or None if 'name' has no registered extension.
+            
+        """
+        return self._match_extension(name = name)[1]
+    
+    def _match_extension(
+        self, 
+        name: str) -> tuple[Optional[str], Optional[str]]:
+        """Finds the longest registered extension at the end of 'name'.
+        
+        Multi-part extensions (e.g., 'csv.gz') are matched before their shorter
+        tails, so each candidate is a single dict lookup in 'extensions'. If 
+        nothing matches and the last suffix is a compression codec in 
+        'framework.codecs', the codec suffix is dropped and 'name' is matched
+        again.
+
+        Args:
+            name (str): file name, which may include several suffixes.
+
+        Returns:
+            tuple[Optional[str], Optional[str]]: the matched extension and the
+                key of its file format in 'framework.formats'. If no registered
+                extension matches, the last suffix of 'name' (or None if there 
+                is no suffix) and None are returned.
+            
+        """
+        extensions = self.extensions
+        suffix = name.partition('.')[2]
+        while suffix:
+            if suffix in extensions:
+                return suffix, extensions[suffix]
+            suffix = suffix.partition('.')[2]
+        if '.' in name:
+            stem, _, suffix = name.rpartition('.')
+            if suffix in self.framework.codecs and '.' in stem:
+                return self._match_extension(name = stem)
+            return suffix, None
+        return None, None
+        
+    def _transfer_many(
+        self,
+        transfers: Sequence[tuple[pathlib.Path, FileFormat, dict[str, Any]]],
+        transfer_type: str,
+        as_completed: bool) -> Iterator[tuple[pathlib.Path, Any]]:
+        """Submits 'transfers' to executors and yields their results.
+        
+        One executor is created for each type of concurrency needed by the 
+        file formats in 'transfers'. Process workers first import the modules 
+        of the formats' 'packages' already imported by this process (see 
+        'lazy.snapshot'), so spawned workers do not each import them during 
+        their first transfer. 
+        Executors are shut down once every result has been yielded.
+
+        Args:
+            transfers (Sequence[tuple[pathlib.Path, FileFormat, dict[str, 
+                Any]]]): file paths, file formats, and parameters for each 
+                transfer.
+            transfer_type (str): name of the FileFormat method to call.
+            as_completed (bool): whether to yield results as they finish (True)
+                or in the order of 'transfers' (False).
+
+        Yields:
+            Iterator[tuple[pathlib.Path, Any]]: file path and result of each
+                transfer.
+            
+        """
+        workers = self._get_workers(count = len(transfers))
+        packages = {
+            p 
+            for _, f, _ in transfers if f.concurrency == 'process' 
+            for p in f.packages}
+        with contextlib.ExitStack() as stack:
+            executors = {}
+            futures = {}
+            for file_path, file_format, parameters in transfers:
+                kind = file_format.concurrency
+                if kind not in executors:
+                    executor = lazy.from_import_path(
+                        path = self.framework.executors[kind])
+                    options = {}
+                    if kind == 'process':
+                        options = {
+                            'initializer': lazy.preload,
+                            'initargs': (
+                                lazy.snapshot(packages = packages),)}
+                    executors[kind] = stack.enter_context(
+                        executor(max_workers = workers, **options))
+                codec = self._get_codec(
+                    file_path = file_path, 
+                    transfer_type = transfer_type)
+                if transfer_type == 'save':
+                    future = executors[kind].submit(
+                        _write,
+                        file_format = file_format,
+                        path = file_path, 
+                        codec = codec,
+                        folder = self.interim_folder,
+                        **parameters)
+                elif codec is None:
+                    future = executors[kind].submit(
+                        file_format.load, 
+                        path = file_path, 
+                        **parameters)
+                else:
+                    future = executors[kind].submit(
+                        compression.load,
+                        file_format = file_format,
+                        path = file_path, 
+                        codec = codec,
+                        folder = self.interim_folder,
+                        **parameters)
+                futures[future] = file_path
+            if as_completed:
+                import concurrent.futures
+                completed = concurrent.futures.as_completed(futures)
+            else:
+                completed = futures
+            for future in completed:
+                yield futures[future], future.result()
+        
     def _get_extension(self, file_format: str | FileFormat) -> str:
         """Returns a str file extension.
 
@@ -482,17 +1802,14 @@ class FileManager(object):
 
         Raises:
             KeyError: if 'file_format' is a str but does not match any known
-                file format in 'framework.formats'.
+                file format in 'framework.formats' or 'framework.manifest'.
 
         Returns:
             str: file extension to use.
 
         """
         if isinstance(file_format, str):
-            try:
-                file_format = self.framework.formats[file_format]
-            except KeyError:
-                raise KeyError(f'{file_format} is not a recognized file format')
+            file_format = self.framework.get_format(name = file_format)
         if isinstance(file_format.extensions, str):
             return file_format.extensions
         else:
@@ -509,7 +1826,7 @@ class FileManager(object):
 
         Raises:
             KeyError: if 'file_format' is a str but does not match any known
-                file format in 'framework.formats'.
+                file format in 'framework.formats' or 'framework.manifest'.
             TypeError: if 'file_format' is neither a str nor FileFormat type.
 
         Returns:
@@ -517,10 +1834,7 @@ class FileManager(object):
 
         """
         if isinstance(file_format, str):
-            try:
-                return self.framework.formats[file_format]
-            except KeyError:
-                raise KeyError(f'{file_format} is not a recognized file format')
+            return self.framework.get_format(name = file_format)
         elif isinstance(file_format, FileFormat):
             return file_format
         else:
@@ -548,8 +1862,9 @@ class FileManager(object):
     
     def _validate_io_folders(self) -> None:
         """Validates all import and export paths."""
-        all_attributes = miller.name_variables(item = self)
-        io_attributes = [a for a in all_attributes if a.endswith('_folder')]
+        io_attributes = [
+            f.name for f in dataclasses.fields(self) 
+            if f.name.endswith('_folder')]
         for attribute in io_attributes:
             value = getattr(self, attribute)
             path = self._validate_io_folder(path = value)
@@ -574,4 +1889,139 @@ class FileManager(object):
         """
         pathlib.Path.mkdir(folder, parents = True, exist_ok = True)
         return
-    
\ No newline at end of file
+    
+
+
+@dataclasses.dataclass(frozen = True)
+class TransferPlan(object):
+    """Resolved file transfer created by FileManager.plan.
+
+    Args:
+        manager (FileManager): manager which created the plan.
+        file_path (pathlib.Path): resolved path of the file.
+        file_format (FileFormat): resolved format of the file.
+        transfer_type (str): either 'load' or 'save'.
+        parameters (Mapping[Hashable, Any]): resolved parameters for the 
+            transfer method of 'file_format'.
+
+    """
+    manager: FileManager
+    file_path: pathlib.Path
+    file_format: FileFormat
+    transfer_type: str
+    parameters: Mapping[Hashable, Any]
+    
+    """ Public Methods """
+    
+    def load(self, **kwargs: Any) -> Any:
+        """Loads the planned file.
+
+        Args:
+            **kwargs: parameters which override those in 'parameters'.
+
+        Raises:
+            ValueError: if the plan is not for loading.
+            
+        Returns:
+            Any: loaded item.
+            
+        """
+        self._check(transfer_type = 'load')
+        return self.manager._execute_load(
+            file_path = self.file_path,
+            file_format = self.file_format,
+            parameters = {**self.parameters, **kwargs})
+    
+    def save(
+        self, 
+        item: Any, 
+        **kwargs: Any) -> Optional[concurrent.futures.Future]:
+        """Saves 'item' to the planned file.
+
+        Args:
+            item (Any): object to save.
+            **kwargs: parameters which override those in 'parameters'.
+
+        Raises:
+            ValueError: if the plan is not for saving.
+            
+        Returns:
+            Optional[concurrent.futures.Future]: future of the save if the
+                manager's 'write_behind' is True. Otherwise, None.
+            
+        """
+        self._check(transfer_type = 'save')
+        return self.manager._execute_save(
+            file_path = self.file_path,
+            file_format = self.file_format,
+            parameters = {**self.parameters, **kwargs},
+            item = item)
+    
+    """ Private Methods """
+    
+    def _check(self, transfer_type: str) -> None:
+        """Raises ValueError if the plan is not for 'transfer_type'."""
+        if self.transfer_type != transfer_type:
+            raise ValueError(
+                f'the plan is for {self.transfer_type}, not {transfer_type}')
+        return
+            
+
+""" Private Functions """
+
+_UNOBSERVED = contextlib.nullcontext()
+
+def _write(
+    file_format: FileFormat,
+    path: pathlib.Path,
+    codec: Optional[compression.Codec],
+    folder: pathlib.Path | str,
+    threads: int = -1,
+    **kwargs: Any) -> None:
+    """Saves a file with 'file_format', atomically if the format allows.
+    
+    Atomic saves write to a hidden temporary file next to 'path' (so that the
+    temporary file ends with the same extensions) which then replaces 'path' 
+    with 'os.replace'. If the save fails, the temporary file is removed and 
+    any existing file at 'path' is left untouched. Existing folders (e.g., 
+    partitioned datasets) are written in place because a folder cannot 
+    replace another folder that is not empty.
+
+    Args:
+        file_format (FileFormat): format of the file at 'path'.
+        path (pathlib.Path): path of the file to save.
+        codec (Optional[compression.Codec]): codec to compress the file with or
+            None if it should not be compressed.
+        folder (pathlib.Path | str): folder for temporary files used for 
+            compression.
+        threads (int): number of threads to compress with, if 'codec' supports
+            it. Defaults to -1.
+        kwargs: the item to save and additional arguments passed to the 'save' 
+            method of 'file_format'.
+        
+    """
+    if file_format.atomic and not path.is_dir():
+        target = path.with_name(f'.{os.urandom(6).hex()}-{path.name}')
+    else:
+        target = path
+    try:
+        if codec is None:
+            file_format.save(path = target, **kwargs)
+        else:
+            compression.save(
+                file_format = file_format,
+                path = target,
+                codec = codec,
+                folder = folder,
+                threads = threads,
+                **kwargs)
+        if target is not path:
+            os.replace(target, path)
+    except BaseException:
+        if target is not path and target.is_dir():
+            import shutil
+            shutil.rmtree(target, ignore_errors = True)
+        elif target is not path:
+            target.unlink(missing_ok = True)
+        raise
+    return
@@ -27,14 +27,12 @@ ToDo:
 """
 from __future__ import annotations
 import abc
-from collections.abc import Hashable, Mapping, MutableMapping, Sequence
-import contextlib
+from collections.abc import Iterator, Mapping, Sequence
 import dataclasses
 import importlib
 import importlib.util
 import pathlib
-import sys
-from typing import Any, ClassVar, Optional, Type
+from typing import Any, ClassVar, Optional
 
 from . import core
 
@@ -56,40 +54,190 @@ class FileFormatPickle(core.FileFormat):
         
     """
     extensions: ClassVar[str | Sequence[str]] = ('pickle', 'pkl')
-    load_parameters: ClassVar[Optional[Mapping[str, str]]] = {}
-    save_parameters: ClassVar[Optional[Mapping[str, str]]] = {}
+    load_parameters: ClassVar[Optional[Mapping[str, str]]] = {
+        'memory_map': 'memory_map'}
+    save_parameters: ClassVar[Optional[Mapping[str, str]]] = {
+        'protocol': 'pickle_protocol'}
+    buffers: ClassVar[bool] = True
+    sequential: ClassVar[bool] = True
+    signature: ClassVar[bytes] = b'NAGATA-PICKLE-5\n'
+    alignment: ClassVar[int] = 64
     
-    def load(self, path: pathlib.Path | str, **kwargs) -> object:
+    """ Public Methods """
+    
+    def load(
+        self, 
+        path: pathlib.Path | str, 
+        memory_map: bool = False,
+        **kwargs) -> object:
         """Loads a pickled object.
+        
+        Ordinary pickles are read with buffered binary I/O. Files written with
+        'out_of_band' set to True are recognized by 'signature' and their 
+        buffers are handed to pickle as views of the file's contents, so large
+        arrays are not copied again after being read. If 'memory_map' is also 
+        True, the views reference a read-only memory map of the file, so 
+        nothing is copied at all and arrays are read-only.
 
         Args:
-            path (pathlib.Path | str): path to a pickled object.
+            path (pathlib.Path | str): path to a pickled object or a binary 
+                file-like object.
+            memory_map (bool): whether to memory map files written with 
+                out-of-band buffers. Defaults to False.
+            kwargs: additional arguments passed to 'pickle.load'.
 
         Returns:
             object: item loaded from 'path'.
             
         """   
-        a_file = open(path, 'r', **kwargs)
-        if 'pickle' not in sys.modules:
-            import pickle
-        loaded = pickle.load(a_file)
-        a_file.close()
-        return loaded
+        import pickle
+        if hasattr(path, 'read'):
+            data = path.read()
+            if data.startswith(self.signature):
+                return self._unpack(data = memoryview(data), **kwargs)
+            return pickle.loads(data, **kwargs)
+        with open(path, 'rb') as a_file:
+            if a_file.peek(len(self.signature)).startswith(self.signature):
+                if memory_map:
+                    import mmap
+                    data = mmap.mmap(
+                        a_file.fileno(), 
+                        0, 
+                        access = mmap.ACCESS_READ)
+                else:
+                    import os
+                    data = bytearray(os.fstat(a_file.fileno()).st_size)
+                    a_file.readinto(data)
+                return self._unpack(data = memoryview(data), **kwargs)
+            return pickle.load(a_file, **kwargs)
 
-    def save(self, item: Any, path: pathlib.Path | str, **kwargs) -> None:
-        """Pickles 'item' at 'path.
+    def save(
+        self, 
+        item: Any, 
+        path: pathlib.Path | str, 
+        protocol: Optional[int] = None,
+        out_of_band: bool = False,
+        memory_map: bool = False,
+        **kwargs) -> None:
+        """Pickles 'item' at 'path'.
+        
+        If 'out_of_band' is True, objects which support pickle protocol 5 
+        buffers (e.g., numpy arrays and pandas dataframes) are not copied into 
+        the pickle stream. Instead, their memory is written straight to the file
+        after it, aligned to 'alignment' bytes, and 'load' restores the objects 
+        around views of that memory. Such files can only be read by this 
+        format.
 
         Args:
             item (Any): item to pickle.
-            path (pathlib.Path | str): path where 'item' should be pickled
+            path (pathlib.Path | str): path where 'item' should be pickled.
+            protocol (Optional[int]): pickle protocol to use. If None, the 
+                highest available protocol is used. Out-of-band buffers require
+                protocol 5 or higher. Defaults to None.
+            out_of_band (bool): whether to write buffers outside of the pickle 
+                stream. Defaults to False.
+            memory_map (bool): whether to write an out-of-band file through a 
+                memory map of it instead of through buffered writes. Defaults 
+                to False.
+            kwargs: additional arguments passed to 'pickle.dump'.
             
         """   
-        a_file = open(path, 'w', **kwargs)
-        if 'pickle' not in sys.modules:
-            import pickle
-        pickle.dump(item, a_file)
-        a_file.close()
+        import pickle
+        if protocol is None:
+            protocol = pickle.HIGHEST_PROTOCOL
+        if not out_of_band:
+            with open(path, 'wb') as a_file:
+                pickle.dump(item, a_file, protocol = protocol, **kwargs)
+            return
+        if protocol < 5:
+            raise ValueError('out-of-band buffers require pickle protocol 5')
+        buffers = []
+        stream = pickle.dumps(
+            item, 
+            protocol = protocol, 
+            buffer_callback = buffers.append,
+            **kwargs)
+        views = [b.raw() for b in buffers]
+        header, offsets, size = self._pack(stream = stream, views = views)
+        if memory_map:
+            import mmap
+            with open(path, 'w+b') as a_file:
+                a_file.truncate(size)
+                with mmap.mmap(a_file.fileno(), size) as mapped:
+                    mapped[:len(header)] = header
+                    start = len(header)
+                    mapped[start:start + len(stream)] = stream
+                    for view, offset in zip(views, offsets):
+                        mapped[offset:offset + view.nbytes] = view
+        else:
+            with open(path, 'wb') as a_file:
+                a_file.write(header)
+                a_file.write(stream)
+                position = len(header) + len(stream)
+                for view, offset in zip(views, offsets):
+                    a_file.write(bytes(offset - position))
+                    a_file.write(view)
+                    position = offset + view.nbytes
         return
+    
+    """ Private Methods """
+    
+    def _pack(
+        self, 
+        stream: bytes, 
+        views: list[memoryview]) -> tuple[bytes, list[int], int]:
+        """Lays out a file with out-of-band buffers.
+        
+        The file contains 'signature', the number of buffers and the length of
+        'stream', the offset and length of each buffer, 'stream', and then each
+        buffer starting at a multiple of 'alignment'.
+
+        Args:
+            stream (bytes): pickle stream.
+            views (list[memoryview]): contiguous views of out-of-band buffers.
+
+        Returns:
+            tuple[bytes, list[int], int]: header, offset of each buffer, and
+                total size of the file.
+            
+        """
+        import struct
+        length = len(self.signature) + 16 + 16 * len(views)
+        position = length + len(stream)
+        offsets = []
+        for view in views:
+            position += -position % self.alignment
+            offsets.append(position)
+            position += view.nbytes
+        header = b''.join([
+            self.signature,
+            struct.pack('<QQ', len(views), len(stream)),
+            *(struct.pack('<QQ', o, v.nbytes) for o, v in zip(offsets, views))])
+        return header, offsets, position
+        
+    def _unpack(self, data: memoryview, **kwargs) -> object:
+        """Loads an object written with out-of-band buffers.
+
+        Args:
+            data (memoryview): contents of the file.
+            kwargs: additional arguments passed to 'pickle.loads'.
+
+        Returns:
+            object: unpickled item.
+            
+        """
+        import pickle
+        import struct
+        position = len(self.signature)
+        count, length = struct.unpack_from('<QQ', data, position)
+        position += 16
+        buffers = []
+        for _ in range(count):
+            offset, size = struct.unpack_from('<QQ', data, position)
+            position += 16
+            buffers.append(data[offset:offset + size])
+        stream = data[position:position + length]
+        return pickle.loads(stream, buffers = buffers, **kwargs)
 
 
 @dataclasses.dataclass
@@ -143,6 +291,98 @@ class FileFormatText(core.FileFormat):
         return   
 
 
+@dataclasses.dataclass
+class FileFormatNumpy(core.FileFormat):
+    """File format information, loader, and saver.
+
+    Args:
+        extensions (Optional[Union[str, Sequence[str]]]): str file extension(s)
+            associated with the format. If more than one is listed, the first 
+            one is used for saving new files and all will be used for loading. 
+            Defaults to None.
+        parameters (Mapping[str, str]]): shared parameters to use from the pool 
+            of settings in FileFramework.settings where the key is the parameter 
+            name that the load or save method should use and the value is the 
+            key for the argument in the shared parameters. Defaults to an empty 
+            dict. 
+        
+    """
+    extensions: ClassVar[str | Sequence[str]] = ('npy', 'npz')
+    load_parameters: ClassVar[Optional[Mapping[str, str]]] = {
+        'memory_map': 'memory_map'}
+    save_parameters: ClassVar[Optional[Mapping[str, str]]] = {}
+    
+    """ Public Methods """
+    
+    def load(
+        self, 
+        path: pathlib.Path | str, 
+        memory_map: bool = False,
+        **kwargs) -> object:
+        """Loads a numpy array or an archive of numpy arrays.
+        
+        If 'memory_map' is True and 'mmap_mode' is not passed, '.npy' files are
+        opened read-only with 'mmap_mode' set to 'r'. Archives ('.npz') are 
+        always read lazily, one array at a time.
+
+        Args:
+            path (pathlib.Path | str): path to numpy file.
+            memory_map (bool): whether to memory map the file. Defaults to 
+                False.
+
+        Returns:
+            object: numpy array or, for '.npz' files, a mapping of names to 
+                arrays.
+            
+        """
+        import numpy
+        if memory_map:
+            kwargs.setdefault('mmap_mode', 'r')
+        return numpy.load(path, **kwargs)
+    
+    def describe(self, path: pathlib.Path | str, **kwargs) -> dict[str, Any]:
+        """Returns the shape and type of a '.npy' array without reading it.
+
+        Args:
+            path (pathlib.Path | str): path to numpy file.
+
+        Returns:
+            dict[str, Any]: 'shape', 'dtype', and 'rows' of the array or an 
+                empty dict for archives of arrays.
+            
+        """
+        import numpy
+        array = numpy.load(path, mmap_mode = 'r')
+        if not isinstance(array, numpy.ndarray):
+            array.close()
+            return {}
+        return {
+            'shape': array.shape, 
+            'dtype': array.dtype, 
+            'rows': array.shape[0] if array.shape else 1}
+    
+    def save(self, item: Any, path: pathlib.Path | str, **kwargs) -> None:
+        """Saves 'item' to a numpy file at 'path'.
+        
+        Mappings of names to arrays are saved as '.npz' archives. Everything
+        else is saved as a single '.npy' array. The file is written through an
+        open handle so that numpy does not add an extension to 'path', which
+        must stay the path that the manager expects.
+
+        Args:
+            item (Any): numpy array or mapping of names to numpy arrays.
+            path (pathlib.Path | str): path to which 'item' should be saved.
+            
+        """
+        import numpy
+        with open(path, 'wb') as a_file:
+            if isinstance(item, Mapping):
+                numpy.savez(a_file, **item, **kwargs)
+            else:
+                numpy.save(a_file, item, **kwargs)
+        return
+
+
 @dataclasses.dataclass
 class FileFormatPandas(core.FileFormat, abc.ABC):
     """File format information, loader, and saver.
@@ -164,14 +404,26 @@ class FileFormatPandas(core.FileFormat, abc.ABC):
     save_parameters: ClassVar[Optional[Mapping[str, str]]] = {}
     loader: ClassVar[str] = None
     saver: ClassVar[str] = None
+    chunker: ClassVar[Optional[str]] = None
+    buffers: ClassVar[bool] = True
+    categorical_threshold: ClassVar[float] = 0.5
+    packages: ClassVar[Sequence[str]] = ('nagata', 'numpy', 'pandas', 'pyarrow')
 
     """ Public Methods """
     
-    def load(self, path: pathlib.Path | str, **kwargs) -> object:
+    def load(
+        self, 
+        path: pathlib.Path | str, 
+        conserve_memory: bool | str = False,
+        **kwargs) -> object:
         """Loads a file to a pandas dataframe.
 
         Args:
             path (pathlib.Path | str): path to pandas dataframe.
+            conserve_memory (bool | str): whether to shrink the loaded 
+                dataframe with 'shrink' before returning it. If it is 
+                'arrow', str columns that are not made categorical are also 
+                converted to pyarrow-backed strings. Defaults to False.
 
         Raises:
             NotImplementedError: if 'loader' is None.
@@ -185,10 +437,134 @@ class FileFormatPandas(core.FileFormat, abc.ABC):
             raise NotImplementedError(
                 'pandas does not support loading for this data type')
         else:
-            if 'pandas' not in sys.modules:
-                import pandas 
+            import pandas
             loader = getattr(pandas, self.loader)
-            return loader(path, **kwargs)
+            loaded = loader(path, **kwargs)
+            if conserve_memory and isinstance(loaded, pandas.DataFrame):
+                loaded = self.shrink(
+                    item = loaded, 
+                    arrow_strings = conserve_memory == 'arrow')
+            return loaded
+    
+    def shrink(
+        self, 
+        item: object, 
+        arrow_strings: bool = False) -> object:
+        """Converts columns of 'item' to the smallest dtypes that are lossless.
+        
+        Integers are downcast to the smallest integer type that holds their 
+        range, floats are downcast to float32 only if no values change, and str 
+        columns with a share of unique values at or below 
+        'categorical_threshold' become categoricals. The number of bytes saved
+        is stored in 'item.attrs['memory_saved']'.
+
+        Args:
+            item (object): pandas dataframe to shrink. It is modified in place.
+            arrow_strings (bool): whether to convert str columns which are not
+                made categorical to pyarrow-backed strings. Defaults to False.
+
+        Returns:
+            object: pandas dataframe with smaller dtypes.
+            
+        """
+        import pandas
+        before = int(item.memory_usage(deep = True).sum())
+        for index in range(item.shape[1]):
+            column = item.iloc[:, index]
+            kind = column.dtype.kind
+            if kind == 'i':
+                column = pandas.to_numeric(column, downcast = 'integer')
+            elif kind == 'u':
+                column = pandas.to_numeric(column, downcast = 'unsigned')
+            elif kind == 'f' and column.dtype.itemsize > 4:
+                smaller = column.astype('float32')
+                if (smaller.astype(column.dtype).eq(column) 
+                        | column.isna()).all():
+                    column = smaller
+            elif (
+                pandas.api.types.is_object_dtype(column.dtype)
+                or pandas.api.types.is_string_dtype(column.dtype)):
+                column = self._shrink_strings(
+                    column = column, 
+                    arrow_strings = arrow_strings)
+            item.isetitem(index, column)
+        after = int(item.memory_usage(deep = True).sum())
+        item.attrs['memory_saved'] = before - after
+        return item
+    
+    def stream(
+        self, 
+        path: pathlib.Path | str, 
+        chunk_size: int, 
+        **kwargs) -> Iterator[object]:
+        """Loads a file as a series of pandas dataframes.
+
+        Args:
+            path (pathlib.Path | str): path to pandas dataframe.
+            chunk_size (int): number of rows in each dataframe.
+
+        Raises:
+            NotImplementedError: if 'loader' or 'chunker' is None.
+            
+        Returns:
+            Iterator[object]: pandas dataframes with up to 'chunk_size' rows.
+            
+        """
+        if self.loader is None or self.chunker is None:
+            raise NotImplementedError(
+                'pandas does not support streaming for this data type')
+        import pandas
+        loader = getattr(pandas, self.loader)
+        kwargs[self.chunker] = chunk_size
+        return self._iterate(reader = loader(path, **kwargs))
+    
+    """ Private Methods """
+    
+    def _shrink_strings(
+        self, 
+        column: object, 
+        arrow_strings: bool) -> object:
+        """Converts a str column to a categorical or pyarrow-backed strings.
+
+        Args:
+            column (object): pandas series with str values.
+            arrow_strings (bool): whether to convert 'column' to pyarrow-backed 
+                strings if it is not made categorical.
+
+        Returns:
+            object: converted pandas series or 'column' if it could not be 
+                converted.
+            
+        """
+        if len(column) == 0:
+            return column
+        try:
+            unique = column.nunique(dropna = True)
+        except TypeError:
+            # Columns holding unhashable values (e.g., lists) are left as is.
+            return column
+        if unique / len(column) <= self.categorical_threshold:
+            return column.astype('category')
+        elif arrow_strings:
+            return column.astype('string[pyarrow]')
+        else:
+            return column
+        
+    def _iterate(self, reader: Iterator[object]) -> Iterator[object]:
+        """Yields chunks from 'reader' and closes it when finished.
+
+        Args:
+            reader (Iterator[object]): chunked reader returned by pandas.
+
+        Yields:
+            Iterator[object]: pandas dataframes.
+            
+        """
+        try:
+            yield from reader
+        finally:
+            if hasattr(reader, 'close'):
+                reader.close()
     
     def save(self, item: object, path: pathlib.Path | str, **kwargs) -> None:
         """Saves dataframe 'item' to a file at 'path'.
@@ -231,13 +607,191 @@ class FileFormatCSV(FileFormatPandas):
         'encoding': 'file_encoding',
         'index_col': 'index_column',
         'header': 'header',
-        'nrows': 'test_size'}
+        'nrows': 'test_size',
+        'conserve_memory': 'conserve_memory',
+        'threads': 'threads',
+        'split_size': 'split_size'}
     save_parameters: ClassVar[Optional[Mapping[str, str]]] = {
         'encoding': 'file_encoding',
         'header': 'header',
         'index': 'index_column'}
+    stream_parameters: ClassVar[Optional[Mapping[str, str]]] = {
+        'encoding': 'file_encoding',
+        'index_col': 'index_column',
+        'header': 'header'}
     loader: ClassVar[str] = 'read_csv'
     saver: ClassVar[str] = 'to_csv'
+    sequential: ClassVar[bool] = True
+    sidecar: ClassVar[bool] = True
+    chunker: ClassVar[Optional[str]] = 'chunksize'
+    concurrency: ClassVar[str] = 'process'
+    serial_options: ClassVar[tuple[str, ...]] = (
+        'nrows', 'skiprows', 'skipfooter', 'chunksize', 'iterator', 
+        'lineterminator', 'compression', 'escapechar')
+    
+    """ Public Methods """
+    
+    def load(
+        self, 
+        path: pathlib.Path | str, 
+        conserve_memory: bool | str = False,
+        threads: Optional[int] = -1,
+        split_size: Optional[int] = None,
+        **kwargs) -> object:
+        """Loads a csv file to a pandas dataframe, in parallel if it is large.
+        
+        Files of at least twice 'split_size' bytes are split into byte ranges
+        which end at newlines. The ranges are parsed in a process pool with up
+        to 'threads' workers and the results are concatenated. Columns whose 
+        type is text in some ranges but not others are parsed again as text in 
+        those ranges, so the combined column holds only text. Numeric columns
+        are combined with the usual pandas upcasting (e.g., integers with 
+        missing values become floats).
+        
+        A newline inside a quoted field cannot be told apart from the end of a
+        row without reading the file from the start. The quote characters in 
+        each range are counted, and if any range would start inside quotes, 
+        the parallel results are discarded and the file is parsed serially.
+        
+        Buffers, files that are not large enough, and loads with an option 
+        that depends on the position of rows in the whole file (listed in 
+        'serial_options'), a 'header' that is not the first row, or an 
+        encoding whose newline is not the byte b'\\n' are parsed serially.
+
+        Args:
+            path (pathlib.Path | str): path to csv file.
+            conserve_memory (bool | str): whether to shrink the loaded 
+                dataframe with 'shrink' before returning it. Defaults 
+                to False.
+            threads (Optional[int]): maximum number of processes to parse with.
+                Values less than 1 (or None) use every core. Defaults to -1.
+            split_size (Optional[int]): smallest number of bytes parsed by each
+                process. If None, the file is parsed serially. Defaults to 
+                None.
+
+        Returns:
+            object: pandas dataframe.
+            
+        """
+        ranges = self._split(
+            path = path, 
+            threads = threads, 
+            split_size = split_size, 
+            **kwargs)
+        if len(ranges) < 2:
+            return super().load(
+                path = path, 
+                conserve_memory = conserve_memory, 
+                **kwargs)
+        import pandas
+        loaded = _read_csv_ranges(path = path, ranges = ranges, **kwargs)
+        if loaded is None:
+            loaded = pandas.read_csv(path, **kwargs)
+        if conserve_memory:
+            loaded = self.shrink(
+                item = loaded, 
+                arrow_strings = conserve_memory == 'arrow')
+        return loaded
+    
+    def describe(
+        self, 
+        path: pathlib.Path | str, 
+        encoding: Optional[str] = None,
+        index_col: Optional[Any] = None,
+        header: Optional[Any] = 'infer',
+        conserve_memory: bool | str = False,
+        threads: Optional[int] = -1,
+        split_size: Optional[int] = None,
+        **kwargs) -> dict[str, Any]:
+        """Returns the columns of a csv file from its header row.
+        
+        Counting rows requires reading the whole file, so they are not 
+        returned. Column types are inferred from the rows, so they are not 
+        returned either.
+
+        Args:
+            path (pathlib.Path | str): path to csv file.
+            encoding (Optional[str]): encoding of the file. Defaults to None.
+            index_col (Optional[Any]): column(s) to use as the index. Defaults 
+                to None.
+            header (Optional[Any]): row(s) to use as the column names. Defaults
+                to 'infer'.
+            conserve_memory (bool | str): unused because column types are not
+                returned. Defaults to False.
+            threads (Optional[int]): unused. Defaults to -1.
+            split_size (Optional[int]): unused. Defaults to None.
+            kwargs: arguments that will be passed to 'pandas.read_csv' when the
+                file is loaded (e.g., 'sep', 'usecols', or 'names'). Options 
+                that select or group rows (e.g., 'nrows' or 'chunksize') are 
+                ignored.
+
+        Returns:
+            dict[str, Any]: 'columns' of the file.
+            
+        """
+        import pandas
+        for option in ('nrows', 'skipfooter', 'chunksize', 'iterator'):
+            kwargs.pop(option, None)
+        empty = pandas.read_csv(
+            path, 
+            encoding = encoding, 
+            index_col = index_col, 
+            header = header, 
+            nrows = 0,
+            **kwargs)
+        return {'columns': empty.columns}
+    
+    """ Private Methods """
+    
+    def _split(
+        self,
+        path: pathlib.Path | str,
+        threads: Optional[int] = -1,
+        split_size: Optional[int] = None,
+        **kwargs) -> list[tuple[int, int]]:
+        """Returns newline-aligned byte ranges of 'path' to parse in parallel.
+
+        Args:
+            path (pathlib.Path | str): path to csv file.
+            threads (Optional[int]): maximum number of ranges. Values less than 
+                1 (or None) use the number of cores. Defaults to -1.
+            split_size (Optional[int]): smallest number of bytes in a range. 
+                Defaults to None.
+            kwargs: arguments that will be passed to 'pandas.read_csv'.
+
+        Returns:
+            list[tuple[int, int]]: start and end of each range. The first 
+                range starts at 0, so it includes any header row. It has fewer
+                than 2 items if the file should be parsed serially.
+            
+        """
+        import codecs
+        import multiprocessing
+        import os
+        if (
+            not split_size 
+            or hasattr(path, 'read')
+            or multiprocessing.parent_process() is not None
+            or any(kwargs.get(o) for o in self.serial_options)
+            or kwargs.get('header', 'infer') not in ('infer', 0, None)
+            or codecs.lookup(kwargs.get('encoding') or 'utf-8').name.startswith(
+                ('utf-16', 'utf-32'))):
+            return []
+        size = os.path.getsize(path)
+        if threads is None or threads < 1:
+            threads = os.cpu_count() or 1
+        count = min(threads, size // split_size)
+        if count < 2:
+            return []
+        starts = [0]
+        with open(path, 'rb') as a_file:
+            for index in range(1, count):
+                a_file.seek(size * index // count)
+                a_file.readline()
+                position = a_file.tell()
+                if starts[-1] < position < size:
+                    starts.append(position)
+        return list(zip(starts, starts[1:] + [size]))
 
 
 @dataclasses.dataclass
@@ -254,6 +808,10 @@ class FileFormatExcel(FileFormatPandas):
             name that the load or save method should use and the value is the 
             key for the argument in the shared parameters. Defaults to an empty 
             dict. 
+        engines (Sequence[tuple[str, str]]): names of faster pandas engines,
+            in order of preference, and the module that each requires. The 
+            first one that is installed is used when no engine is passed to
+            'load'. Defaults to calamine (from the 'python-calamine' package).
         
     """
     extensions: ClassVar[str | Sequence[str]] = ('xlsx', 'xls')
@@ -261,12 +819,126 @@ class FileFormatExcel(FileFormatPandas):
         'usecols': 'included_columns',
         'index_col': 'index_column',
         'header': 'header',
-        'nrows': 'test_size'}
+        'nrows': 'test_size',
+        'conserve_memory': 'conserve_memory',
+        'threads': 'threads'}
     save_parameters: ClassVar[Optional[Mapping[str, str]]] = {
         'header': 'header',
         'index': 'index_column'}
     loader: ClassVar[str] = 'read_excel'
     saver: ClassVar[str] = 'to_excel'
+    sidecar: ClassVar[bool] = True
+    concurrency: ClassVar[str] = 'process'
+    engines: ClassVar[Sequence[tuple[str, str]]] = (
+        ('calamine', 'python_calamine'),)
+    packages: ClassVar[Sequence[str]] = (
+        'nagata', 'numpy', 'pandas', 'pyarrow', 'openpyxl', 'xlrd', 'odf', 
+        'pyxlsb', 'python_calamine')
+    
+    """ Public Methods """
+    
+    def load(
+        self, 
+        path: pathlib.Path | str, 
+        sheet_name: Optional[str | int | Sequence[str | int]] = 0,
+        engine: Optional[str] = None,
+        threads: int = -1,
+        conserve_memory: bool | str = False,
+        **kwargs) -> object | dict[str | int, object]:
+        """Loads one or more sheets of a workbook.
+        
+        If 'sheet_name' is None or a sequence, the selected sheets (or every 
+        sheet if it is None) are parsed at the same time in separate worker 
+        processes. Starting the workers takes time, so this is only faster for
+        workbooks with several large sheets. Sheets are parsed one after 
+        another if only one worker is allowed, 'path' is a file-like object, or
+        the workbook is already being loaded in a worker process (e.g., by
+        FileManager.load_many).
+
+        Args:
+            path (pathlib.Path | str): path to an Excel workbook.
+            sheet_name (Optional[str | int | Sequence[str | int]]): name or 
+                index of the sheet to load, a sequence of them, or None for 
+                every sheet. Defaults to 0.
+            engine (Optional[str]): pandas engine to parse the workbook with. 
+                If None, the first engine in 'engines' that is installed is 
+                used or, if none are, pandas chooses. Defaults to None.
+            threads (int): maximum number of worker processes. Values less than
+                1 use every core. Defaults to -1.
+            conserve_memory (bool | str): whether to shrink loaded dataframes
+                with 'shrink'. Defaults to False.
+            kwargs: additional arguments passed to 'pandas.read_excel'.
+
+        Returns:
+            object | dict[str | int, object]: pandas dataframe if 'sheet_name'
+                is a str or int. Otherwise, a dict of dataframes keyed by sheet
+                name.
+            
+        """
+        import pandas
+        if engine is None:
+            engine = self._get_engine()
+        if kwargs.get('header') == 'infer':
+            kwargs['header'] = 0
+        if isinstance(sheet_name, (str, int)):
+            return super().load(
+                path, 
+                conserve_memory = conserve_memory,
+                sheet_name = sheet_name,
+                engine = engine,
+                **kwargs)
+        if sheet_name is None:
+            with pandas.ExcelFile(path, engine = engine) as workbook:
+                sheet_name = workbook.sheet_names
+            if hasattr(path, 'seek'):
+                path.seek(0)
+        sheets = list(sheet_name)
+        if threads is None or threads < 1:
+            import os
+            threads = os.cpu_count() or 1
+        workers = min(threads, len(sheets))
+        import multiprocessing
+        if (
+            workers > 1 
+            and not hasattr(path, 'read') 
+            and multiprocessing.parent_process() is None):
+            import concurrent.futures
+            from . import lazy
+            modules = lazy.snapshot(packages = self.packages)
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers = workers,
+                initializer = lazy.preload,
+                initargs = (modules,)) as executor:
+                futures = {
+                    s: executor.submit(
+                        pandas.read_excel, 
+                        path, 
+                        sheet_name = s, 
+                        engine = engine, 
+                        **kwargs)
+                    for s in sheets}
+                loaded = {s: f.result() for s, f in futures.items()}
+        else:
+            loaded = pandas.read_excel(
+                path, 
+                sheet_name = sheets, 
+                engine = engine, 
+                **kwargs)
+        if conserve_memory:
+            for key, frame in loaded.items():
+                loaded[key] = self.shrink(
+                    item = frame, 
+                    arrow_strings = conserve_memory == 'arrow')
+        return loaded
+    
+    """ Private Methods """
+    
+    def _get_engine(self) -> Optional[str]:
+        """Returns the first engine in 'engines' that is installed, if any."""
+        for engine, module in self.engines:
+            if importlib.util.find_spec(module) is not None:
+                return engine
+        return None
     
 
 @dataclasses.dataclass
@@ -287,10 +959,104 @@ class FileFormatFeather(FileFormatPandas):
     """
     extensions: ClassVar[str | Sequence[str]] = 'feather'
     load_parameters: ClassVar[Optional[Mapping[str, str]]] = {
-        'columns': 'included_columns'}
+        'columns': 'included_columns',
+        'filters': 'filters',
+        'conserve_memory': 'conserve_memory',
+        'memory_map': 'memory_map'}
     save_parameters: ClassVar[Optional[Mapping[str, str]]] = {}
     loader: ClassVar[str] = 'read_feather'
     saver: ClassVar[str] = 'to_feather'
+    
+    """ Public Methods """
+    
+    def load(
+        self, 
+        path: pathlib.Path | str, 
+        memory_map: bool = False,
+        as_table: bool = False,
+        filters: Optional[Sequence[Any]] = None,
+        **kwargs) -> object:
+        """Loads a feather file to a pandas dataframe or pyarrow table.
+        
+        If 'memory_map' is True, the file is mapped into memory instead of 
+        being read, so uncompressed columns reference the operating system's 
+        page cache rather than a private copy. Processes that map the same file
+        share that memory.
+        
+        Feather files do not store statistics, so rows are filtered by pyarrow
+        batch by batch as they are read. Rows that do not match 'filters' are 
+        never converted to pandas.
+
+        Args:
+            path (pathlib.Path | str): path to feather file.
+            memory_map (bool): whether to memory map the file. Defaults to 
+                False.
+            as_table (bool): whether to return the pyarrow table without 
+                converting it to a pandas dataframe. Defaults to False.
+            filters (Optional[Sequence[Any]]): row filters in the disjunctive 
+                normal form used by 'pyarrow.parquet.read_table' (e.g., 
+                [('date', '>=', start)]). Defaults to None.
+
+        Returns:
+            object: pandas dataframe or pyarrow table.
+            
+        """
+        if not memory_map and not as_table and not filters:
+            return super().load(path = path, **kwargs)
+        conserve_memory = kwargs.pop('conserve_memory', False)
+        if filters:
+            import pyarrow.dataset
+            import pyarrow.parquet
+            table = pyarrow.dataset.dataset(path, format = 'feather').to_table(
+                columns = kwargs.get('columns'),
+                filter = pyarrow.parquet.filters_to_expression(filters))
+        else:
+            import pyarrow.feather
+            table = pyarrow.feather.read_table(
+                path, 
+                memory_map = memory_map, 
+                **kwargs)
+        return _from_table(
+            table = table, 
+            file_format = self,
+            as_table = as_table, 
+            conserve_memory = conserve_memory)
+    
+    def describe(
+        self, 
+        path: pathlib.Path | str, 
+        columns: Optional[Sequence[str]] = None,
+        conserve_memory: bool | str = False,
+        as_table: bool = False,
+        **kwargs) -> dict[str, Any]:
+        """Returns the columns and column types of a feather file.
+        
+        Only the schema at the end of the file is read. Feather files do not
+        store the number of rows outside of their compressed batches, so rows 
+        are not returned.
+
+        Args:
+            path (pathlib.Path | str): path to feather file.
+            columns (Optional[Sequence[str]]): columns that will be loaded. If 
+                None, all columns are described. Defaults to None.
+            conserve_memory (bool | str): whether the loaded dataframe will be
+                shrunk, which changes its column types. Defaults to False.
+            as_table (bool): whether a pyarrow table will be loaded instead of
+                a dataframe. Defaults to False.
+
+        Returns:
+            dict[str, Any]: 'columns' and 'dtypes' of the file.
+            
+        """
+        import pyarrow
+        import pyarrow.ipc
+        with pyarrow.memory_map(str(path)) as source:
+            schema = pyarrow.ipc.open_file(source).schema
+        return _describe_schema(
+            schema = schema, 
+            columns = columns,
+            conserve_memory = conserve_memory,
+            as_table = as_table)
 
 
 @dataclasses.dataclass
@@ -312,10 +1078,67 @@ class FileFormatHDF(FileFormatPandas):
     extensions: ClassVar[str | Sequence[str]] = ('hdf', 'hdf5')
     load_parameters: ClassVar[Optional[Mapping[str, str]]] = {
         'columns': 'included_columns',
-        'chunksize': 'test_size'}
+        'filters': 'filters',
+        'conserve_memory': 'conserve_memory'}
     save_parameters: ClassVar[Optional[Mapping[str, str]]] = {}
+    stream_parameters: ClassVar[Optional[Mapping[str, str]]] = {
+        'columns': 'included_columns',
+        'filters': 'filters'}
     loader: ClassVar[str] = 'read_hdf'
     saver: ClassVar[str] = 'to_hdf'
+    atomic: ClassVar[bool] = False
+    chunker: ClassVar[Optional[str]] = 'chunksize'
+    buffers: ClassVar[bool] = False
+    
+    """ Public Methods """
+    
+    def load(
+        self, 
+        path: pathlib.Path | str, 
+        filters: Optional[Sequence[Any]] = None,
+        **kwargs) -> object:
+        """Loads an HDF file to a pandas dataframe.
+        
+        'filters' are translated to a PyTables 'where' query, so only matching 
+        rows are read. Queries require the file to be saved in the 'table' 
+        format with the filtered columns as data columns (e.g., 
+        'format = 'table', data_columns = True').
+
+        Args:
+            path (pathlib.Path | str): path to HDF file.
+            filters (Optional[Sequence[Any]]): row filters in the disjunctive 
+                normal form used by 'pyarrow.parquet.read_table' (e.g., 
+                [('date', '>=', start)]). Defaults to None.
+
+        Returns:
+            object: pandas dataframe.
+            
+        """
+        if filters:
+            kwargs['where'] = _to_where(filters = filters)
+        return super().load(path = path, **kwargs)
+    
+    def stream(
+        self, 
+        path: pathlib.Path | str, 
+        chunk_size: int, 
+        filters: Optional[Sequence[Any]] = None,
+        **kwargs) -> Iterator[object]:
+        """Loads an HDF file as a series of pandas dataframes.
+
+        Args:
+            path (pathlib.Path | str): path to HDF file.
+            chunk_size (int): number of rows in each dataframe.
+            filters (Optional[Sequence[Any]]): row filters in the same form as
+                'load'. Defaults to None.
+
+        Returns:
+            Iterator[object]: pandas dataframes.
+            
+        """
+        if filters:
+            kwargs['where'] = _to_where(filters = filters)
+        return super().stream(path = path, chunk_size = chunk_size, **kwargs)
     
 
 @dataclasses.dataclass
@@ -337,11 +1160,40 @@ class FileFormatJSON(FileFormatPandas):
     extensions: ClassVar[str | Sequence[str]] = 'json'
     load_parameters: ClassVar[Optional[Mapping[str, str]]] = {
         'encoding': 'file_encoding',
-        'nrows': 'test_size'}
+        'nrows': 'test_size',
+        'conserve_memory': 'conserve_memory'}
     save_parameters: ClassVar[Optional[Mapping[str, str]]] = {
         'encoding': 'file_encoding'}
+    stream_parameters: ClassVar[Optional[Mapping[str, str]]] = {
+        'encoding': 'file_encoding'}
     loader: ClassVar[str] = 'read_json'
     saver: ClassVar[str] = 'to_json'
+    sequential: ClassVar[bool] = True
+    sidecar: ClassVar[bool] = True
+    chunker: ClassVar[Optional[str]] = 'chunksize'
+    
+    """ Public Methods """
+    
+    def stream(
+        self, 
+        path: pathlib.Path | str, 
+        chunk_size: int, 
+        **kwargs) -> Iterator[object]:
+        """Loads a JSON lines file as a series of pandas dataframes.
+
+        pandas can only read JSON in chunks if there is one record per line, 
+        so 'lines' is always passed as True.
+        
+        Args:
+            path (pathlib.Path | str): path to JSON lines file.
+            chunk_size (int): number of records in each dataframe.
+            
+        Returns:
+            Iterator[object]: pandas dataframes with up to 'chunk_size' rows.
+            
+        """
+        kwargs['lines'] = True
+        return super().stream(path = path, chunk_size = chunk_size, **kwargs)
  
 
 @dataclasses.dataclass
@@ -388,11 +1240,158 @@ class FileFormatParquet(FileFormatPandas):
     """
     extensions: ClassVar[str | Sequence[str]] = 'parquet'
     load_parameters: ClassVar[Optional[Mapping[str, str]]] = {
-        'columns': 'included_columns'}
+        'columns': 'included_columns',
+        'filters': 'filters',
+        'conserve_memory': 'conserve_memory',
+        'memory_map': 'memory_map'}
     save_parameters: ClassVar[Optional[Mapping[str, str]]] = {
-        'index': 'index_column'}
+        'index': 'index_column',
+        'use_threads': 'threads'}
     loader: ClassVar[str] = 'read_parquet'
     saver: ClassVar[str] = 'to_parquet'
+    
+    """ Public Methods """
+    
+    def load(
+        self, 
+        path: pathlib.Path | str, 
+        memory_map: bool = False,
+        as_table: bool = False,
+        **kwargs) -> object:
+        """Loads a parquet file to a pandas dataframe or pyarrow table.
+        
+        If 'memory_map' is True, the file is mapped into memory instead of 
+        being read into an intermediate buffer. Parquet pages are still 
+        decoded into new memory.
+        
+        Only the columns in 'columns' are read. If 'filters' (in the 
+        disjunctive normal form used by 'pyarrow.parquet.read_table', e.g., 
+        [('date', '>=', start)]) is passed, row groups whose statistics cannot
+        match are skipped without being read and the remaining rows are 
+        filtered before conversion to pandas. If 'path' is a Hive-partitioned
+        dataset folder (e.g., one written by 'save' with 'partition_cols'), 
+        partitions that do not match 'filters' are not opened at all.
+
+        Args:
+            path (pathlib.Path | str): path to parquet file.
+            memory_map (bool): whether to memory map the file. Defaults to 
+                False.
+            as_table (bool): whether to return the pyarrow table without 
+                converting it to a pandas dataframe. Defaults to False.
+
+        Returns:
+            object: pandas dataframe or pyarrow table.
+            
+        """
+        if not memory_map and not as_table:
+            return super().load(path = path, **kwargs)
+        import pyarrow.parquet
+        conserve_memory = kwargs.pop('conserve_memory', False)
+        table = pyarrow.parquet.read_table(
+            path, 
+            memory_map = memory_map, 
+            **kwargs)
+        return _from_table(
+            table = table, 
+            file_format = self,
+            as_table = as_table, 
+            conserve_memory = conserve_memory)
+    
+    def describe(
+        self, 
+        path: pathlib.Path | str, 
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Sequence[Any]] = None,
+        conserve_memory: bool | str = False,
+        as_table: bool = False,
+        **kwargs) -> dict[str, Any]:
+        """Returns the columns, column types, and rows of a parquet file.
+        
+        Only the footer of the file is read. Rows are not returned if 'filters'
+        is passed because they depend on the contents of the file.
+
+        Args:
+            path (pathlib.Path | str): path to parquet file.
+            columns (Optional[Sequence[str]]): columns that will be loaded. If 
+                None, all columns are described. Defaults to None.
+            filters (Optional[Sequence[Any]]): row filters that will be 
+                applied. Defaults to None.
+            conserve_memory (bool | str): whether the loaded dataframe will be
+                shrunk, which changes its column types. Defaults to False.
+            as_table (bool): whether a pyarrow table will be loaded instead of
+                a dataframe. Defaults to False.
+
+        Returns:
+            dict[str, Any]: 'columns', 'dtypes', 'rows', and 'shape' of the 
+                file or an empty dict if 'path' is a dataset folder.
+            
+        """
+        if pathlib.Path(path).is_dir():
+            return {}
+        import pyarrow.parquet
+        metadata = pyarrow.parquet.ParquetFile(path).metadata
+        description = _describe_schema(
+            schema = metadata.schema.to_arrow_schema(), 
+            columns = columns,
+            conserve_memory = conserve_memory,
+            as_table = as_table)
+        if not filters:
+            description['rows'] = metadata.num_rows
+            if 'columns' in description:
+                description['shape'] = (
+                    metadata.num_rows, 
+                    len(description['columns']))
+        return description
+        
+    def save(
+        self, 
+        item: object, 
+        path: pathlib.Path | str, 
+        partition_cols: Optional[Sequence[str]] = None,
+        use_threads: bool | int = True,
+        **kwargs) -> None:
+        """Saves dataframe 'item' to a parquet file or partitioned dataset.
+        
+        If 'partition_cols' is passed, 'path' becomes a folder with a Hive-style
+        subfolder for each combination of values in 'partition_cols' (e.g., 
+        'date=2023-01-01/region=east/part-0.parquet'). pyarrow writes the 
+        partitions in parallel. Saving to an existing dataset replaces the 
+        partitions that are in 'item' and leaves the others untouched.
+
+        Args:
+            item (object): pandas dataframe.
+            path (pathlib.Path | str): path of the parquet file or dataset 
+                folder.
+            partition_cols (Optional[Sequence[str]]): columns to partition the 
+                dataset by. If None, a single file is written. Defaults to None.
+            use_threads (bool | int): whether pyarrow writes partitions in 
+                parallel with its thread pool. It is mapped to the 'threads' 
+                setting, so False and 1 both mean a single thread. Defaults to
+                True.
+            kwargs: additional arguments passed to 'DataFrame.to_parquet' or, 
+                for datasets, to parquet's write options (e.g., 
+                'compression').
+                
+        """
+        if not partition_cols:
+            return super().save(item = item, path = path, **kwargs)
+        import pyarrow
+        import pyarrow.dataset
+        index = kwargs.pop('index', None)
+        if not isinstance(use_threads, bool):
+            use_threads = use_threads != 1
+        options = pyarrow.dataset.ParquetFileFormat().make_write_options(
+            **kwargs)
+        pyarrow.dataset.write_dataset(
+            pyarrow.Table.from_pandas(item, preserve_index = index),
+            path,
+            format = 'parquet',
+            file_options = options,
+            partitioning = list(partition_cols),
+            partitioning_flavor = 'hive',
+            existing_data_behavior = 'delete_matching',
+            use_threads = use_threads)
+        return
    
 
 @dataclasses.dataclass
@@ -414,12 +1413,13 @@ class FileFormatSTATA(FileFormatPandas):
     extensions: ClassVar[str | Sequence[str]] = 'dta'
     load_parameters: ClassVar[Optional[Mapping[str, str]]] = {
         'columns': 'included_columns',
-        'index_col': 'index_column',
-        'header': 'header',
-        'chunksize': 'test_size'}
+        'conserve_memory': 'conserve_memory'}
     save_parameters: ClassVar[Optional[Mapping[str, str]]] = {}
+    stream_parameters: ClassVar[Optional[Mapping[str, str]]] = {
+        'columns': 'included_columns'}
     loader: ClassVar[str] = 'read_stata'
     saver: ClassVar[str] = 'to_stata'
+    chunker: ClassVar[Optional[str]] = 'chunksize'
   
 
 @dataclasses.dataclass
@@ -442,11 +1442,16 @@ class FileFormatSQL(FileFormatPandas):
     load_parameters: ClassVar[Optional[Mapping[str, str]]] = {
         'columns': 'included_columns',
         'index_col': 'index_column',
-        'chunksize': 'test_size'}
+        'conserve_memory': 'conserve_memory'}
     save_parameters: ClassVar[Optional[Mapping[str, str]]] = {
         'index': 'index_column'}
+    stream_parameters: ClassVar[Optional[Mapping[str, str]]] = {
+        'columns': 'included_columns'}
     loader: ClassVar[str] = 'read_sql_table'
     saver: ClassVar[str] = 'to_sql'
+    atomic: ClassVar[bool] = False
+    chunker: ClassVar[Optional[str]] = 'chunksize'
+    buffers: ClassVar[bool] = False
 
 
 @dataclasses.dataclass
@@ -492,8 +1497,7 @@ class FileFormatSeaborn(core.FileFormat, abc.ABC):
             raise NotImplementedError(
                 'seaborn does not support loading for this data type')
         else:
-            if 'seaborn' not in sys.modules:
-                import seaborn
+            import seaborn
             loader = getattr(seaborn, self.loader)
             return loader(path, **kwargs)
     
@@ -540,4 +1544,257 @@ class FileFormatPNG(FileFormatSeaborn):
         'format': 'visual_format'}
     loader: ClassVar[str] = None
     saver: ClassVar[str] = 'save_fig'
- 
\ No newline at end of file
+ 
+
+
+""" Private Functions """
+
+def _describe_schema(
+    schema: object, 
+    columns: Optional[Sequence[str]] = None,
+    conserve_memory: bool | str = False,
+    as_table: bool = False) -> dict[str, Any]:
+    """Returns the pandas columns and column types of a pyarrow schema.
+    
+    An empty table is converted so that pandas metadata stored in the schema 
+    (e.g., which columns form the index) is applied as it is when loading.
+    Column types are left out if the loaded item will be shrunk (which picks
+    types from the values) or will be a pyarrow table. Columns are also left
+    out for tables, whose 'columns' are arrays rather than names.
+
+    Args:
+        schema (object): pyarrow schema.
+        columns (Optional[Sequence[str]]): columns that will be loaded. If 
+            None, all columns are described. Defaults to None.
+        conserve_memory (bool | str): whether the loaded dataframe will be
+            shrunk. Defaults to False.
+        as_table (bool): whether a pyarrow table will be loaded. Defaults to 
+            False.
+
+    Returns:
+        dict[str, Any]: 'columns' and 'dtypes' of the loaded dataframe.
+        
+    """
+    if as_table:
+        return {}
+    empty = schema.empty_table().to_pandas()
+    if columns is not None:
+        empty = empty[[c for c in columns if c in empty.columns]]
+    if conserve_memory:
+        return {'columns': empty.columns}
+    return {'columns': empty.columns, 'dtypes': empty.dtypes}
+
+def _read_csv_ranges(
+    path: pathlib.Path | str,
+    ranges: Sequence[tuple[int, int]],
+    **kwargs) -> Optional[object]:
+    """Parses byte 'ranges' of a csv file in a process pool and combines them.
+
+    Args:
+        path (pathlib.Path | str): path to csv file.
+        ranges (Sequence[tuple[int, int]]): newline-aligned start and end of 
+            each range. The first range must start at 0.
+        kwargs: arguments passed to 'pandas.read_csv'.
+
+    Returns:
+        Optional[object]: pandas dataframe or None if a range starts inside a
+            quoted field, in which case the file must be parsed serially.
+            
+    """
+    import concurrent.futures
+    import csv
+    import pandas
+    from . import lazy
+    header = b''
+    # The first row is only a header if 'header' is 0 or is inferred without 
+    # 'names'. It is then prepended to every other range.
+    if kwargs.get('header', 'infer') == 0 or (
+        kwargs.get('header', 'infer') == 'infer' 
+        and kwargs.get('names') is None):
+        with open(path, 'rb') as a_file:
+            header = a_file.readline()
+    quote = kwargs.get('quotechar', '"').encode(kwargs.get('encoding') or 'utf-8')
+    if kwargs.get('quoting', csv.QUOTE_MINIMAL) == csv.QUOTE_NONE:
+        quote = b''
+    modules = lazy.snapshot(packages = FileFormatCSV.packages)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers = len(ranges),
+        initializer = lazy.preload,
+        initargs = (modules,)) as executor:
+        futures = [
+            executor.submit(
+                _read_csv_range,
+                path = path, 
+                start = start, 
+                end = end, 
+                prefix = header if start else b'',
+                quote = quote,
+                options = kwargs)
+            for start, end in ranges]
+        results = [f.result() for f in futures]
+        quotes = 0
+        for _, count, _ in results[:-1]:
+            quotes += count
+            if quotes % 2:
+                return None
+        for _, _, error in results:
+            if error is not None:
+                raise error
+        frames = [frame for frame, _, _ in results]
+        mixed = [
+            c for c in frames[0].columns
+            if len({f[c].dtype.kind == 'O' for f in frames}) > 1]
+        if mixed:
+            # Reparses ranges in which a text column was inferred as another
+            # type so that every range treats the column as text.
+            dtype = dict(kwargs.get('dtype') or {})
+            dtype.update({c: str for c in mixed})
+            futures = {
+                i: executor.submit(
+                    _read_csv_range,
+                    path = path,
+                    start = start, 
+                    end = end, 
+                    prefix = header if start else b'',
+                    quote = b'',
+                    options = {**kwargs, 'dtype': dtype})
+                for i, (start, end) in enumerate(ranges)
+                if any(frames[i][c].dtype.kind != 'O' for c in mixed)}
+            for i, future in futures.items():
+                frame, _, error = future.result()
+                if error is not None:
+                    raise error
+                frames[i] = frame
+    index_col = kwargs.get('index_col')
+    return pandas.concat(
+        frames, 
+        ignore_index = index_col is None or index_col is False)
+
+def _read_csv_range(
+    path: pathlib.Path | str,
+    start: int,
+    end: int,
+    prefix: bytes,
+    quote: bytes,
+    options: Mapping[str, Any]) -> tuple[
+        Optional[object], int, Optional[Exception]]:
+    """Parses bytes 'start' to 'end' of a csv file in a worker process.
+
+    Args:
+        path (pathlib.Path | str): path to csv file.
+        start (int): first byte of the range.
+        end (int): byte after the end of the range.
+        prefix (bytes): header row to parse the range with or b'' if the range
+            contains the header row or the file has none.
+        quote (bytes): quote character to count or b'' to skip counting.
+        options (Mapping[str, Any]): arguments passed to 'pandas.read_csv'.
+
+    Returns:
+        tuple[Optional[object], int, Optional[Exception]]: pandas dataframe 
+            (or None if parsing failed), number of quote characters in the 
+            range, and the error raised by parsing, if any.
+            
+    """
+    import io
+    import pandas
+    with open(path, 'rb') as a_file:
+        a_file.seek(start)
+        data = a_file.read(end - start)
+    count = data.count(quote) if quote else 0
+    try:
+        frame = pandas.read_csv(io.BytesIO(prefix + data), **options)
+    except Exception as error:
+        return None, count, error
+    return frame, count, None
+
+def _to_literal(value: Any) -> Any:
+    """Converts a filter value to a plain Python value for a 'where' query.
+    
+    numpy scalars (e.g., values taken from a dataframe) are converted with 
+    'item' and datetimes to ISO strings, because their reprs (e.g., 
+    'np.int64(5)') cannot be evaluated by PyTables.
+
+    Args:
+        value (Any): filter value.
+
+    Returns:
+        Any: value whose repr is a literal PyTables can evaluate.
+        
+    """
+    if type(value).__module__ == 'numpy' and hasattr(value, 'dtype'):
+        if value.dtype.kind in 'mM':
+            import pandas
+            if value.dtype.kind == 'M':
+                return pandas.Timestamp(value).isoformat()
+            return str(pandas.Timedelta(value))
+        return value.item()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+def _from_table(
+    table: object, 
+    file_format: FileFormatPandas,
+    as_table: bool,
+    conserve_memory: bool | str) -> object:
+    """Returns 'table' or converts it to a pandas dataframe.
+    
+    Columns are converted without consolidating them into blocks, which allows
+    pandas to reference the pyarrow buffers directly where the types match.
+
+    Args:
+        table (object): pyarrow table.
+        file_format (FileFormatPandas): format that loaded 'table'.
+        as_table (bool): whether to return 'table' without converting it.
+        conserve_memory (bool | str): whether to shrink the dataframe with the
+            'shrink' method of 'file_format' after conversion.
+
+    Returns:
+        object: pyarrow table or pandas dataframe.
+        
+    """
+    if as_table:
+        return table
+    loaded = table.to_pandas(split_blocks = True)
+    if conserve_memory:
+        loaded = file_format.shrink(
+            item = loaded, 
+            arrow_strings = conserve_memory == 'arrow')
+    return loaded
+
+def _to_where(filters: Sequence[Any]) -> str:
+    """Translates pyarrow-style 'filters' to a PyTables 'where' query.
+
+    Args:
+        filters (Sequence[Any]): a list of (column, operator, value) tuples 
+            which must all match or a list of such lists, any of which must 
+            match.
+
+    Raises:
+        ValueError: if an operator is not supported.
+
+    Returns:
+        str: query for 'pandas.read_hdf'.
+        
+    """
+    operators = {
+        '=': '==', '==': '==', '!=': '!=', '<': '<', '<=': '<=', '>': '>', 
+        '>=': '>=', 'in': '==', 'not in': '!='}
+    if filters and isinstance(filters[0], tuple):
+        filters = [filters]
+    clauses = []
+    for conjunction in filters:
+        terms = []
+        for column, operator, value in conjunction:
+            try:
+                operator = operators[operator]
+            except KeyError:
+                raise ValueError(
+                    f'{operator} is not a supported filter operator') from None
+            if isinstance(value, (set, tuple, list)):
+                value = [_to_literal(value = v) for v in value]
+            else:
+                value = _to_literal(value = value)
+            terms.append(f'{column} {operator} {value!r}')
+        clauses.append(f'({" & ".join(terms)})')
+    return ' | '.join(clauses)
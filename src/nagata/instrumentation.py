@@ -0,0 +1,352 @@
+"""
+instrumentation: hooks and statistics for file transfers.
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2022, Corey Rayburn Yung
+License: Apache-2.0
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+Contents:
+    Event (object): record of one phase of a file transfer.
+    Hooks (object): event bus which calls subscribers before and after each
+        phase of a file transfer.
+    StatsCollector (object): subscriber which keeps latency percentiles and
+        throughput for each file format, transfer type, and phase.
+    SpanExporter (object): subscriber which exports events as OpenTelemetry
+        spans.
+
+ToDo:
+
+
+"""
+from __future__ import annotations
+import collections
+from collections.abc import Callable, Iterator
+import contextlib
+import dataclasses
+import pathlib
+import threading
+import time
+from typing import Any, Optional
+
+
+@dataclasses.dataclass
+class Event(object):
+    """Record of one phase of a file transfer.
+
+    Args:
+        phase (str): 'prepare' (resolving the path and file format),
+            'parameters' (merging settings with passed arguments), or
+            'transfer' (reading and parsing or serializing and writing). Loads
+            that nagata reads itself (compressed files that are decompressed
+            first and buffered files loaded by AsyncFileManager) also report
+            'read' and 'parse' within 'transfer'. Other loads are read and
+            parsed by the format's library in one call, so only 'transfer' is
+            reported for them.
+        transfer_type (str): 'load', 'save', or 'stream'.
+        path (Optional[pathlib.Path]): path of the transferred file, if it is
+            known when the event is sent. Defaults to None.
+        file_format (Optional[str]): name of the file format, if it is known
+            when the event is sent. Defaults to None.
+        size (Optional[int]): number of bytes read or written. It is only set
+            for the 'transfer' and 'read' phases.Defaults to None.
+        started (int): wall clock time, in nanoseconds since the epoch, when
+            the phase started. Defaults to 0.
+        seconds (float): duration of the phase. It is 0.0 for subscribers that
+            are called before the phase. Defaults to 0.0.
+        error (Optional[BaseException]): error raised during the phase, if
+            any. Defaults to None.
+
+    """
+    phase: str
+    transfer_type: str
+    path: Optional[pathlib.Path] = None
+    file_format: Optional[str] = None
+    size: Optional[int] = None
+    started: int = 0
+    seconds: float = 0.0
+    error: Optional[BaseException] = None
+
+
+@dataclasses.dataclass
+class Hooks(object):
+    """Event bus for the phases of file transfers.
+
+    Pass an instance to FileManager to receive an Event before and after each
+    phase of every transfer. Subscribers are called in the thread that
+    performs the phase, so they should be fast and thread-safe.
+
+    Args:
+        before (list[Callable[[Event], None]]): subscribers called before each
+            phase. Defaults to an empty list.
+        after (list[Callable[[Event], None]]): subscribers called after each
+            phase, with its duration and outcome. Defaults to an empty list.
+
+    """
+    before: list[Callable[[Event], None]] = dataclasses.field(
+        default_factory = list)
+    after: list[Callable[[Event], None]] = dataclasses.field(
+        default_factory = list)
+
+    """ Public Methods """
+
+    def subscribe(
+        self,
+        subscriber: Callable[[Event], None],
+        before: bool = False) -> None:
+        """Adds 'subscriber' to the subscribers called after (or before) phases.
+
+        Args:
+            subscriber (Callable[[Event], None]): callable to add.
+            before (bool): whether to call 'subscriber' before each phase
+                instead of after it. Defaults to False.
+
+        """
+        (self.before if before else self.after).append(subscriber)
+        return
+
+    def unsubscribe(self, subscriber: Callable[[Event], None]) -> None:
+        """Removes 'subscriber' from all subscribers.
+
+        Args:
+            subscriber (Callable[[Event], None]): callable to remove.
+
+        """
+        for subscribers in (self.before, self.after):
+            while subscriber in subscribers:
+                subscribers.remove(subscriber)
+        return
+
+    @contextlib.contextmanager
+    def phase(
+        self,
+        phase: str,
+        transfer_type: str,
+        path: Optional[pathlib.Path] = None,
+        file_format: Optional[object] = None) -> Iterator[Event]:
+        """Times a phase and sends its Event to subscribers.
+
+        The yielded Event may be updated (e.g., with 'path' or 'size') before
+        the phase ends.
+
+        Args:
+            phase (str): name of the phase.
+            transfer_type (str): 'load', 'save', or 'stream'.
+            path (Optional[pathlib.Path]): path of the transferred file.
+                Defaults to None.
+            file_format (Optional[object]): FileFormat instance. Defaults to
+                None.
+
+        Yields:
+            Iterator[Event]: record of the phase.
+
+        """
+        event = Event(
+            phase = phase,
+            transfer_type = transfer_type,
+            path = path,
+            file_format = name_format(file_format = file_format),
+            started = time.time_ns())
+        for subscriber in self.before:
+            subscriber(event)
+        start = time.perf_counter()
+        try:
+            yield event
+        except BaseException as error:
+            event.error = error
+            raise
+        finally:
+            event.seconds = time.perf_counter() - start
+            for subscriber in self.after:
+                subscriber(event)
+
+
+@dataclasses.dataclass
+class StatsCollector(object):
+    """In-memory statistics for transfer events.
+
+    Add an instance to Hooks with 'subscribe'. Statistics are grouped by file
+    format, transfer type, and phase.
+
+    Args:
+        max_samples (int): number of most recent durations kept for each group
+            to compute percentiles. Counts and totals include every event.
+            Defaults to 10000.
+
+    """
+    max_samples: int = 10000
+
+    """ Initialization Methods """
+
+    def __post_init__(self) -> None:
+        """Initializes storage for statistics."""
+        self._groups: dict[tuple[Any, ...], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        return
+
+    """ Dunder Methods """
+
+    def __call__(self, event: Event) -> None:
+        """Records 'event'.
+
+        Args:
+            event (Event): finished phase of a transfer.
+
+        """
+        key = (event.file_format, event.transfer_type, event.phase)
+        with self._lock:
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = {
+                    'count': 0,
+                    'errors': 0,
+                    'seconds': 0.0,
+                    'bytes': 0,
+                    'samples': collections.deque(maxlen = self.max_samples)}
+            group['count'] += 1
+            group['seconds'] += event.seconds
+            group['samples'].append(event.seconds)
+            if event.error is not None:
+                group['errors'] += 1
+            if event.size:
+                group['bytes'] += event.size
+        return
+
+    """ Public Methods """
+
+    def summary(self) -> dict[tuple[Any, ...], dict[str, float]]:
+        """Returns statistics for each group of events.
+
+        Returns:
+            dict[tuple[Any, ...], dict[str, float]]: keys are tuples of the
+                file format, transfer type, and phase. Values contain the
+                number of events and errors, the 50th, 95th, and 99th
+                percentile durations in milliseconds, the total bytes, and the
+                throughput in megabytes per second.
+
+        """
+        with self._lock:
+            groups = {
+                k: {**v, 'samples': sorted(v['samples'])}
+                for k, v in self._groups.items()}
+        summary = {}
+        for key, group in groups.items():
+            samples = group['samples']
+            summary[key] = {
+                'count': group['count'],
+                'errors': group['errors'],
+                'p50_ms': _percentile(samples, 0.50) * 1000,
+                'p95_ms': _percentile(samples, 0.95) * 1000,
+                'p99_ms': _percentile(samples, 0.99) * 1000,
+                'bytes': group['bytes'],
+                'mb_per_s': (
+                    group['bytes'] / group['seconds'] / 1e6
+                    if group['seconds'] else 0.0)}
+        return summary
+
+    def clear(self) -> None:
+        """Removes all recorded statistics."""
+        with self._lock:
+            self._groups.clear()
+        return
+
+
+@dataclasses.dataclass
+class SpanExporter(object):
+    """Exports transfer events as OpenTelemetry spans.
+
+    Add an instance to Hooks with 'subscribe'. Each event becomes a finished
+    span named 'nagata.<transfer_type>.<phase>' with the path, file format,
+    and size as attributes.
+
+    Args:
+        tracer (Optional[Any]): object with the 'start_span' method of an
+            OpenTelemetry tracer. A local stub can be passed in tests. If None,
+            the tracer named 'nagata' is taken from 'opentelemetry.trace',
+            which must be installed. Defaults to None.
+
+    """
+    tracer: Optional[Any] = None
+
+    """ Initialization Methods """
+
+    def __post_init__(self) -> None:
+        """Gets the global tracer if 'tracer' is None."""
+        if self.tracer is None:
+            from opentelemetry import trace
+            self.tracer = trace.get_tracer('nagata')
+        return
+
+    """ Dunder Methods """
+
+    def __call__(self, event: Event) -> None:
+        """Exports 'event' as a span.
+
+        Args:
+            event (Event): finished phase of a transfer.
+
+        """
+        attributes = {
+            'nagata.transfer_type': event.transfer_type,
+            'nagata.phase': event.phase,
+            'nagata.file_format': event.file_format,
+            'nagata.path': str(event.path) if event.path else None,
+            'nagata.bytes': event.size}
+        span = self.tracer.start_span(
+            f'nagata.{event.transfer_type}.{event.phase}',
+            start_time = event.started,
+            attributes = {k: v for k, v in attributes.items() if v is not None})
+        if event.error is not None:
+            span.record_exception(event.error)
+        span.end(end_time = event.started + int(event.seconds * 1e9))
+        return
+
+
+""" Public Functions """
+
+def name_format(file_format: Optional[object]) -> Optional[str]:
+    """Returns a short name for 'file_format' (e.g., 'csv').
+
+    Args:
+        file_format (Optional[object]): FileFormat instance or None.
+
+    Returns:
+        Optional[str]: lowercase class name without the 'FileFormat' prefix or
+            None if 'file_format' is None.
+
+    """
+    if file_format is None:
+        return None
+    return type(file_format).__name__.removeprefix('FileFormat').lower()
+
+
+""" Private Functions """
+
+def _percentile(ordered: list[float], share: float) -> float:
+    """Returns the 'share' percentile of sorted 'ordered' values.
+
+    Args:
+        ordered (list[float]): sorted values.
+        share (float): percentile as a fraction between 0 and 1.
+
+    Returns:
+        float: interpolated percentile or 0.0 if 'ordered' is empty.
+
+    """
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * share
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (
+        position - lower)
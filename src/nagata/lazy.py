@@ -25,20 +25,39 @@ Contents:
     relative_import:
     relative_subpackage_import:
     from_importables:
-    Importer (object):
-    Delayed (object):
+    install: adds PEP 562 '__getattr__' and '__dir__' functions to a module 
+        which lazily import and then cache its exports.
+    snapshot: returns (and optionally writes to a manifest file) the modules 
+        imported in the current process.
+    preload: imports the modules in a snapshot or manifest file, e.g., when a
+        worker process starts.
+    Importer (object): thread-safe lazy importer which can record the time 
+        spent on each import.
+    delayed: returns a dataclass field whose str value is imported when it is
+        first accessed on a Delayed instance.
+    Delayed (object): mixin which imports the values of 'delayed' fields when
+        they are first accessed.
+    DelayedLoad (object): proxy for a loaded file which answers metadata 
+        questions without parsing the file and parses it on first access of 
+        its data.
     
 ToDo:
 
 
 """
 from __future__ import annotations
-from collections.abc import MutableMapping
+from collections.abc import (
+    Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence)
+import contextlib
 import dataclasses
 import importlib
 import importlib.util
+import json
+import os
 import pathlib
 import sys
+import threading
+import time
 import types
 from typing import Any, ClassVar, Optional
 
@@ -90,98 +109,154 @@ def from_file_path(
         return module
     
 def from_import_path(path: str, package: Optional[str] = None) -> Any:
-    """[summary]
+    """Imports and returns a module or an item within a module at 'path'.
+    
+    Each technique is first tried with 'path' as a module and then with 'path'
+    as an item within the module at its parent path. The technique that 
+    succeeds is stored, so later calls with the same arguments go straight to
+    it without trying the others.
 
     Args:
-        path (str): [description]
-        package (Optional[str], optional): [description]. Defaults to None.
+        path (str): import path of a module or an item within a module. It may
+            be relative to 'package' if it starts with '.'.
+        package (Optional[str]): name of the package that relative paths are
+            imported from. Defaults to None.
 
+    Raises:
+        ModuleNotFoundError: if no technique finds 'path'.
+        
     Returns:
-        Any: [description]
+        Any: imported module or item.
         
     """
-    # if package and isinstance(path, str):
-    #     path = '.'.join([path, package])
-    print('test sys modules', 'pandas' in sys.modules)
-    print('test path package', path, package)
     try:
         return sys.modules[path]
-    
     except KeyError:
-        techniques = [
-            absolute_import,
-            absolute_subpackage_import,
-            relative_import,
-            relative_subpackage_import]
-        for technique in techniques:
+        pass
+    resolution = _RESOLUTIONS.get((path, package))
+    if resolution is not None:
+        technique, item = resolution
+        if item is None:
+            return technique(path, package)
+        module = technique(path[:-len(item) - 1], package)
+        return getattr(module, item)
+    item = path.split('.')[-1]
+    module_name = path[:-len(item) - 1]
+    for technique in _TECHNIQUES:
+        # Techniques that raise TypeError without a package are skipped, so 
+        # a TypeError raised while a module executes is not mistaken for it.
+        if not package and _requires_package(
+            technique = technique, 
+            path = path):
+            continue
+        try:
+            imported = technique(path, package)
+        except ModuleNotFoundError as error:
+            _check_missing(
+                error = error, 
+                path = path, 
+                package = package)
+        else:
+            _RESOLUTIONS[(path, package)] = (technique, None)
+            return imported
+        if module_name.strip('.'):
             try:
-                return technique(path, package)
-            except ModuleNotFoundError:
-                item = path.split('.')[-1]
-                module_name = path[:-len(item) - 1]
                 module = technique(module_name, package)
-                return getattr(module, item)  
-        raise ModuleNotFoundError(f'{path} could not be imported') 
+            except ModuleNotFoundError as error:
+                _check_missing(
+                    error = error, 
+                    path = module_name, 
+                    package = package)
+            else:
+                if hasattr(module, item):
+                    _RESOLUTIONS[(path, package)] = (technique, item)
+                    return getattr(module, item)
+    raise ModuleNotFoundError(f'{path} could not be imported') 
              
-def absolute_import(path: str, package: str) -> Any:
-    """[summary]
+def absolute_import(path: str, package: Optional[str] = None) -> Any:
+    """Imports a module at an absolute import 'path'.
 
     Args:
-        path (str): [description]
+        path (str): absolute import path of a module. If it starts with '.', 
+            it is imported relative to 'package' instead.
+        package (Optional[str]): name of the package that relative paths are
+            imported from. Defaults to None.
 
     Returns:
-        Any: [description]
+        Any: imported module.
         
     """
     if path.startswith('.'):
-        path = path[1:]
-        return relative_subpackage_import(path = path)
+        return relative_import(path = path, package = package)
     return importlib.import_module(path)
  
-def absolute_subpackage_import(path: str, package: str) -> Any:
-    """[summary]
+def absolute_subpackage_import(
+    path: str, 
+    package: Optional[str] = None) -> Any:
+    """Imports a module at 'path' within 'package'.
 
     Args:
-        path (str): [description]
-        package (str): [description]. 
+        path (str): import path of a module relative to 'package' without a
+            leading '.'.
+        package (Optional[str]): name of the package containing the module.
+            Defaults to None.
 
+    Raises:
+        TypeError: if 'package' is None.
+        
     Returns:
-        Any: [description]
+        Any: imported module.
         
     """
-    if path.startswith('.'):
-        path = path[1:]
-        return relative_subpackage_import(path = path, package = package)
-    return importlib.import_module(path, package = package)
+    if package is None:
+        raise TypeError('package is required for subpackage imports')
+    return importlib.import_module(f'{package}.{path.lstrip(".")}')
 
-def relative_import(path: str) -> Any:
-    """[summary]
+def relative_import(path: str, package: Optional[str] = None) -> Any:
+    """Imports a module at a relative import 'path' from 'package'.
 
     Args:
-        path (str): [description]
+        path (str): import path of a module relative to 'package'. A leading 
+            '.' is added if it is missing.
+        package (Optional[str]): name of the package that 'path' is relative 
+            to. Defaults to None.
 
+    Raises:
+        TypeError: if 'package' is None.
+        
     Returns:
-        Any: [description]
+        Any: imported module.
         
     """
     if not path.startswith('.'):
         path = '.' + path
-    return importlib.import_module(sys.path_importer_cache)
+    return importlib.import_module(path, package = package)
 
-def relative_subpackage_import(path: str, package: str) -> Any:
-    """[summary]
+def relative_subpackage_import(
+    path: str, 
+    package: Optional[str] = None) -> Any:
+    """Imports a module at 'path' relative to the parent of 'package'.
 
     Args:
-        path (str): [description]
-        package (str): [description]. 
+        path (str): import path of a module relative to the package that
+            contains 'package'. Leading '..' is added if it is missing.
+        package (Optional[str]): name of the package whose parent 'path' is 
+            relative to. Defaults to None.
 
+    Raises:
+        ModuleNotFoundError: if 'package' is None or has no parent package.
+        
     Returns:
-        Any: [description]
+        Any: imported module.
         
     """
+    if package is None or '.' not in package:
+        raise ModuleNotFoundError(
+            f'{package} has no parent package', 
+            name = path)
     if not path.startswith('.'):
         path = '.' + path
-    return importlib.import_module(path, package = package)
+    return importlib.import_module('.' + path, package = package)
 
 def from_importables(
     name: str, 
@@ -238,60 +313,596 @@ def from_importables(
         raise KeyError(f'{name} is not in importables') 
 
 
+def install(
+    module_globals: MutableMapping[str, Any],
+    importables: MutableMapping[str, str],
+    warm: bool = False,
+    delay: float = 0.0) -> Importer:
+    """Makes the items in 'importables' lazy attributes of a module.
+    
+    '__getattr__' and '__dir__' functions are added to 'module_globals', as 
+    described in PEP 562. Each item is imported the first time it is accessed
+    and then stored in 'module_globals', so later accesses are ordinary 
+    attribute lookups which never call '__getattr__' again. Names that are not
+    in 'importables' are imported as submodules of the module (e.g., 
+    'package.core' after 'import package'), as they would be if they had been
+    imported explicitly.
+    
+    To use it, call it at the end of a package's '__init__.py':
+    
+        lazy.install(globals(), {'Thing': '.module.Thing'})
+
+    Args:
+        module_globals (MutableMapping[str, Any]): globals of the module (as
+            returned by 'globals()').
+        importables (MutableMapping[str, str]): keys are the names of the lazy
+            attributes and values are their import paths, which may be relative
+            to the module.
+        warm (bool): whether to import every item in a background thread 
+            after 'delay' seconds so that it is ready before it is first 
+            accessed. Defaults to False.
+        delay (float): seconds to wait before warming the imports. Defaults to
+            0.0.
+
+    Returns:
+        Importer: importer used by the module's '__getattr__'.
+        
+    """
+    name = module_globals['__name__']
+    importer = Importer(
+        package = module_globals.get('__package__') or name, 
+        importables = importables)
+
+    def __getattr__(attribute: str) -> Any:
+        try:
+            item = importer.load(attribute)
+        except KeyError:
+            item = _import_submodule(package = name, name = attribute)
+        module_globals[attribute] = item
+        return item
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | set(importer.importables))
+
+    module_globals['__getattr__'] = __getattr__
+    module_globals['__dir__'] = __dir__
+    if warm:
+        importer.warm(into = module_globals, delay = delay)
+    return importer
+
+
+def delayed(default: Any = dataclasses.MISSING, **kwargs: Any) -> Any:
+    """Returns a dataclass field which holds an import path for Delayed.
+
+    Args:
+        default (Any): default import path of the field. Defaults to no 
+            default.
+        kwargs: additional arguments passed to 'dataclasses.field'.
+
+    Returns:
+        Any: dataclass field marked with a True 'delayed' metadata key.
+        
+    """
+    metadata = {**kwargs.pop('metadata', {}), 'delayed': True}
+    return dataclasses.field(default = default, metadata = metadata, **kwargs)
+
+
+def snapshot(
+    path: Optional[pathlib.Path | str] = None,
+    packages: Optional[Iterable[str]] = None) -> list[str]:
+    """Returns the modules imported in this process, in the order imported.
+    
+    Standard library modules are left out because they are cheap to import. 
+    The result can be passed to 'preload' in a worker process (e.g., as the 
+    'initargs' of an executor whose 'initializer' is 'preload') so that the
+    worker imports, in bulk at startup, the modules that lazy imports loaded 
+    in the parent instead of importing them during its first task. Workers 
+    started with 'fork' inherit the parent's modules, so warming the parent 
+    before creating them is enough.
+
+    Args:
+        path (Optional[pathlib.Path | str]): if passed, the modules are also 
+            written to a JSON manifest file at 'path'. Defaults to None.
+        packages (Optional[Iterable[str]]): if passed, only modules within 
+            these top-level packages are included. Defaults to None.
+
+    Returns:
+        list[str]: names of imported modules.
+        
+    """
+    allowed = None if packages is None else set(packages)
+    excluded = _get_standard_library() | set(sys.builtin_module_names)
+    modules = []
+    for name in list(sys.modules):
+        top = name.partition('.')[0]
+        if (
+            top in excluded 
+            or top.startswith('_')
+            or (allowed is not None and top not in allowed)):
+            continue
+        modules.append(name)
+    if path is not None:
+        pathlib.Path(path).write_text(json.dumps(modules))
+    return modules
+
+def preload(manifest: Sequence[str] | pathlib.Path | str) -> list[str]:
+    """Imports the modules in 'manifest'.
+    
+    Modules which cannot be imported (e.g., because they are only importable
+    as a side effect of importing another module) are skipped.
+
+    Args:
+        manifest (Sequence[str] | pathlib.Path | str): names of modules, as 
+            returned by 'snapshot', or the path of a manifest file written by
+            'snapshot'.
+
+    Returns:
+        list[str]: names of the modules that were imported.
+        
+    """
+    if isinstance(manifest, (str, pathlib.Path)):
+        manifest = json.loads(pathlib.Path(manifest).read_text())
+    imported = []
+    for name in manifest:
+        if name not in sys.modules:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                continue
+        imported.append(name)
+    return imported
+
+
 """ Class Implementations """
 
 @dataclasses.dataclass
 class Importer(object):
     """Lazy importer that uses a dict to lazily import items.
     
+    Each item is imported once, even if several threads access it for the 
+    first time at the same time, and then replaces its import path in 
+    'importables'.
+    
     Args:
         package (str): name of package to which the 'importables' are linked.
         importables (Optional[MutableMapping[str, str]]): dict keys are names
             used to refer to importable item and values are the import paths of
             the importable items. Defaults to an empty dict.
+        profile (bool): whether to record the wall time, in seconds, of each
+            lazy import in 'timings'. Defaults to True if the 
+            'NAGATA_PROFILE_IMPORTS' environment variable is set and False 
+            otherwise.
     
     """
     package: str
     importables: Optional[MutableMapping[str, str]] = dataclasses.field(
         default_factory = dict)
+    profile: bool = dataclasses.field(
+        default_factory = lambda: bool(os.environ.get('NAGATA_PROFILE_IMPORTS')))
+    
+    """ Initialization Methods """
+    
+    def __post_init__(self) -> None:
+        """Initializes locks and timings."""
+        self.timings: dict[str, float] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+        return
         
     """ Public Methods """
     
     def load(self, name: str) -> Any:
-        if name in self.importables:
-            if not isinstance(self.importables[name], str):
-                return self.importables[name]
-            else:
-                imported = from_importables(
-                    name = name, 
-                    importables = self.importables,
-                    package = self.package)
-                self.importables[name] = imported
-                return imported
-        else:
-            raise KeyError(f'{name} is not in importables')
+        """Returns the item at 'name', importing it if needed.
+
+        Args:
+            name (str): key of the item in 'importables'.
+
+        Raises:
+            KeyError: if 'name' is not in 'importables'.
+
+        Returns:
+            Any: imported item.
+            
+        """
+        try:
+            item = self.importables[name]
+        except KeyError:
+            raise KeyError(f'{name} is not in importables') from None
+        if not isinstance(item, str):
+            return item
+        with self._guard:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            item = self.importables[name]
+            if isinstance(item, str):
+                start = time.perf_counter()
+                item = from_import_path(path = item, package = self.package)
+                if self.profile:
+                    self.timings[name] = time.perf_counter() - start
+                self.importables[name] = item
+        return item
+    
+    def warm(
+        self, 
+        into: Optional[MutableMapping[str, Any]] = None,
+        delay: float = 0.0) -> threading.Thread:
+        """Imports every item in a background thread.
+        
+        Items that cannot be imported (e.g., because an optional dependency is
+        not installed) are skipped and raise their error when they are 
+        accessed.
+
+        Args:
+            into (Optional[MutableMapping[str, Any]]): mapping (e.g., module 
+                globals) in which to also store each imported item. Defaults 
+                to None.
+            delay (float): seconds to wait before importing. Defaults to 0.0.
+
+        Returns:
+            threading.Thread: daemon thread performing the imports.
+            
+        """
+        def warm() -> None:
+            if delay:
+                time.sleep(delay)
+            for name in list(self.importables):
+                try:
+                    item = self.load(name)
+                except Exception:
+                    continue
+                if into is not None:
+                    into.setdefault(name, item)
+            return
+        
+        thread = threading.Thread(
+            target = warm, 
+            name = f'{self.package}-warm', 
+            daemon = True)
+        thread.start()
+        return thread
            
 
 @dataclasses.dataclass
 class Delayed(object):
-    """Mixin that converts str attributes to imported items when accessed.
+    """Mixin that imports the values of import path fields when first accessed.
     
-    # Only str values of attributes with a '.' in them are assumed to be import
-    # paths.
+    Only fields created with 'delayed' (or whose metadata has a True 
+    'delayed' key) are treated as import paths, and only if their value is a 
+    str. Relative paths are imported from the package of the module that 
+    defines the subclass.
     
-    After an item is imported, it is assigned to the attribute which previously
-    held the str import path so that it does not need to be reloaded.
+    The first time a subclass is instanced, each such field is replaced on the
+    class by a descriptor. The import path of each instance is moved out of 
+    the instance's attributes, so the first access falls through to the 
+    descriptor, which imports the item and stores it as an instance 
+    attribute. Every later access is an ordinary attribute lookup. Subclasses
+    that define '__post_init__' must call 'super().__post_init__()'.
     
     """
- 
-    """ Dunder Methods """
     
-    def __getattribute__(self, name: str) -> Any:
-        item = super().__getattribute__(name)
-        if isinstance(item, str):
-            imported = from_import_path(item = name)
-            super().__setattr__(name, imported)
-            return imported
-        else:
-            return item
+    """ Initialization Methods """
+    
+    def __post_init__(self) -> None:
+        """Moves import paths aside so that they are imported when accessed."""
+        with contextlib.suppress(AttributeError):
+            super().__post_init__() # type: ignore
+        cls = type(self)
+        names = cls.__dict__.get('_delayed_names')
+        if names is None:
+            names = _install_delayed(cls = cls)
+        if names:
+            # Attributes are deleted and set instead of editing '__dict__' 
+            # directly, which would stop CPython from storing them inline 
+            # and slow down every later access.
+            paths = {}
+            for name in names:
+                value = getattr(self, name)
+                if isinstance(value, str):
+                    paths[name] = value
+                    object.__delattr__(self, name)
+            object.__setattr__(self, '_delayed_paths', paths)
+        return
                 
+
+@dataclasses.dataclass(eq = False, repr = False)
+class DelayedLoad(object):
+    """Proxy for a file which is only parsed when its data is first accessed.
+    
+    Like Delayed, which imports an item the first time its attribute is 
+    accessed, DelayedLoad loads a file the first time it is used and then 
+    keeps the loaded item. 'size' is read from the file system and 'columns',
+    'dtypes', 'rows', and 'shape' are answered from 'describe' (which reads 
+    only file headers or footers) when it provides them. Any other attribute,
+    item access, iteration, or conversion to an array loads the file and is 
+    forwarded to the loaded item. Code that checks the type of an object 
+    should be passed the result of 'load' instead of the proxy.
+
+    Args:
+        loader (Callable[[], Any]): callable which loads and returns the item.
+        path (pathlib.Path | str): path of the file to load.
+        describe (Optional[Callable[[], Mapping[str, Any]]]): callable which
+            returns metadata about the file without parsing it. Defaults to 
+            None.
+    
+    """
+    loader: Callable[[], Any]
+    path: pathlib.Path | str
+    describe: Optional[Callable[[], Mapping[str, Any]]] = None
+    
+    """ Initialization Methods """
+    
+    def __post_init__(self) -> None:
+        """Initializes storage for the loaded item and metadata."""
+        self._item: Any = _UNLOADED
+        self._metadata: Optional[Mapping[str, Any]] = None
+        self._lock = threading.Lock()
+        return
+    
+    """ Properties """
+    
+    @property
+    def loaded(self) -> bool:
+        """Returns whether the file has been loaded."""
+        return self._item is not _UNLOADED
+    
+    @property
+    def metadata(self) -> Mapping[str, Any]:
+        """Returns metadata from 'describe' (or an empty dict if it is None)."""
+        if self._metadata is None:
+            self._metadata = {} if self.describe is None else self.describe()
+        return self._metadata
+    
+    @property
+    def size(self) -> int:
+        """Returns the size of the file in bytes."""
+        return os.stat(self.path).st_size
+    
+    @property
+    def columns(self) -> Any:
+        """Returns column names without loading the file if possible."""
+        return self._describe_or_load(name = 'columns')
+    
+    @property
+    def dtypes(self) -> Any:
+        """Returns column types without loading the file if possible."""
+        return self._describe_or_load(name = 'dtypes')
+    
+    @property
+    def shape(self) -> Any:
+        """Returns the shape of the item without loading the file if possible."""
+        return self._describe_or_load(name = 'shape')
+    
+    @property
+    def rows(self) -> int:
+        """Returns the number of rows without loading the file if possible."""
+        if 'rows' in self.metadata:
+            return self.metadata['rows']
+        return len(self.load())
+    
+    """ Public Methods """
+    
+    def load(self) -> Any:
+        """Returns the loaded item, loading the file if needed."""
+        if self._item is _UNLOADED:
+            with self._lock:
+                if self._item is _UNLOADED:
+                    self._item = self.loader()
+        return self._item
+    
+    """ Private Methods """
+    
+    def _describe_or_load(self, name: str) -> Any:
+        """Returns metadata 'name' or, if it is unknown, the loaded attribute."""
+        if not self.loaded and name in self.metadata:
+            return self.metadata[name]
+        return getattr(self.load(), name)
+    
+    """ Dunder Methods """
+    
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__') or name in ('_item', '_metadata', '_lock'):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+    
+    def __getitem__(self, key: Any) -> Any:
+        return self.load()[key]
+    
+    def __len__(self) -> int:
+        return self.rows
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.load())
+    
+    def __contains__(self, item: Any) -> bool:
+        return item in self.load()
+    
+    def __array__(self, *args: Any, **kwargs: Any) -> Any:
+        import numpy
+        return numpy.asarray(self.load(), *args, **kwargs)
+    
+    def __repr__(self) -> str:
+        if self.loaded:
+            return repr(self._item)
+        return f'{self.__class__.__name__}({str(self.path)!r}, not loaded)'
+
+
+""" Private Constants """
+
+_UNLOADED = object()
+_RESOLUTIONS: dict[tuple[str, Optional[str]], tuple[Callable, Optional[str]]] = {}
+_TECHNIQUES: tuple[Callable[[str, Optional[str]], Any], ...] = (
+    absolute_import,
+    absolute_subpackage_import,
+    relative_import,
+    relative_subpackage_import)
+
+
+""" Private Functions """
+
+def _check_missing(
+    error: Exception, 
+    path: str, 
+    package: Optional[str] = None) -> None:
+    """Re-raises 'error' unless it means that 'path' itself was not found.
+    
+    Errors raised because a module that 'path' imports is missing (e.g., an
+    uninstalled dependency) are re-raised so that they are not hidden behind 
+    attempts with other techniques.
+
+    Args:
+        error (Exception): error raised by an import technique.
+        path (str): import path that the technique tried.
+        package (Optional[str]): package that the technique imported from.
+            Defaults to None.
+
+    Raises:
+        Exception: 'error' if it was not caused by 'path' being missing.
+        
+    """
+    missing = getattr(error, 'name', None)
+    if missing:
+        tried = set(path.split('.')) | set((package or '').split('.'))
+        if not set(missing.split('.')) <= tried:
+            raise error
+    return
+
+def _get_standard_library() -> set[str]:
+    """Returns the names of top-level standard library modules.
+    
+    'sys.stdlib_module_names' was added in Python 3.10. On older versions, the
+    imported modules whose files are in the standard library folder (and not
+    in its 'site-packages' folder) are returned.
+
+    Returns:
+        set[str]: names of top-level standard library modules.
+        
+    """
+    names = getattr(sys, 'stdlib_module_names', None)
+    if names is not None:
+        return set(names)
+    import sysconfig
+    paths = sysconfig.get_paths()
+    library = pathlib.Path(paths['stdlib']).resolve()
+    installed = {
+        pathlib.Path(paths[k]).resolve() for k in ('purelib', 'platlib')}
+    names = set()
+    for name, module in list(sys.modules.items()):
+        location = getattr(module, '__file__', None)
+        if '.' in name or not location:
+            continue
+        location = pathlib.Path(location).resolve()
+        if (
+            library in location.parents 
+            and not any(p in location.parents for p in installed)):
+            names.add(name)
+    return names
+
+def _import_submodule(package: str, name: str) -> types.ModuleType:
+    """Imports the submodule 'name' of 'package'.
+
+    Args:
+        package (str): name of the package.
+        name (str): name of the submodule.
+
+    Raises:
+        AttributeError: if 'package' has no submodule 'name'.
+
+    Returns:
+        types.ModuleType: imported submodule.
+        
+    """
+    path = f'{package}.{name}'
+    message = f'module {package!r} has no attribute {name!r}'
+    if name.startswith('__'):
+        raise AttributeError(message)
+    try:
+        return importlib.import_module(path)
+    except ModuleNotFoundError as error:
+        if error.name != path:
+            raise
+        raise AttributeError(message) from None
+
+def _install_delayed(cls: type) -> tuple[str, ...]:
+    """Replaces the delayed fields of 'cls' with '_DelayedAttribute' instances.
+
+    Args:
+        cls (type): Delayed subclass.
+
+    Returns:
+        tuple[str, ...]: names of the delayed fields.
+        
+    """
+    names = tuple(
+        f.name for f in dataclasses.fields(cls) if f.metadata.get('delayed'))
+    module = sys.modules.get(cls.__module__)
+    package = getattr(module, '__package__', None)
+    for name in names:
+        setattr(cls, name, _DelayedAttribute(name = name, package = package))
+    cls._delayed_names = names
+    return names
+
+def _requires_package(technique: Callable, path: str) -> bool:
+    """Returns whether 'technique' needs a package to import 'path'.
+
+    Args:
+        technique (Callable): import technique in '_TECHNIQUES'.
+        path (str): import path passed to 'technique'.
+
+    Returns:
+        bool: whether 'technique' needs a package to import 'path'.
+        
+    """
+    return (
+        technique in (absolute_subpackage_import, relative_import)
+        or (technique is absolute_import and path.startswith('.')))
+
+
+""" Private Classes """
+
+@dataclasses.dataclass(frozen = True)
+class _DelayedAttribute(object):
+    """Non-data descriptor which imports a delayed field on first access.
+    
+    It is only reached while the field is missing from the instance's 
+    attributes. After the item is imported, it is stored as an instance 
+    attribute, which shadows the descriptor. First accesses of the field are
+    serialized with 'lock', and the import path is only discarded once the 
+    import succeeds, so a failed import raises the same error when it is 
+    accessed again.
+    
+    Args:
+        name (str): name of the field.
+        package (Optional[str]): package that relative import paths are 
+            imported from.
+        lock (threading.RLock): lock held while the field is imported. It is
+            reentrant so that an import which accesses the same field of 
+            another instance does not deadlock.
+        
+    """
+    name: str
+    package: Optional[str] = None
+    lock: threading.RLock = dataclasses.field(
+        default_factory = threading.RLock, 
+        compare = False, 
+        repr = False)
+    
+    """ Dunder Methods """
+    
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        with self.lock:
+            # Another thread may have imported the item after this lookup
+            # reached the descriptor.
+            try:
+                return instance.__dict__[self.name]
+            except KeyError:
+                pass
+            try:
+                path = instance._delayed_paths[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+            item = from_import_path(path = path, package = self.package)
+            object.__setattr__(instance, self.name, item)
+            del instance._delayed_paths[self.name]
+        return item
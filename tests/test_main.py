@@ -1,7 +1,14 @@
 """Main file for unit tests."""
 
 from __future__ import annotations
+import asyncio
+import concurrent.futures
+import os
 import pathlib
+import subprocess
+import sys
+
+import pytest
 
 import nagata
 
@@ -31,6 +38,659 @@ def test_all() -> None:
     manager.save(test_csv, file_name = 'test_csv_out.csv')
     return
 
+def test_extensions() -> None:
+    manager = nagata.FileManager(
+        root_folder = pathlib.Path('.').joinpath('tests'),
+        input_folder = 'dummy_folder',
+        output_folder = 'dummy_output_folder')
+    assert manager.extensions is nagata.FileFramework.extensions
+    assert manager._match_extension('poem.txt') == ('txt', 'text')
+    assert manager._match_extension('poem.v2.txt') == ('txt', 'text')
+    assert manager._match_extension('poem.unknown') == ('unknown', None)
+    assert manager._match_extension('poem') == (None, None)
+    return
+
+def test_many() -> None:
+    manager = nagata.FileManager(
+        root_folder = pathlib.Path('.').joinpath('tests'),
+        input_folder = 'dummy_folder',
+        output_folder = 'dummy_output_folder')
+    poems = manager.load_many(
+        ['poem.txt', 'poem.txt', 'csv_test_file.csv'], 
+        folder = 'input')
+    assert poems[0] == poems[1]
+    assert len(poems[2]) > 0
+    manager.save_many(
+        [(poems[0], 'poem_out.txt'), (poems[2], 'test_csv_out.csv')],
+        folder = 'output')
+    completed = dict(manager.load_many(
+        ['poem_out.txt', 'test_csv_out.csv'], 
+        folder = 'output', 
+        as_completed = True))
+    assert len(completed) == 2
+    return
+
+def test_async() -> None:
+    manager = nagata.AsyncFileManager(
+        root_folder = pathlib.Path('.').joinpath('tests'),
+        input_folder = 'dummy_folder',
+        output_folder = 'dummy_output_folder',
+        max_open_files = 2)
+    
+    async def transfer() -> None:
+        async with manager:
+            poem = await manager.load(file_name = 'poem.txt')
+            loaded = await manager.load_many(
+                ['poem.txt', 'csv_test_file.csv'], 
+                folder = 'input')
+            assert loaded[0] == poem
+            await manager.save(loaded[1], file_name = 'test_csv_out.csv')
+        return
+    
+    asyncio.run(transfer())
+    return
+
+def test_async_inherited(tmp_path: pathlib.Path) -> None:
+    cache = nagata.LoadCache()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers = 1)
+    manager = nagata.AsyncFileManager(
+        root_folder = tmp_path, 
+        cache = cache,
+        executor = executor,
+        write_behind = True)
+    saver = manager.plan(file_name = 'queued.txt', transfer_type = 'save')
+    
+    async def transfer() -> None:
+        async with manager:
+            saver.save('queued')
+            assert await manager.load(file_name = 'queued.txt') == 'queued'
+            assert await manager.load(file_name = 'queued.txt') == 'queued'
+            assert manager.plan(file_name = 'queued.txt').load() == 'queued'
+            loaded = await manager.load_glob('*.txt')
+            assert loaded == {tmp_path.joinpath('queued.txt'): 'queued'}
+        return
+    
+    asyncio.run(transfer())
+    assert cache.stats['misses'] == 1 and cache.stats['hits'] >= 2
+    assert executor.submit(str, 1).result() == '1'
+    executor.shutdown()
+    return
+
+def test_stream() -> None:
+    manager = nagata.FileManager(
+        root_folder = pathlib.Path('.').joinpath('tests'),
+        input_folder = 'dummy_folder',
+        output_folder = 'dummy_output_folder')
+    whole = manager.load(file_name = 'csv_test_file.csv', nrows = None)
+    chunks = list(
+        manager.stream(file_name = 'csv_test_file.csv', chunk_size = 1))
+    assert len(chunks) == len(whole)
+    assert sum(len(chunk) for chunk in chunks) == len(whole)
+    return
+
+def test_conserve_memory() -> None:
+    manager = nagata.FileManager(
+        root_folder = pathlib.Path('.').joinpath('tests'),
+        input_folder = 'dummy_folder',
+        output_folder = 'dummy_output_folder')
+    test_csv = manager.load(
+        file_name = 'csv_test_file.csv', 
+        conserve_memory = True)
+    assert 'memory_saved' in test_csv.attrs
+    return
+
+def test_shrink(tmp_path: pathlib.Path) -> None:
+    pandas = pytest.importorskip('pandas')
+    manager = nagata.FileManager(root_folder = tmp_path)
+    data = pandas.DataFrame({
+        'small': list(range(100)),
+        'large': [i * 100000 for i in range(100)],
+        'repeated': ['a', 'b', 'c', 'd'] * 25,
+        'unique': [f'value{i}' for i in range(100)],
+        'ratio': [i / 2 for i in range(100)]})
+    data.to_csv(tmp_path.joinpath('data.csv'), index = False)
+    shrunk = manager.load(
+        file_name = 'data.csv', 
+        nrows = None,
+        conserve_memory = True)
+    assert str(shrunk['small'].dtype) == 'int8'
+    assert str(shrunk['large'].dtype) == 'int32'
+    assert str(shrunk['repeated'].dtype) == 'category'
+    assert str(shrunk['unique'].dtype) != 'category'
+    assert str(shrunk['ratio'].dtype) == 'float32'
+    assert shrunk.attrs['memory_saved'] > 0
+    pandas.testing.assert_frame_equal(
+        shrunk.astype(data.dtypes.to_dict()), 
+        data, 
+        check_dtype = False)
+    return
+
+def test_numpy(tmp_path: pathlib.Path) -> None:
+    numpy = pytest.importorskip('numpy')
+    manager = nagata.FileManager(root_folder = tmp_path)
+    manager.save(numpy.arange(10), file_name = 'array', file_format = 'numpy')
+    loaded = manager.load(file_name = 'array.npy', memory_map = True)
+    assert isinstance(loaded, numpy.memmap)
+    assert loaded.sum() == 45
+    arrays = {'a': numpy.arange(3), 'b': numpy.ones(2)}
+    for name, item in (
+        ('arrays.npy', arrays), 
+        ('arrays.npz', arrays), 
+        ('single.npz', numpy.arange(4))):
+        manager.save(item, file_name = name)
+        assert tmp_path.joinpath(name).is_file()
+        loaded = manager.load(file_name = name)
+        if isinstance(item, dict):
+            assert all((loaded[k] == v).all() for k, v in item.items())
+        else:
+            assert (loaded == item).all()
+    assert not list(tmp_path.glob('*.np?.np?'))
+    return
+
+def test_cache(tmp_path: pathlib.Path) -> None:
+    cache = nagata.LoadCache(max_entries = 1)
+    manager = nagata.FileManager(root_folder = tmp_path, cache = cache)
+    manager.save('first', file_name = 'first.txt')
+    manager.save('second', file_name = 'second.txt')
+    assert manager.load(file_name = 'first.txt') == 'first'
+    assert manager.load(file_name = 'first.txt') == 'first'
+    assert manager.load(file_name = 'second.txt') == 'second'
+    manager.save('changed', file_name = 'second.txt')
+    assert manager.load(file_name = 'second.txt') == 'changed'
+    assert cache.stats['hits'] == 1
+    assert cache.stats['misses'] == 3
+    assert cache.stats['evictions'] == 1
+    numpy = pytest.importorskip('numpy')
+    cache = nagata.LoadCache(max_bytes = 20000)
+    cache.store(key = ('sheets',), item = {
+        'first': numpy.zeros(1000), 
+        'second': numpy.zeros(1000)})
+    assert cache.size >= 16000
+    cache.store(key = ('arrays',), item = [numpy.zeros(1000)] * 2)
+    assert cache.stats['evictions'] == 1 and cache.size >= 16000
+    return
+
+def test_sidecar(tmp_path: pathlib.Path) -> None:
+    pytest.importorskip('pyarrow')
+    manager = nagata.FileManager(
+        root_folder = tmp_path, 
+        interim_folder = 'interim',
+        sidecar = nagata.SidecarCache())
+    source = pathlib.Path('tests').joinpath('dummy_folder', 'csv_test_file.csv')
+    first = manager.load(file_path = source)
+    assert len(list(manager.interim_folder.glob('*.feather'))) == 1
+    second = manager.load(file_path = source)
+    assert first.equals(second)
+    columns = list(first.columns[:1])
+    narrow = manager.load(file_path = source, usecols = columns)
+    assert len(list(manager.interim_folder.glob('*.feather'))) == 2
+    assert manager.load(file_path = source).equals(first)
+    assert len(list(manager.interim_folder.glob('*.feather'))) == 2
+    assert list(narrow.columns) == columns
+    cache = manager.sidecar
+    key = cache.key(path = source, parameters = {})
+    item = first.head()
+    with concurrent.futures.ThreadPoolExecutor(max_workers = 4) as pool:
+        list(pool.map(lambda _: cache.store(key = key, item = item), range(8)))
+    assert cache.fetch(key = key)[1].equals(item)
+    count = len(list(manager.interim_folder.glob('*.feather')))
+    mixed = tmp_path.joinpath('mixed.csv')
+    mixed.write_text('a\n1\nx\n')
+    loaded = manager.load(
+        file_path = mixed, 
+        converters = {'a': lambda v: int(v) if v.isdigit() else v})
+    assert list(loaded['a']) == [1, 'x']
+    assert len(list(manager.interim_folder.glob('*.feather'))) == count
+    changed = tmp_path.joinpath('changed.csv')
+    changed.write_text('a\n1\n')
+    manager.load(file_path = changed)
+    manager.load(file_path = changed, usecols = ['a'])
+    assert len(list(manager.interim_folder.glob('*.feather'))) == count + 2
+    changed.write_text('a\n1\n2\n')
+    assert list(manager.load(file_path = changed)['a']) == [1, 2]
+    assert len(list(manager.interim_folder.glob('*.feather'))) == count + 1
+    assert not list(manager.interim_folder.glob('*.tmp'))
+    return
+
+def test_pickle(tmp_path: pathlib.Path) -> None:
+    numpy = pytest.importorskip('numpy')
+    manager = nagata.FileManager(root_folder = tmp_path)
+    item = {'array': numpy.arange(1000), 'label': 'test'}
+    manager.save(item, file_name = 'plain.pkl')
+    assert manager.load(file_name = 'plain.pkl')['label'] == 'test'
+    manager.save(item, file_name = 'oob.pkl', out_of_band = True)
+    loaded = manager.load(file_name = 'oob.pkl', memory_map = True)
+    assert (loaded['array'] == item['array']).all()
+    return
+
+def test_compression(tmp_path: pathlib.Path) -> None:
+    pytest.importorskip('pandas')
+    manager = nagata.FileManager(root_folder = tmp_path)
+    source = pathlib.Path('tests').joinpath('dummy_folder', 'csv_test_file.csv')
+    item = manager.load(file_path = source)
+    manager.save(item, file_name = 'data.csv.gz')
+    with open(manager.output_folder.joinpath('data.csv.gz'), 'rb') as a_file:
+        assert a_file.read(2) == b'\x1f\x8b'
+    assert manager.load(file_name = 'data.csv.gz').equals(item)
+    manager.save('text', file_name = 'data.txt.xz')
+    assert manager.load(file_name = 'data.txt.xz') == 'text'
+    assert not list(manager.interim_folder.glob('*-data.*'))
+    return
+
+def test_write_behind(tmp_path: pathlib.Path) -> None:
+    with nagata.FileManager(
+        root_folder = tmp_path, 
+        write_behind = True) as manager:
+        future = manager.save('queued', file_name = 'queued.txt')
+        assert manager.load(file_name = 'queued.txt') == 'queued'
+        future.result()
+        for index in range(5):
+            manager.save(str(index), file_name = f'{index}.txt')
+    assert manager.load(file_name = '4.txt') == '4'
+    assert not list(tmp_path.glob('.*'))
+    with pytest.raises(RuntimeError):
+        manager.save('late', file_name = 'late.txt')
+    manager = nagata.FileManager(root_folder = tmp_path, write_behind = True)
+    manager.save(lambda: None, file_name = 'bad.pickle')
+    with pytest.raises(Exception):
+        manager.flush()
+    assert not tmp_path.joinpath('bad.pickle').exists()
+    assert not list(tmp_path.glob('.*'))
+    manager.close()
+    return
+
+def test_write_behind_threads(
+    tmp_path: pathlib.Path, 
+    monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+    import time
+    from nagata import lazy
+    writers = []
+    
+    class SlowExecutor(concurrent.futures.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs) -> None:
+            time.sleep(0.05)
+            super().__init__(*args, **kwargs)
+            writers.append(self)
+    
+    monkeypatch.setattr(lazy, 'from_import_path', lambda path: SlowExecutor)
+    manager = nagata.FileManager(root_folder = tmp_path, write_behind = True)
+    barrier = threading.Barrier(4)
+    
+    def save(index: int) -> None:
+        barrier.wait()
+        manager.save(str(index), file_name = f'{index}.txt')
+        return
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers = 4) as pool:
+        list(pool.map(save, range(4)))
+    manager.close()
+    assert len(writers) == 1
+    assert all(tmp_path.joinpath(f'{i}.txt').exists() for i in range(4))
+    return
+
+def test_excel(tmp_path: pathlib.Path) -> None:
+    pandas = pytest.importorskip('pandas')
+    pytest.importorskip('openpyxl')
+    manager = nagata.FileManager(root_folder = tmp_path)
+    path = tmp_path.joinpath('book.xlsx')
+    with pandas.ExcelWriter(path) as writer:
+        for name in ('first', 'second', 'third'):
+            frame = pandas.DataFrame({'sheet': [name] * 3, 'value': [1, 2, 3]})
+            frame.to_excel(writer, sheet_name = name, index = False)
+    sheets = manager.load(file_path = path, sheet_name = None)
+    assert list(sheets) == ['first', 'second', 'third']
+    assert sheets['second']['sheet'].tolist() == ['second'] * 3
+    selected = manager.load(file_path = path, sheet_name = ['third'])
+    assert list(selected) == ['third']
+    assert manager.load(file_path = path)['value'].tolist() == [1, 2, 3]
+    books = manager.load_many(tmp_path, file_format = 'excel')
+    assert len(books) == 1
+    return
+
+def test_pushdown(tmp_path: pathlib.Path) -> None:
+    pandas = pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    manager = nagata.FileManager(root_folder = tmp_path)
+    frame = pandas.DataFrame({
+        'day': range(100), 
+        'region': ['east', 'west'] * 50,
+        'value': [0.5] * 100})
+    manager.save(frame, file_name = 'data.parquet', row_group_size = 10)
+    manager.save(frame, file_name = 'data.feather')
+    for name in ('data.parquet', 'data.feather'):
+        loaded = manager.load(
+            file_name = name,
+            columns = ['day', 'region'],
+            filters = [('day', '>=', 90), ('region', '==', 'east')])
+        assert list(loaded.columns) == ['day', 'region']
+        assert loaded['day'].tolist() == [90, 92, 94, 96, 98]
+    return
+
+def test_partitions(tmp_path: pathlib.Path) -> None:
+    pandas = pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    manager = nagata.FileManager(root_folder = tmp_path)
+    frame = pandas.DataFrame({
+        'region': ['east', 'west', 'east', 'north'], 
+        'value': [1, 2, 3, 4]})
+    manager.save(
+        frame, 
+        file_name = 'sales', 
+        file_format = 'parquet', 
+        partition_cols = ['region'])
+    dataset = tmp_path.joinpath('sales.parquet')
+    assert dataset.joinpath('region=east').is_dir()
+    update = pandas.DataFrame({'region': ['west'], 'value': [20]})
+    manager.save(update, file_path = dataset, partition_cols = ['region'])
+    loaded = manager.load(
+        file_path = dataset, 
+        filters = [('region', 'in', ['east', 'west'])])
+    assert sorted(loaded['value'].tolist()) == [1, 3, 20]
+    return
+
+def test_hooks(tmp_path: pathlib.Path) -> None:
+    stats = nagata.StatsCollector()
+    phases = []
+    hooks = nagata.Hooks()
+    hooks.subscribe(stats)
+    hooks.subscribe(lambda event: phases.append(event.phase), before = True)
+    manager = nagata.FileManager(root_folder = tmp_path, hooks = hooks)
+    manager.save('observed', file_name = 'observed.txt')
+    assert manager.load(file_name = 'observed.txt') == 'observed'
+    assert phases == ['prepare', 'parameters', 'transfer'] * 2
+    summary = stats.summary()
+    assert summary[('text', 'load', 'transfer')]['count'] == 1
+    assert summary[('text', 'save', 'transfer')]['bytes'] == 8
+    return
+
+def test_hooks_read_parse(tmp_path: pathlib.Path) -> None:
+    pandas = pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    events = []
+    hooks = nagata.Hooks()
+    hooks.subscribe(lambda event: events.append((event.phase, event.size)))
+    manager = nagata.FileManager(root_folder = tmp_path, hooks = hooks)
+    item = pandas.DataFrame({'value': range(100)})
+    manager.save(item, file_name = 'data.feather.gz')
+    events.clear()
+    assert manager.load(file_name = 'data.feather.gz').equals(item)
+    phases = [phase for phase, _ in events]
+    assert phases == ['prepare', 'parameters', 'read', 'parse', 'transfer']
+    assert events[2][1] > 0
+    manager = nagata.AsyncFileManager(root_folder = tmp_path, hooks = hooks)
+    
+    async def transfer() -> None:
+        async with manager:
+            await manager.save([1, 2], file_name = 'data.pickle')
+            events.clear()
+            assert await manager.load(file_name = 'data.pickle') == [1, 2]
+        return
+    
+    asyncio.run(transfer())
+    phases = [phase for phase, _ in events]
+    assert phases == ['prepare', 'parameters', 'read', 'parse', 'transfer']
+    return
+
+def test_glob(tmp_path: pathlib.Path) -> None:
+    manager = nagata.FileManager(
+        root_folder = tmp_path, 
+        input_folder = 'input',
+        output_folder = 'input')
+    for folder in ('2026-01', '2026-02', '2025-12'):
+        manager.input_folder.joinpath(folder, 'nested').mkdir(parents = True)
+        manager.save(folder, file_name = f'{folder}/day.txt')
+        manager.save(folder, file_name = f'{folder}/nested/day.txt')
+    manager.input_folder.joinpath('notes.unknown').write_text('skip')
+    paths = manager.glob('2026-*/*.txt')
+    assert [p.parent.name for p in paths] == ['2026-01', '2026-02']
+    assert len(manager.glob('2026-*/**/*.txt')) == 4
+    scans = manager.index.stats['scans']
+    manager.glob('**')
+    assert manager.index.stats['scans'] == scans
+    manager.save('new', file_name = '2026-02/other.txt')
+    loaded = manager.load_glob('2026-02/*')
+    assert sorted(loaded.values()) == ['2026-02', 'new']
+    assert manager.index.stats['scans'] == scans + 1
+    return
+
+def test_plan(tmp_path: pathlib.Path) -> None:
+    manager = nagata.FileManager(root_folder = tmp_path)
+    saver = manager.plan(
+        file_name = 'record', 
+        file_format = 'text', 
+        transfer_type = 'save')
+    assert saver.file_path == tmp_path.joinpath('record.txt')
+    for index in range(3):
+        saver.save(str(index))
+    loader = manager.plan(file_path = saver.file_path)
+    assert loader.load() == '2'
+    with pytest.raises(ValueError):
+        loader.save('wrong')
+    first = manager._prepare_transfer(None, None, 'record.txt', 'load')
+    assert manager._prepare_transfer(None, None, 'record.txt', 'load') is first
+    return
+
+def test_lazy(tmp_path: pathlib.Path) -> None:
+    pandas = pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    manager = nagata.FileManager(root_folder = tmp_path)
+    data = pandas.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    manager.save(data, file_name = 'data.parquet')
+    delayed = manager.load(file_name = 'data.parquet', lazy = True)
+    assert list(delayed.columns) == ['a', 'b']
+    assert delayed.rows == 3 and len(delayed) == 3
+    assert delayed.size > 0
+    assert not delayed.loaded
+    assert delayed['a'].sum() == 6
+    assert delayed.loaded
+    pandas.testing.assert_frame_equal(delayed.load(), data)
+    shrunk = manager.load(
+        file_name = 'data.parquet', 
+        lazy = True, 
+        conserve_memory = True)
+    assert 'dtypes' not in shrunk.metadata
+    assert str(shrunk.dtypes['a']) == 'int8' and shrunk.loaded
+    table = manager.load(
+        file_name = 'data.parquet', 
+        lazy = True, 
+        as_table = True)
+    assert table.rows == 3 and table.column_names == ['a', 'b']
+    manager.save('a;b;c\n1;2;3\n', file_name = 'semicolon.txt')
+    path = manager.output_folder.joinpath('semicolon.txt')
+    delayed = manager.load(
+        file_path = path, 
+        file_format = 'csv', 
+        lazy = True, 
+        sep = ';', 
+        usecols = ['a', 'c'])
+    assert list(delayed.columns) == ['a', 'c'] and not delayed.loaded
+    named = manager.load(
+        file_path = path, 
+        file_format = 'csv', 
+        lazy = True, 
+        sep = ';', 
+        header = None, 
+        names = ['x', 'y', 'z'])
+    assert list(named.columns) == ['x', 'y', 'z'] and not named.loaded
+    return
+
+def test_import_errors(
+    tmp_path: pathlib.Path, 
+    monkeypatch: pytest.MonkeyPatch) -> None:
+    tmp_path.joinpath('broken_types.py').write_text(
+        'value = 1\nraise TypeError("broken at import")\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for path in ('broken_types', 'broken_types.value'):
+        with pytest.raises(TypeError, match = 'broken at import'):
+            nagata.from_import_path(path = path)
+    with pytest.raises(ModuleNotFoundError):
+        nagata.from_import_path(path = 'nagata_missing.value')
+    assert nagata.from_import_path(path = '.lazy', package = 'nagata')
+    return
+
+def test_importer() -> None:
+    importer = nagata.Importer(
+        package = 'nagata',
+        importables = {
+            'index': '.caching.FileIndex', 
+            'hooks': 'nagata.instrumentation.Hooks',
+            'missing': 'nagata.missing.Item'},
+        profile = True)
+    assert importer.load('index') is nagata.FileIndex
+    assert importer.load('hooks') is nagata.Hooks
+    assert set(importer.timings) == {'index', 'hooks'}
+    with pytest.raises(ModuleNotFoundError):
+        importer.load('missing')
+    assert nagata.relative_import('caching', 'nagata') is nagata.caching
+    return
+
+def test_install() -> None:
+    namespace = {'__name__': 'nagata'}
+    importer = nagata.install(
+        module_globals = namespace,
+        importables = {'FileIndex': '.caching.FileIndex'})
+    assert 'FileIndex' not in namespace
+    assert 'FileIndex' in namespace['__dir__']()
+    assert namespace['__getattr__']('FileIndex') is nagata.FileIndex
+    assert namespace['FileIndex'] is nagata.FileIndex
+    with pytest.raises(AttributeError):
+        namespace['__getattr__']('Missing')
+    assert namespace['__getattr__']('caching') is nagata.caching
+    importer.warm().join()
+    source = pathlib.Path(nagata.__file__).parents[1]
+    result = subprocess.run(
+        [sys.executable, '-c', 'import nagata; print(nagata.core.FileManager)'],
+        env = {**os.environ, 'PYTHONPATH': str(source)},
+        capture_output = True,
+        text = True)
+    assert result.returncode == 0, result.stderr
+    assert 'FileManager' in result.stdout
+    return
+
+def test_delayed() -> None:
+    import dataclasses
+    import gzip
+
+    @dataclasses.dataclass
+    class Opener(nagata.Delayed):
+        opener: str = nagata.delayed('gzip.open')
+        name: str = 'gzip.open'
+
+    opener = Opener()
+    assert 'opener' not in vars(opener)
+    assert opener.opener is gzip.open
+    assert vars(opener)['opener'] is gzip.open
+    assert opener.name == 'gzip.open'
+    assert Opener(opener = 'json.dumps').opener.__name__ == 'dumps'
+    return
+
+def test_delayed_threads(
+    tmp_path: pathlib.Path, 
+    monkeypatch: pytest.MonkeyPatch) -> None:
+    import dataclasses
+    tmp_path.joinpath('slow_delayed.py').write_text(
+        'import time\ntime.sleep(0.2)\nvalue = 1\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    @dataclasses.dataclass
+    class Slow(nagata.Delayed):
+        value: str = nagata.delayed('slow_delayed.value')
+        missing: str = nagata.delayed('not_a_delayed_module.value')
+    
+    slow = Slow()
+    with concurrent.futures.ThreadPoolExecutor(max_workers = 4) as pool:
+        values = list(pool.map(lambda _: slow.value, range(4)))
+    assert values == [1] * 4
+    for _ in range(2):
+        with pytest.raises(ModuleNotFoundError):
+            slow.missing
+    return
+
+def test_snapshot(
+    tmp_path: pathlib.Path, 
+    monkeypatch: pytest.MonkeyPatch) -> None:
+    manifest = tmp_path.joinpath('modules.json')
+    modules = nagata.snapshot(path = manifest, packages = ['nagata'])
+    assert 'nagata.lazy' in modules
+    assert all(m.partition('.')[0] == 'nagata' for m in modules)
+    assert nagata.preload(manifest) == modules
+    assert nagata.preload(['json', 'nagata_missing']) == ['json']
+    monkeypatch.delattr(sys, 'stdlib_module_names', raising = False)
+    modules = nagata.snapshot()
+    assert 'nagata.lazy' in modules and 'pytest' in modules
+    assert 'json' not in modules and 'pathlib' not in modules
+    return
+
+def test_parallel_csv(tmp_path: pathlib.Path) -> None:
+    pandas = pytest.importorskip('pandas')
+    manager = nagata.FileManager(root_folder = tmp_path)
+    rows = 5000
+    data = pandas.DataFrame({
+        'number': [float(i) for i in range(rows)],
+        'text': ['plain'] * (rows - 1) + ['two\nlines']})
+    data.to_csv(tmp_path.joinpath('data.csv'), index = False)
+    file_format = nagata.FileFramework.get_format(name = 'csv')
+    ranges = file_format._split(
+        path = tmp_path.joinpath('data.csv'), 
+        threads = 2, 
+        split_size = 1 << 12)
+    assert len(ranges) == 2 and ranges[0][0] == 0
+    loaded = manager.load(
+        file_name = 'data.csv', 
+        nrows = None, 
+        threads = 2, 
+        split_size = 1 << 12)
+    pandas.testing.assert_frame_equal(loaded, data)
+    headerless = tmp_path.joinpath('headerless.csv')
+    data.to_csv(headerless, index = False, header = False)
+    for options in ({'names': ['a', 'b']}, {'header': None}):
+        loaded = manager.load(
+            file_path = headerless, 
+            nrows = None, 
+            threads = 2, 
+            split_size = 1 << 12,
+            **options)
+        expected = pandas.read_csv(headerless, **options)
+        pandas.testing.assert_frame_equal(loaded, expected)
+    # A quoted field with many newlines spans the boundary between ranges, so
+    # the second range starts inside quotes and the file is parsed serially.
+    quoted = tmp_path.joinpath('quoted.csv')
+    lines = ['number,text'] + [f'{i},plain' for i in range(500)]
+    lines.append('500,"' + 'line\n' * 2000 + '"')
+    lines.extend(f'{i},plain' for i in range(501, 1000))
+    quoted.write_text('\n'.join(lines) + '\n')
+    ranges = file_format._split(
+        path = quoted, 
+        threads = 2, 
+        split_size = 1 << 12)
+    assert len(ranges) == 2
+    from nagata import formats
+    assert formats._read_csv_ranges(path = quoted, ranges = ranges) is None
+    loaded = manager.load(
+        file_path = quoted, 
+        nrows = None, 
+        threads = 2, 
+        split_size = 1 << 12)
+    pandas.testing.assert_frame_equal(loaded, pandas.read_csv(quoted))
+    return
+
+def test_to_where() -> None:
+    numpy = pytest.importorskip('numpy')
+    pytest.importorskip('pandas')
+    from nagata import formats
+    where = formats._to_where([
+        ('a', '>', numpy.int64(5)),
+        ('b', 'in', (numpy.str_('x'), 'y')),
+        ('d', '>=', numpy.datetime64('2020-01-01'))])
+    assert where == (
+        "(a > 5 & b == ['x', 'y'] & d >= '2020-01-01T00:00:00')")
+    assert formats._to_where([[('a', '=', 1.5)], [('b', '!=', 'z')]]) == (
+        "(a == 1.5) | (b != 'z')")
+    with pytest.raises(ValueError):
+        formats._to_where([('a', 'like', 1)])
+    return
+
 if __name__ == '__main__':
     test_all()
 